@@ -22,6 +22,44 @@ class Significance(str, Enum):
     ADIABAT = "adiabat"
 
 
+class Integrator(str, Enum):
+    RK4 = "rk4"
+    """classic 4th order Runge-Kutta, at fixed step size, see `minimalist_interior_ballistics.num.rk4`."""
+    RK4_SINGLE_PASS = "rk4 single pass"
+    """
+    as `RK4`, but a run that is too short is kept and refined by subdividing its steps, instead
+    of being discarded, see `minimalist_interior_ballistics.gun.Gun.flat_integrate`. The points are then
+    only as accurate as the steps of that run.
+    """
+    DOPRI5 = "dopri5"
+    """
+    Dormand-Prince 5(4) embedded pair, at adaptive step size, see `minimalist_interior_ballistics.num.dopri5`.
+    """
+    BURNUP = "burnup"
+    """
+    classic 4th order Runge-Kutta, in the burn-up fraction of the charge instead of time, for guns loaded
+    with a single charge of unit pressure exponent, see
+    `minimalist_interior_ballistics.gun.Gun.flat_to_burnout_in_burnup`. Other guns, and runs that do not
+    meet `acc`, fall back to `RK4`.
+    """
+
+
+class PeakFinder(str, Enum):
+    ANALYTIC = "analytic"
+    """
+    root of the rate of change of average pressure, which is evaluated in closed form, see
+    `minimalist_interior_ballistics.gun.Gun.compile_pressure_rate`, using
+    `minimalist_interior_ballistics.num.dekker`.
+    """
+    GOLDEN_SECTION = "golden section"
+    """maximum of the average pressure, see `minimalist_interior_ballistics.num.gss_max`."""
+    BRENT = "brent"
+    """
+    maximum of the average pressure, by parabolic interpolation, see
+    `minimalist_interior_ballistics.num.brent_max`.
+    """
+
+
 MAX_DT: float = 1e-3
 """
 in Seconds. This is both initial and the maximum time step the program will attempt to use
@@ -38,9 +76,38 @@ rate. This prevents edge cases from taking excessive time to return.
 """
 
 REDUCED_BURN_RATE_INITIAL_GUESS = 1.0
+"""
+in 1/(s Pa^n). Starting point of the solve for reduced burn rate at pressure, used where
+`minimalist_interior_ballistics.problem.BaseProblem.estimate_reduced_burnrate` cannot supply one.
+"""
+
+REDUCED_BURN_RATE_PRESSURE_SLOPE: float = 1.5
+"""
+assumed slope of log peak pressure against log reduced burn rate, used to place the second probe
+when bracketing the reduced burn rate at pressure. Typical values near the solution are 1-2.
+"""
 
 DEFAULT_ACC: float = 1e-3
 DEFAULT_STEPS: int = 10
 """
 Sets the default value for `acc` and `n_intg`, where numerical techniques are used.
 """
+
+MAX_BURNUP_REFINEMENTS: int = 3
+"""
+Sets the number of times the steps of `minimalist_interior_ballistics.Integrator.BURNUP` are halved
+to meet `acc`, before falling back to `minimalist_interior_ballistics.Integrator.RK4`, see
+`minimalist_interior_ballistics.gun.Gun.flat_to_burnout_in_burnup`.
+"""
+
+START_CACHE_SIZE: int = 1024
+"""
+Sets the number of distinct guns for which the pre-start phase is memoized, see
+`minimalist_interior_ballistics.gun.Gun.to_start`.
+"""
+
+PROBLEM_CACHE_SIZE: int = 256
+"""
+Sets the number of solved guns, and of their trajectories, memoized by each problem, see
+`minimalist_interior_ballistics.problem.BaseProblem.gun_cache`.
+"""
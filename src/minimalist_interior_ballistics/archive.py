@@ -0,0 +1,397 @@
+"""
+Archival of `minimalist_interior_ballistics.state.StateList` to columnar CSV, NumPy `.npz` and
+JSON files, and loading them back, without rerunning the gun.
+
+Every file holds any number of trajectories, each of which is written column by column from
+the storage of `minimalist_interior_ballistics.state.StateList`, so that no
+`minimalist_interior_ballistics.state.State` is built on either end. The units are converted on
+whole arrays for the `.npz` format only, and value by value for CSV and JSON, which are written
+without NumPy. The guns are stored alongside, in the form of
+`minimalist_interior_ballistics.gun.Gun.to_json`, once for every distinct gun, and the rows refer
+to them by index. The pressures are written for the convenience of other tools, but are not read
+back, as they follow from the state and the gun.
+
+NumPy is only needed for the `.npz` format, install it with the `batch` extra, i.e.
+`python -m pip install minimalist_interior_ballistics[batch]`.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from os import PathLike
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+from . import Significance
+from .gun import Gun
+from .state import StateList
+
+UNIT_SCALES: Dict[str, float] = {
+    "s": 1.0,
+    "ms": 1e-3,
+    "m": 1.0,
+    "dm": 1e-1,
+    "mm": 1e-3,
+    "m/s": 1.0,
+    "Pa": 1.0,
+    "kPa": 1e3,
+    "MPa": 1e6,
+}
+"""the value of every unit recognized, in SI units."""
+
+SI_UNITS: Dict[str, str] = {"time": "s", "travel": "m", "velocity": "m/s", "pressure": "Pa"}
+"""the default units of each quantity, which are also the units used throughout this package."""
+
+TABULATED_UNITS: Dict[str, str] = {"time": "ms", "travel": "m", "velocity": "m/s", "pressure": "MPa"}
+"""the units used in `minimalist_interior_ballistics.state.StateList.tabulate`."""
+
+QUANTITIES: Dict[str, str] = {
+    "time": "time",
+    "travel": "travel",
+    "velocity": "velocity",
+    "average_pressure": "pressure",
+    "shot_pressure": "pressure",
+    "breech_pressure": "pressure",
+}
+"""the dimensional columns written, and the quantity each is measured in."""
+
+Trajectories = Union[StateList, Iterable[StateList]]
+FileName = Union[str, PathLike]
+
+
+def _resolve_units(units: Optional[Dict[str, str]]) -> Dict[str, str]:
+    units = {**SI_UNITS, **(units or {})}
+    for quantity, unit in units.items():
+        if unit not in UNIT_SCALES:
+            raise ValueError(f"unit {unit} of {quantity} is not one of {', '.join(UNIT_SCALES)}.")
+    return units
+
+
+def _iter_trajectories(trajectories: Trajectories) -> Iterator[StateList]:
+    if isinstance(trajectories, StateList):
+        yield trajectories
+    else:
+        yield from trajectories
+
+
+def _dimensional_columns(states: StateList, units: Dict[str, str]) -> Dict[str, list[float]]:
+    columns = {
+        "time": states.times,
+        "travel": states.travels,
+        "velocity": states.velocities,
+        "average_pressure": states.average_pressures,
+        "shot_pressure": states.shot_pressures,
+        "breech_pressure": states.breech_pressures,
+    }
+    scaled = {}
+    for name, column in columns.items():
+        factor = 1 / UNIT_SCALES[units[QUANTITIES[name]]]
+        scaled[name] = list(column) if factor == 1 else [value * factor for value in column]
+    return scaled
+
+
+class _GunIndex:
+    """assigns consecutive indices to guns, in the order they are first encountered."""
+
+    def __init__(self):
+        self.guns: list[Gun] = []
+        self._indices: Dict[int, int] = {}
+
+    def __call__(self, gun: Gun) -> int:
+        try:
+            return self._indices[id(gun)]
+        except KeyError:
+            self._indices[id(gun)] = len(self.guns)
+            self.guns.append(gun)
+            return len(self.guns) - 1
+
+
+def _to_states(
+    guns: list[Gun],
+    gun_indices: Iterable[int],
+    markers: Iterable[str],
+    are_started: Iterable[bool],
+    columns: Dict[str, Iterable[float]],
+    burnup_fractions: Iterable[tuple[float, ...]],
+    units: Dict[str, str],
+) -> StateList:
+    si = {}
+    for name in ("time", "travel", "velocity"):
+        scale = UNIT_SCALES[units[QUANTITIES[name]]]
+        si[name] = list(columns[name]) if scale == 1 else [value * scale for value in columns[name]]
+    return StateList.from_columns(
+        guns=[guns[i] for i in gun_indices],
+        times=si["time"],
+        travels=si["travel"],
+        velocities=si["velocity"],
+        burnup_fractions=burnup_fractions,
+        markers=markers,
+        are_started=are_started,
+    )
+
+
+def write_csv(filename: FileName, trajectories: Trajectories, units: Optional[Dict[str, str]] = None):
+    """
+    Writes trajectories to a CSV file, one row per state.
+
+    Parameters
+    ----------
+    filename: str | PathLike
+        file to write to.
+    trajectories: StateList | Iterable[StateList]
+        a trajectory, or any number of them, which is written as it is iterated over.
+    units: dict[str, str]
+        units of `time`, `travel`, `velocity` and `pressure`, as any of `UNIT_SCALES`, where
+        these are to differ from `SI_UNITS`.
+
+    Raises
+    ------
+    ValueError
+        if the trajectories are of guns loaded with a different number of charges.
+
+    Notes
+    -----
+    The header names the columns `trajectory`, `gun`, `marker`, `is_started`, the columns of
+    `QUANTITIES`, with their unit in brackets, and `burnup_fraction_1` onwards, one for each
+    charge. Each gun is written on a comment line `# gun <index> <json>`, before the first row
+    that refers to it, such that the file can be written as the trajectories are generated.
+    """
+    units = _resolve_units(units)
+    gun_index = _GunIndex()
+    n_charges = None
+
+    with open(filename, mode="w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        for trajectory, states in enumerate(_iter_trajectories(trajectories)):
+            if not len(states):
+                continue
+
+            if n_charges is None:
+                n_charges = len(states.burnup_fractions[0])
+                writer.writerow(
+                    (
+                        "trajectory",
+                        "gun",
+                        "marker",
+                        "is_started",
+                        *(f"{name} [{units[quantity]}]" for name, quantity in QUANTITIES.items()),
+                        *(f"burnup_fraction_{i + 1}" for i in range(n_charges)),
+                    )
+                )
+
+            gun_indices = []
+            for gun in states.guns:
+                n_guns = len(gun_index.guns)
+                gun_indices.append(index := gun_index(gun))
+                if index == n_guns:
+                    if len(gun.charges) != n_charges:
+                        raise ValueError("guns with a different number of charges cannot be written to one CSV file.")
+                    f.write(f"# gun {index} {json.dumps(gun.to_json(), ensure_ascii=False)}\n")
+
+            columns = _dimensional_columns(states, units)
+            writer.writerows(
+                (trajectory, index, marker.value, int(is_started), *values, *burnup_fractions)
+                for index, marker, is_started, burnup_fractions, *values in zip(
+                    gun_indices, states.markers, states.are_started, states.burnup_fractions, *columns.values()
+                )
+            )
+
+
+def read_csv(filename: FileName) -> list[StateList]:
+    """reads back the trajectories written by `write_csv`, in order."""
+    guns: Dict[int, Gun] = {}
+
+    with open(filename, mode="r", newline="", encoding="utf-8") as f:
+
+        def lines() -> Iterator[str]:
+            # registers the guns as they are encountered, which precede the rows using them.
+            for line in f:
+                if line.startswith("# gun "):
+                    _, _, index, text = line.split(" ", 3)
+                    guns[int(index)] = Gun.from_json(json.loads(text))
+                else:
+                    yield line
+
+        reader = csv.reader(lines())
+        header = next(reader, None)
+        if header is None:
+            return []
+
+        # the labels are of the form "<name> [<unit>]".
+        index_of = {label.split(" [")[0]: i for i, label in enumerate(header)}
+        units = _resolve_units(
+            {QUANTITIES[name]: header[index_of[name]].split(" [")[1][:-1] for name in ("time", "travel", "velocity")}
+        )
+        i_time, i_travel, i_velocity = (index_of[name] for name in ("time", "travel", "velocity"))
+        i_burnup = index_of["burnup_fraction_1"]
+
+        rows_by_trajectory: Dict[int, list[list[str]]] = {}
+        for row in reader:
+            rows_by_trajectory.setdefault(int(row[0]), []).append(row)
+
+    trajectories = []
+    for rows in rows_by_trajectory.values():
+        trajectories.append(
+            _to_states(
+                list(guns[i] for i in sorted(guns)),
+                (int(row[1]) for row in rows),
+                (row[2] for row in rows),
+                (row[3] == "1" for row in rows),
+                {
+                    "time": [float(row[i_time]) for row in rows],
+                    "travel": [float(row[i_travel]) for row in rows],
+                    "velocity": [float(row[i_velocity]) for row in rows],
+                },
+                (tuple(float(Z) for Z in row[i_burnup:]) for row in rows),
+                units,
+            )
+        )
+    return trajectories
+
+
+def write_json(filename: FileName, trajectories: Trajectories, units: Optional[Dict[str, str]] = None):
+    """
+    Writes trajectories to a compact JSON file, see `write_csv` for the parameters.
+
+    Notes
+    -----
+    The file is an object of `units`, `trajectories` and `guns`. Each trajectory is an object of
+    columns, named as in `write_csv`, except that `burnup_fractions` is a list of one column per
+    charge, such that guns of any number of charges can be written to the same file. The guns
+    are written last, such that the file can be written as the trajectories are generated.
+    """
+    units = _resolve_units(units)
+    gun_index = _GunIndex()
+    separators = (",", ":")
+
+    with open(filename, mode="w", encoding="utf-8") as f:
+        f.write(f'{{"units":{json.dumps(units, separators=separators)},"trajectories":[')
+        for trajectory, states in enumerate(_iter_trajectories(trajectories)):
+            if trajectory:
+                f.write(",")
+            json.dump(
+                {
+                    "gun": [gun_index(gun) for gun in states.guns],
+                    "marker": [marker.value for marker in states.markers],
+                    "is_started": states.are_started,
+                    **_dimensional_columns(states, units),
+                    "burnup_fractions": [list(column) for column in zip(*states.burnup_fractions)],
+                },
+                f,
+                separators=separators,
+            )
+        f.write('],"guns":[')
+        f.write(
+            ",".join(json.dumps(gun.to_json(), ensure_ascii=False, separators=separators) for gun in gun_index.guns)
+        )
+        f.write("]}")
+
+
+def read_json(filename: FileName) -> list[StateList]:
+    """reads back the trajectories written by `write_json`, in order."""
+    with open(filename, mode="r", encoding="utf-8") as f:
+        archive = json.load(f)
+
+    units = _resolve_units(archive["units"])
+    guns = [Gun.from_json(json_dict) for json_dict in archive["guns"]]
+    return [
+        _to_states(
+            guns,
+            columns["gun"],
+            columns["marker"],
+            columns["is_started"],
+            columns,
+            zip(*columns["burnup_fractions"]),
+            units,
+        )
+        for columns in archive["trajectories"]
+    ]
+
+
+def write_npz(filename: FileName, trajectories: Trajectories, units: Optional[Dict[str, str]] = None):
+    """
+    Writes trajectories to a compressed NumPy `.npz` file, see `write_csv` for the parameters.
+    NumPy appends the `.npz` suffix to `filename` if it is missing.
+
+    Notes
+    -----
+    The trajectories are concatenated into one array per column, named as in `write_csv` except
+    for the units, with `burnup_fraction` a two-dimensional array of one column per charge. The
+    units are converted on the concatenated arrays. The guns are an array of JSON strings, and
+    the units a JSON string, such that the file is read without unpickling.
+    """
+    import numpy as np
+
+    units = _resolve_units(units)
+    gun_index = _GunIndex()
+    columns: Dict[str, list] = {
+        name: [] for name in ("trajectory", "gun", "marker", "is_started", *QUANTITIES, "burnup_fraction")
+    }
+    n_charges = None
+
+    for trajectory, states in enumerate(_iter_trajectories(trajectories)):
+        if not len(states):
+            continue
+        if n_charges is None:
+            n_charges = len(states.burnup_fractions[0])
+        if any(len(gun.charges) != n_charges for gun in states.guns):
+            raise ValueError("guns with a different number of charges cannot be written to one NPZ file.")
+
+        columns["trajectory"].extend(trajectory for _ in range(len(states)))
+        columns["gun"].extend(gun_index(gun) for gun in states.guns)
+        columns["marker"].extend(marker.value for marker in states.markers)
+        columns["is_started"].extend(states.are_started)
+        columns["time"].extend(states.times)
+        columns["travel"].extend(states.travels)
+        columns["velocity"].extend(states.velocities)
+        columns["average_pressure"].extend(states.average_pressures)
+        columns["shot_pressure"].extend(states.shot_pressures)
+        columns["breech_pressure"].extend(states.breech_pressures)
+        columns["burnup_fraction"].extend(states.burnup_fractions)
+
+    arrays = {
+        "trajectory": np.array(columns["trajectory"], dtype=np.int64),
+        "gun": np.array(columns["gun"], dtype=np.int64),
+        "marker": np.array(columns["marker"], dtype=str),
+        "is_started": np.array(columns["is_started"], dtype=bool),
+        **{
+            name: np.array(columns[name], dtype=np.float64) / UNIT_SCALES[units[quantity]]
+            for name, quantity in QUANTITIES.items()
+        },
+        "burnup_fraction": np.array(columns["burnup_fraction"], dtype=np.float64).reshape(-1, n_charges or 0),
+        "guns": np.array([json.dumps(gun.to_json(), ensure_ascii=False) for gun in gun_index.guns], dtype=str),
+        "units": np.array(json.dumps(units)),
+    }
+    np.savez_compressed(filename, **arrays)
+
+
+def read_npz(filename: FileName) -> list[StateList]:
+    """reads back the trajectories written by `write_npz`, in order."""
+    import numpy as np
+
+    with np.load(filename) as archive:
+        units = _resolve_units(json.loads(str(archive["units"])))
+        guns = [Gun.from_json(json.loads(str(text))) for text in archive["guns"]]
+
+        trajectory = archive["trajectory"]
+        columns = {
+            name: archive[name] * UNIT_SCALES[units[QUANTITIES[name]]] for name in ("time", "travel", "velocity")
+        }
+        gun, marker, is_started = archive["gun"], archive["marker"], archive["is_started"]
+        burnup_fraction = archive["burnup_fraction"]
+
+    # split the concatenated columns at every change of trajectory.
+    bounds = [0, *(np.flatnonzero(np.diff(trajectory)) + 1).tolist(), len(trajectory)]
+    return [
+        StateList.from_columns(
+            guns=[guns[i] for i in gun[start:stop].tolist()],
+            times=columns["time"][start:stop].tolist(),
+            travels=columns["travel"][start:stop].tolist(),
+            velocities=columns["velocity"][start:stop].tolist(),
+            burnup_fractions=map(tuple, burnup_fraction[start:stop].tolist()),
+            markers=marker[start:stop].tolist(),
+            are_started=is_started[start:stop].tolist(),
+        )
+        for start, stop in zip(bounds[:-1], bounds[1:])
+        if stop > start
+    ]
@@ -0,0 +1,577 @@
+"""
+Integration of many `minimalist_interior_ballistics.gun.Gun` in lockstep, on NumPy arrays.
+
+NumPy is an optional dependency of this package, install it with the `batch` extra, i.e.
+`python -m pip install minimalist_interior_ballistics[batch]`.
+"""
+
+from __future__ import annotations
+
+from bisect import insort
+from functools import cached_property
+from math import ceil, log
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+from attrs import field, frozen
+
+from . import AMBIENT_PRESSURE, DEFAULT_ACC, DEFAULT_STEPS, MAX_DT, Significance
+from .gun import Gun
+from .num import hermite, rk4
+from .state import StateList
+
+Lanes = list[np.ndarray]
+"""
+flat state of a batch, laid out as in `minimalist_interior_ballistics.gun.Gun`, i.e.
+`[time, travel, velocity, Z_1, ..., Z_n]`, except that each component is an array holding
+one value per gun (lane). Since the numerical methods in `minimalist_interior_ballistics.num`
+only ever operate component-wise, they can be applied to this representation unchanged.
+"""
+
+
+def _bisect(f: Callable[[np.ndarray], np.ndarray], x_0: np.ndarray, x_1: np.ndarray, tol: np.ndarray) -> np.ndarray:
+    """
+    lane-wise bisection for `f(x) >= 0`, given `f(x_0) < 0 <= f(x_1)`. Returns the end of the
+    final bracket that satisfies the condition, cf. taking the `max` of
+    `minimalist_interior_ballistics.num.dekker` in `minimalist_interior_ballistics.gun.Gun.to_burnout`.
+    """
+    n = max(ceil(log(float(np.max((x_1 - x_0) / tol)), 2)), 0)
+    for _ in range(n):
+        x = 0.5 * (x_0 + x_1)
+        is_met = f(x) >= 0
+        x_0, x_1 = np.where(is_met, x_0, x), np.where(is_met, x, x_1)
+    return x_1
+
+
+def _gss_max(f: Callable[[np.ndarray], np.ndarray], x_0: np.ndarray, x_1: np.ndarray, tol: np.ndarray) -> np.ndarray:
+    """lane-wise golden section search for the maximum, cf. `minimalist_interior_ballistics.num.gss_max`."""
+    inv_phi = (5**0.5 - 1) / 2
+    n = max(ceil(log(float(np.max((x_1 - x_0) / tol)), 1 / inv_phi)), 0)
+
+    a, b = x_0, x_1
+    c, d = b - inv_phi * (b - a), a + inv_phi * (b - a)
+    f_c, f_d = f(c), f(d)
+    for _ in range(n):
+        is_left = f_c > f_d
+        a, b = np.where(is_left, a, c), np.where(is_left, d, b)
+        c_new, d_new = b - inv_phi * (b - a), a + inv_phi * (b - a)
+        f_new = f(np.where(is_left, c_new, d_new))
+        c, d = np.where(is_left, c_new, d), np.where(is_left, c, d_new)
+        f_c, f_d = np.where(is_left, f_new, f_d), np.where(is_left, f_c, f_new)
+
+    return 0.5 * (a + b)
+
+
+def _take(ys: np.ndarray, index: np.ndarray) -> Lanes:
+    """picks point `index[i]` of lane `i`, from points stacked as (point, component, lane)."""
+    return list(ys[index, :, np.arange(ys.shape[2])].T)
+
+
+def _where(mask: np.ndarray, y: Lanes, y_else: Lanes) -> Lanes:
+    return [np.where(mask, a, b) for a, b in zip(y, y_else)]
+
+
+@frozen(kw_only=True)
+class GunBatchResult:
+    """
+    Columnar result of `GunBatch.to_travel`, with one entry per gun in the batch. Guns that
+    cannot be started (see `minimalist_interior_ballistics.gun.Gun.to_start`) have NaN entries
+    throughout, as have the burnout entries for guns whose charge did not burn out before the
+    projectile exits the muzzle.
+    """
+
+    muzzle_time: np.ndarray
+    muzzle_velocity: np.ndarray
+    peak_time: np.ndarray
+    peak_travel: np.ndarray
+    peak_average_pressure: np.ndarray
+    peak_shot_pressure: np.ndarray
+    peak_breech_pressure: np.ndarray
+    burnout_time: np.ndarray
+    burnout_travel: np.ndarray
+    burnout_velocity: np.ndarray
+    states: Optional[tuple[Optional[StateList], ...]] = field(default=None, repr=False)
+    """
+    if requested, the result of each gun in the same form as
+    `minimalist_interior_ballistics.gun.Gun.to_travel`, or None for guns that cannot be started.
+    """
+
+    def __len__(self) -> int:
+        return len(self.muzzle_velocity)
+
+
+@frozen(kw_only=True)
+class GunBatch:
+    """
+    A batch of `minimalist_interior_ballistics.gun.Gun`, typically variants differing in charge
+    mass, chamber volume or reduced burn rate, whose constants are packed into arrays such that
+    all guns can be integrated simultaneously, in lockstep, with vectorized steps.
+
+    Each gun occupies one lane of the arrays. Lanes march with their own step size, and are
+    masked out individually once they have reached the event of the current phase, i.e. shot
+    start, burnout or muzzle. All guns in a batch must have the same number of charges.
+
+    Examples
+    --------
+    >>> batch = GunBatch(guns=[problem.get_gun(...) for ...])
+    >>> result = batch.to_travel()
+    >>> result.muzzle_velocity, result.peak_average_pressure
+    """
+
+    guns: tuple[Gun, ...] = field(converter=tuple)
+
+    def __attrs_post_init__(self):
+        if not self.guns:
+            raise ValueError("batch must contain at least one gun.")
+        if len({len(gun.charges) for gun in self.guns}) != 1:
+            raise ValueError("guns in a batch must have the same number of charges.")
+
+    def __len__(self) -> int:
+        return len(self.guns)
+
+    def _gun_array(self, getter: Callable[[Gun], float]) -> np.ndarray:
+        return np.array([getter(gun) for gun in self.guns], dtype=float)
+
+    def _charge_arrays(self, getter: Callable[[Gun, int], float]) -> np.ndarray:
+        """one row per charge, one column per gun."""
+        return np.array([[getter(gun, i) for gun in self.guns] for i in range(self.n_charges)], dtype=float)
+
+    @cached_property
+    def n_charges(self) -> int:
+        return len(self.guns[0].charges)
+
+    @cached_property
+    def cross_section(self) -> np.ndarray:
+        return self._gun_array(lambda gun: gun.cross_section)
+
+    @cached_property
+    def shot_mass(self) -> np.ndarray:
+        return self._gun_array(lambda gun: gun.shot_mass)
+
+    @cached_property
+    def l_0(self) -> np.ndarray:
+        return self._gun_array(lambda gun: gun.l_0)
+
+    @cached_property
+    def phi(self) -> np.ndarray:
+        return self._gun_array(lambda gun: gun.phi)
+
+    @cached_property
+    def phi_1(self) -> np.ndarray:
+        return self._gun_array(lambda gun: gun.phi_1)
+
+    @cached_property
+    def shot_pressure_ratio(self) -> np.ndarray:
+        return self._gun_array(lambda gun: gun.shot_pressure_ratio)
+
+    @cached_property
+    def breech_pressure_ratio(self) -> np.ndarray:
+        return self._gun_array(lambda gun: gun.breech_pressure_ratio)
+
+    @cached_property
+    def theta(self) -> np.ndarray:
+        return self._gun_array(lambda gun: gun.theta)
+
+    @cached_property
+    def gross_charge_mass(self) -> np.ndarray:
+        return self._gun_array(lambda gun: gun.gross_charge_mass)
+
+    @cached_property
+    def start_pressure(self) -> np.ndarray:
+        return self._gun_array(lambda gun: gun.start_pressure)
+
+    @cached_property
+    def asymptotic_velocity(self) -> np.ndarray:
+        return self._gun_array(lambda gun: gun.asymptotic_velocity)
+
+    @cached_property
+    def l_1(self) -> np.ndarray:
+        """see `minimalist_interior_ballistics.gun.Gun.get_velocity_post_burnout`."""
+        return self.l_0 * (1 - sum(delta * covolume for delta, covolume in zip(self.delta, self.covolume)))
+
+    @cached_property
+    def travel(self) -> np.ndarray:
+        return self._gun_array(lambda gun: gun.travel)
+
+    @cached_property
+    def delta(self) -> np.ndarray:
+        """loading density of each charge, i.e. charge mass over chamber volume."""
+        return self._charge_arrays(lambda gun, i: gun.charge_masses[i] / gun.chamber_volume)
+
+    @cached_property
+    def density(self) -> np.ndarray:
+        return self._charge_arrays(lambda gun, i: gun.charges[i].density)
+
+    @cached_property
+    def covolume(self) -> np.ndarray:
+        return self._charge_arrays(lambda gun, i: gun.charges[i].covolume)
+
+    @cached_property
+    def force_mass(self) -> np.ndarray:
+        """product of force and mass of each charge."""
+        return self._charge_arrays(lambda gun, i: gun.charges[i].force * gun.charge_masses[i])
+
+    @cached_property
+    def reduced_burnrate(self) -> np.ndarray:
+        return self._charge_arrays(lambda gun, i: gun.charges[i].reduced_burnrate)
+
+    @cached_property
+    def pressure_exponent(self) -> np.ndarray:
+        return self._charge_arrays(lambda gun, i: gun.charges[i].pressure_exponent)
+
+    @cached_property
+    def chi(self) -> np.ndarray:
+        return self._charge_arrays(lambda gun, i: gun.charges[i].form_function.chi)
+
+    @cached_property
+    def labda(self) -> np.ndarray:
+        return self._charge_arrays(lambda gun, i: gun.charges[i].form_function.labda)
+
+    @cached_property
+    def mu(self) -> np.ndarray:
+        return self._charge_arrays(lambda gun, i: gun.charges[i].form_function.mu)
+
+    @cached_property
+    def chi_s(self) -> np.ndarray:
+        return self._charge_arrays(lambda gun, i: gun.charges[i].form_function.chi_s)
+
+    @cached_property
+    def labda_s(self) -> np.ndarray:
+        return self._charge_arrays(lambda gun, i: gun.charges[i].form_function.labda_s)
+
+    @cached_property
+    def Z_k(self) -> np.ndarray:
+        return self._charge_arrays(lambda gun, i: gun.charges[i].Z_k)
+
+    def get_volume_burnup_fractions(self, burnup_fractions: Sequence[np.ndarray]) -> Lanes:
+        """vectorized `minimalist_interior_ballistics.gun.Gun.get_volume_burnup_fractions`."""
+        psis = []
+        for i, Z in enumerate(burnup_fractions):
+            Z = np.clip(Z, 0, self.Z_k[i])
+            psis.append(
+                np.where(
+                    Z <= 1,
+                    self.chi[i] * Z * (1 + self.labda[i] * Z + self.mu[i] * Z**2),
+                    self.chi_s[i] * Z * (1 + self.labda_s[i] * Z),
+                )
+            )
+        return psis
+
+    def get_average_pressure(
+        self, *, travel: np.ndarray, velocity: np.ndarray, psis: Sequence[np.ndarray]
+    ) -> np.ndarray:
+        """vectorized `minimalist_interior_ballistics.gun.Gun.get_average_pressure`."""
+        incompressible_fraction = sum(
+            delta / density * (1 - psi) + covolume * delta * psi
+            for delta, density, covolume, psi in zip(self.delta, self.density, self.covolume, psis)
+        )
+        gas_energy = sum(fm * psi for fm, psi in zip(self.force_mass, psis))
+        gas_energy = gas_energy - 0.5 * self.theta * self.phi * self.shot_mass * velocity**2
+
+        l_psi = self.l_0 * (1 - incompressible_fraction)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(l_psi <= 0, np.inf, gas_energy / (self.cross_section * (l_psi + travel)))
+
+    def flat_average_pressure(self, y: Lanes) -> np.ndarray:
+        return self.get_average_pressure(travel=y[1], velocity=y[2], psis=self.get_volume_burnup_fractions(y[3:]))
+
+    def flat_dt(self, y: Lanes, is_started: bool = True) -> Lanes:
+        """vectorized `minimalist_interior_ballistics.gun.Gun.flat_dt`."""
+        P = self.flat_average_pressure(y)
+        P_burn = np.maximum(P, AMBIENT_PRESSURE)
+        dZs = [rbr * P_burn**n for rbr, n in zip(self.reduced_burnrate, self.pressure_exponent)]
+        ones = np.ones_like(y[0])
+        if is_started:
+            return [ones, y[2], self.cross_section * P / (self.phi * self.shot_mass), *dZs]
+        else:
+            return [ones, 0 * ones, 0 * ones, *dZs]
+
+    def flat_pre_start_dt(self, y: Lanes) -> Lanes:
+        return self.flat_dt(y, is_started=False)
+
+    def flat_dl(self, y: Lanes) -> Lanes:
+        v = y[2]
+        return [d / v for d in self.flat_dt(y)]
+
+    def flat_step_in_travel(self, y: Lanes, dl: np.ndarray) -> Lanes:
+        y_next = rk4(f=self.flat_dl, y=y, h=dl)
+        y_next[1] = y[1] + dl
+        return y_next
+
+    @staticmethod
+    def flat_integrate(
+        f: Callable[[Lanes], Lanes],
+        y_0: Lanes,
+        event: Callable[[Lanes], np.ndarray],
+        n_intg: int = 0,
+        delta_t: float | np.ndarray = MAX_DT,
+        active: Optional[np.ndarray] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Lane-wise `minimalist_interior_ballistics.gun.Gun.flat_integrate` with the
+        `minimalist_interior_ballistics.Integrator.RK4` method: each lane is integrated in time from
+        `y_0`, at its own uniform step size, until `event` becomes non-negative. Lanes that took fewer
+        than `n_intg` points are repeated at a step of the elapsed time divided by `n_intg`, while
+        the others are kept.
+
+        Returns
+        -------
+        ys: np.ndarray
+            points integrated, stacked as (point, component, lane) and padded with NaN.
+        n: np.ndarray
+            number of points in each lane, the last of which is the first to satisfy `event`.
+            Inactive lanes have only `y_0`.
+        """
+        n_lanes = len(y_0[0])
+        h = np.broadcast_to(np.asarray(delta_t, dtype=float), (n_lanes,)).copy()
+        to_do = np.ones(n_lanes, dtype=bool) if active is None else active.copy()
+        k_0 = f(y_0)
+
+        runs, n = [], np.ones(n_lanes, dtype=int)
+        while to_do.any():
+            y, k, count = y_0, k_0, np.ones(n_lanes, dtype=int)
+            ys = [np.array(y)]
+            is_running = to_do & (event(y) < 0)
+            while is_running.any():
+                y = _where(is_running, rk4(f=f, y=y, h=h, k1=k), y)
+                k = f(y)
+                count += is_running
+                ys.append(np.array(y))
+                is_running &= event(y) < 0
+
+            is_done = to_do & (count - 1 >= n_intg)
+            runs.append((np.array(ys), is_done))
+            n = np.where(is_done, count, n)
+            h = np.where(to_do & ~is_done, (y[0] - y_0[0]) / max(n_intg, 1), h)
+            to_do &= ~is_done
+
+        ys = np.full((max(len(run) for run, _ in runs), len(y_0), n_lanes), np.nan)
+        ys[0] = np.array(y_0)
+        for run, is_done in runs:
+            ys[: len(run), :, is_done] = run[:, :, is_done]
+        is_padding = np.arange(len(ys))[:, None, None] >= n[None, None, :]
+        return np.where(is_padding, np.nan, ys), n
+
+    def to_travel(
+        self,
+        travel: Optional[float | np.ndarray] = None,
+        n_intg: int = DEFAULT_STEPS,
+        acc: float = DEFAULT_ACC,
+        keep_states: bool = False,
+    ) -> GunBatchResult:
+        """
+        Lockstep equivalent of `minimalist_interior_ballistics.gun.Gun.to_travel`, with the
+        `minimalist_interior_ballistics.Integrator.RK4` method.
+
+        Parameters
+        ----------
+        travel: float | np.ndarray, optional
+            the projectile travel to integrate to, either common, or one per gun. If not supplied,
+            `minimalist_interior_ballistics.gun.Gun.travel` of each gun is used.
+        n_intg, acc:
+            see documentation for `minimalist_interior_ballistics.gun.Gun.to_burnout`.
+        keep_states: bool
+            whether to also return each gun's result as a `minimalist_interior_ballistics.state.StateList`.
+
+        Returns
+        -------
+        `GunBatchResult`
+
+        Notes
+        -----
+        The phases are the same as in `minimalist_interior_ballistics.gun.Gun`: integration up to
+        shot start, then to burnout or muzzle, whichever occurs first, then, for the guns with a
+        burnout, to the muzzle. Shot start and burnout are located lane-wise on the dense output
+        (see `minimalist_interior_ballistics.num.hermite`) by bisection, and the final step to the
+        muzzle is taken in travel. The peak pressure is then searched for on the dense output of the
+        steps bracketing the highest pressure point. Since probing the dense output costs no evaluation
+        of the derivative, these are all determined to `acc` squared times the relevant time scale.
+        As in `minimalist_interior_ballistics.gun.Gun.flat_iter_trajectory`, the burnout and peak
+        pressure points are then stepped to from the point before, as the dense output of a step
+        across burnout is not accurate.
+        """
+        travel = self.travel if travel is None else np.broadcast_to(np.asarray(travel, dtype=float), (len(self),))
+        if not np.all(travel > 0):
+            raise ValueError("travel must be supplied either as a parameter or during instance instantiation")
+
+        bomb_pressure = self.get_average_pressure(
+            travel=np.zeros(len(self)),
+            velocity=np.zeros(len(self)),
+            psis=self.get_volume_burnup_fractions(self.Z_k),
+        )
+        is_valid = bomb_pressure >= self.start_pressure
+        if not is_valid.all():
+            return self._scatter(
+                (
+                    GunBatch(guns=[gun for gun, valid in zip(self.guns, is_valid) if valid]).to_travel(
+                        travel=travel[is_valid], n_intg=n_intg, acc=acc, keep_states=keep_states
+                    )
+                    if is_valid.any()
+                    else None
+                ),
+                is_valid=is_valid,
+                keep_states=keep_states,
+            )
+
+        n_lanes, lanes = len(self), np.arange(len(self))
+        zeros = np.zeros(n_lanes)
+
+        def get_interpolant(f: Callable[[Lanes], Lanes], y_a: Lanes, y_b: Lanes) -> Callable[[np.ndarray], Lanes]:
+            return hermite(x_0=y_a[0], y_0=y_a, f_0=f(y_a), x_1=y_b[0], y_1=y_b, f_1=f(y_b))
+
+        # shot start
+        ys, n = self.flat_integrate(
+            f=self.flat_pre_start_dt,
+            y_0=[zeros for _ in range(3 + self.n_charges)],
+            event=lambda y: self.flat_average_pressure(y) - self.start_pressure,
+            n_intg=n_intg,
+        )
+        y_a, y_b = _take(ys, n - 2), _take(ys, n - 1)
+        y_at_time = get_interpolant(self.flat_pre_start_dt, y_a, y_b)
+        start_time = _bisect(
+            lambda t: self.flat_average_pressure(y_at_time(t)) - self.start_pressure, y_a[0], y_b[0], y_b[0] * acc**2
+        )
+        y_start = [zeros, zeros, zeros, *y_at_time(start_time)[3:]]
+
+        # shot start to burnout, or muzzle
+        def burnout_or_muzzle(y: Lanes) -> np.ndarray:
+            burnout = np.min([Z - Z_k for Z, Z_k in zip(y[3:], self.Z_k)], axis=0)
+            return np.maximum(burnout, y[1] - travel)
+
+        ys_1, n_1 = self.flat_integrate(f=self.flat_dt, y_0=y_start, event=burnout_or_muzzle, n_intg=n_intg)
+        y_a, y_b = _take(ys_1, n_1 - 2), _take(ys_1, n_1 - 1)
+        y_at_time = get_interpolant(self.flat_dt, y_a, y_b)
+        end_time = _bisect(lambda t: burnout_or_muzzle(y_at_time(t)), y_a[0], y_b[0], y_b[0] * acc**2)
+        y_end = y_at_time(end_time)
+        burnout_margins = np.array(y_end[3:]) - self.Z_k
+        is_burnout = ~(y_end[1] > travel) & (burnout_margins.min(axis=0) >= 0)
+
+        # the interpolant spans the kink at burnout, so the state is stepped to the time located on
+        # it, and moved along its derivative by a Newton step on the charge burning out last.
+        m = np.argmin(burnout_margins, axis=0)
+        y_end = rk4(f=self.flat_dt, y=y_a, h=end_time - y_a[0])
+        dy_end = self.flat_dt(y_end)
+        Zs, dZs = np.array(y_end[3:])[m, lanes], np.array(dy_end[3:])[m, lanes]
+        dt = np.where(is_burnout, (self.Z_k[m, lanes] - Zs) / dZs, 0.0)
+        y_end = [y + d * dt for y, d in zip(y_end, dy_end)]
+
+        # burnout to muzzle
+        v_muzzle = (
+            1
+            - (1 - (y_end[2] / self.asymptotic_velocity) ** 2)
+            / ((self.l_1 + travel) / (self.l_1 + y_end[1])) ** self.theta
+        ) ** 0.5 * self.asymptotic_velocity
+        ttm_est = (travel - y_end[1]) / (0.5 * (v_muzzle + y_end[2]))
+        ys_2, n_2 = self.flat_integrate(
+            f=self.flat_dt,
+            y_0=y_end,
+            event=lambda y: y[1] - travel,
+            delta_t=np.maximum(y_end[0] / (n_1 + 1), ttm_est / n_intg),
+            active=is_burnout,
+        )
+        y_last = _where(is_burnout, _take(ys_2, np.maximum(n_2 - 2, 0)), y_a)
+        y_muzzle = self.flat_step_in_travel(y_last, dl=travel - y_last[1])
+
+        # collect the points lane-wise, in the same order as `Gun.to_travel`.
+        n_points = (n_1 - 1) + np.where(is_burnout, n_2, 1)
+        n_max = int(n_points.max())
+        points = np.full((n_max, 3 + self.n_charges, n_lanes), np.nan)
+        markers = np.full((n_max, n_lanes), Significance.STEP, dtype=object)
+        position = np.zeros(n_lanes, dtype=int)
+
+        def put(y: Lanes | np.ndarray, mask: np.ndarray, marker: Significance):
+            points[position[mask], :, lanes[mask]] = np.array(y)[:, mask].T
+            markers[position[mask], lanes[mask]] = marker
+            position[mask] += 1
+
+        for i, y in enumerate(ys_1[:-1]):
+            put(y, i < n_1 - 1, Significance.START if i == 0 else Significance.STEP)
+        put(y_end, is_burnout, Significance.BURNOUT)
+        for i, y in enumerate(ys_2[1:-1], start=1):
+            put(y, is_burnout & (i < n_2 - 1), Significance.STEP)
+        put(y_muzzle, lanes >= 0, Significance.MUZZLE)
+
+        # peak pressure
+        pressures = self.flat_average_pressure(list(points.transpose(1, 0, 2)))
+        j = np.nanargmax(pressures, axis=0)
+        i, k = np.maximum(j - 1, 0), np.minimum(j + 1, n_points - 1)
+        y_i, y_j, y_k = _take(points, i), _take(points, j), _take(points, k)
+        y_at_time_ij = get_interpolant(self.flat_dt, y_i, y_j)
+        y_at_time_jk = get_interpolant(self.flat_dt, y_j, y_k)
+
+        def y_at_time(time: np.ndarray) -> Lanes:
+            return _where((time < y_j[0]) | (j == k), y_at_time_ij(time), y_at_time_jk(time))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # degenerate pieces, where the peak is at either end, are never selected.
+            peak_time = _gss_max(
+                lambda t: self.flat_average_pressure(y_at_time(t)), y_i[0], y_k[0], y_muzzle[0] * acc**2
+            )
+            y_0 = _where((peak_time < y_j[0]) | (j == k), y_i, y_j)
+            y_peak = rk4(f=self.flat_dt, y=y_0, h=peak_time - y_0[0])
+        # a maximum at a kink, i.e. at burnout, is the highest point itself, as is one within tolerance of it.
+        is_peak_located = (self.flat_average_pressure(y_peak) > pressures[j, lanes]) & (
+            np.abs(peak_time - y_j[0]) > y_muzzle[0] * acc**2
+        )
+        y_peak = _where(is_peak_located, y_peak, y_j)
+        peak_time = y_peak[0]
+        peak_pressure = self.flat_average_pressure(y_peak)
+        peak_shot_pressure = peak_pressure / self.shot_pressure_ratio
+
+        states = None
+        if keep_states:
+            states = []
+            for lane, gun in enumerate(self.guns):
+                lane_states = StateList.from_flat(
+                    gun,
+                    (points[m, :, lane].tolist() for m in range(n_points[lane])),
+                    markers=(markers[m, lane] for m in range(n_points[lane])),
+                )
+                insort(
+                    lane_states,
+                    gun.get_state([y[lane] for y in y_peak], marker=Significance.PEAK_PRESSURE),
+                )
+                states.append(lane_states)
+            states = tuple(states)
+
+        nan = np.full(n_lanes, np.nan)
+        return GunBatchResult(
+            muzzle_time=y_muzzle[0],
+            muzzle_velocity=y_muzzle[2],
+            peak_time=peak_time,
+            peak_travel=y_peak[1],
+            peak_average_pressure=peak_pressure,
+            peak_shot_pressure=peak_shot_pressure,
+            peak_breech_pressure=peak_shot_pressure * self.breech_pressure_ratio,
+            burnout_time=np.where(is_burnout, y_end[0], nan),
+            burnout_travel=np.where(is_burnout, y_end[1], nan),
+            burnout_velocity=np.where(is_burnout, y_end[2], nan),
+            states=states,
+        )
+
+    def _scatter(self, result: Optional[GunBatchResult], is_valid: np.ndarray, keep_states: bool) -> GunBatchResult:
+        """expands the result of the valid guns to the whole batch, filling in NaN and None."""
+        columns = {}
+        for name in (
+            "muzzle_time",
+            "muzzle_velocity",
+            "peak_time",
+            "peak_travel",
+            "peak_average_pressure",
+            "peak_shot_pressure",
+            "peak_breech_pressure",
+            "burnout_time",
+            "burnout_travel",
+            "burnout_velocity",
+        ):
+            column = np.full(len(self), np.nan)
+            if result is not None:
+                column[is_valid] = getattr(result, name)
+            columns[name] = column
+
+        states = None
+        if keep_states:
+            valid_states = iter(result.states if result is not None else ())
+            states = tuple(next(valid_states) if valid else None for valid in is_valid)
+
+        return GunBatchResult(**columns, states=states)
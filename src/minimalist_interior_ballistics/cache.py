@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    enabled: bool
+
+
+class LRUCache(Generic[T]):
+    """
+    Bounded mapping that evicts the least recently used entry once more than `maxsize` entries
+    are stored, and keeps hit/miss statistics, in the manner of `functools.lru_cache`. Unlike the
+    latter, the key is supplied explicitly, such that only the arguments that actually determine
+    the result need to be hashable, and the cache can be switched off and on at runtime.
+
+    Examples
+    --------
+    >>> cache = LRUCache(maxsize=2)
+    >>> cache.get_or_compute("a", lambda: 1)
+    1
+    >>> cache.get_or_compute("a", lambda: 2)
+    1
+    >>> cache.info()
+    CacheInfo(hits=1, misses=1, maxsize=2, currsize=1, enabled=True)
+    """
+
+    def __init__(self, maxsize: int = 128, enabled: bool = True):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, T] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Returns the value stored for `key`, or calls `compute` to generate and store it. When
+        the cache is disabled, `compute` is always called and nothing is stored or counted.
+        """
+        if not self.enabled:
+            return compute()
+
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._data.move_to_end(key)
+            return value
+
+        value = compute()
+        self._data[key] = value
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return value
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self.hits, misses=self.misses, maxsize=self.maxsize, currsize=len(self._data), enabled=self.enabled
+        )
+
+    def clear(self):
+        """removes all entries and resets the statistics."""
+        self._data.clear()
+        self.hits = self.misses = 0
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        """disables the cache, and removes all entries."""
+        self.enabled = False
+        self._data.clear()
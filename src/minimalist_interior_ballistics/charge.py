@@ -54,6 +54,10 @@ class Propellant:
 
     burn_rate_coefficient: float, optional
         ...
+    name, description, family: str, optional
+        free-form labels, of which `family` groups related propellants in a
+        `minimalist_interior_ballistics.library.PropellantLibrary`. Unlike the others, it is
+        not compared, and not serialized when empty.
 
     Attributes
     ----------
@@ -69,6 +73,7 @@ class Propellant:
 
     name: str = field(default="")
     description: str = field(default="")
+    family: str = field(default="", eq=False)
     burn_rate_coefficient: float = field(default=0)
     density: float
     force: float
@@ -82,17 +87,31 @@ class Propellant:
 
     @staticmethod
     def from_csv_file(file_name: str) -> Tuple[Propellant, ...]:
+        """
+        reads propellants from a CSV file, one per row of name, description, adiabatic index,
+        density, force, covolume, pressure exponent, burn rate coefficient and, optionally,
+        family. Rows that do not parse, such as a header, are skipped with a warning.
+
+        See `minimalist_interior_ballistics.library.PropellantLibrary` for indexed lookups.
+        """
         prop_list = []
         with open(file_name, mode="r", encoding="utf-8") as file:
             reader = csv.reader(file, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL)
             for row in reader:
                 try:
-                    (adiabatic_index, density, force, covolume, pressure_exponent, burn_rate_coefficient) = row[2:]
-                    name, description = row[:2]
+                    name, description, *values = row
+                    family = values.pop() if len(values) == 7 else ""
+                    (adiabatic_index, density, force, covolume, pressure_exponent, burn_rate_coefficient) = values
                     prop_list.append(
                         Propellant(
                             name=name,
-                            description=codecs.decode(description, "unicode_escape"),
+                            # escapes are the only change `unicode_escape` makes to plain ASCII.
+                            description=(
+                                description
+                                if description.isascii() and "\\" not in description
+                                else codecs.decode(description, "unicode_escape")
+                            ),
+                            family=family,
                             adiabatic_index=float(adiabatic_index),
                             density=float(density),
                             force=float(force),
@@ -197,6 +216,7 @@ Charge.burn_rate_coefficient and FormFunction.e_1"
         return cls(
             name=name if name else " ".join((propellant.name, form_function.name)),
             description=form_function.description if description is None else description,
+            family=propellant.family,
             density=propellant.density,
             force=propellant.force,
             pressure_exponent=propellant.pressure_exponent,
@@ -3,10 +3,14 @@ from __future__ import annotations
 from enum import Enum
 from functools import cached_property
 from math import pi
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
 
 from attrs import field, frozen
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
+
 
 class MultiPerfShape(Enum):
     # fmt: off
@@ -142,6 +146,18 @@ class FormFunction:
 
         raise ValueError(f"psi(Z) is defined in [0, {self.Z_k}], but called with Z = {Z}")
 
+    def psi(self, Z: ArrayLike) -> np.ndarray:
+        """
+        Array-aware `FormFunction.__call__`, evaluating both branches of the form function over
+        any array of Z at once. Requires NumPy, see `minimalist_interior_ballistics.batch`.
+
+        Raises
+        ------
+        ValueError
+            if any Z is outside [0, `FormFunction.Z_k`].
+        """
+        return _psi(Z, self.chi, self.labda, self.mu, self.chi_s, self.labda_s, self.Z_k)
+
     def pretty_print(self) -> str:
         return "\n".join(
             (
@@ -285,3 +301,137 @@ class FormFunction:
             Z_k=(e_1 + rho) / e_1,
             e_1=e_1,
         )
+
+
+def _psi(Z: ArrayLike, chi, labda, mu, chi_s, labda_s, Z_k) -> np.ndarray:
+    """form function over arrays of Z and of coefficients, which are broadcast together."""
+    import numpy as np
+
+    Z = np.asarray(Z, dtype=float)
+    if np.any((Z < 0) | (Z > Z_k)):
+        raise ValueError("psi(Z) is defined in [0, Z_k], but called with Z outside of it.")
+    return np.where(Z <= 1, chi * Z * (1 + labda * Z + mu * Z**2), chi_s * Z * (1 + labda_s * Z))
+
+
+@frozen(kw_only=True)
+class FormFunctionGrid:
+    """
+    Coefficients of the form functions of a whole grid of multiple-perforated grain geometries,
+    as arrays indexed `[arch width, perforation diameter, height, shape]`, see
+    `FormFunctionGrid.multi_perf`. Requires NumPy, see `minimalist_interior_ballistics.batch`.
+
+    Attributes
+    ----------
+    chi, labda, mu, Z_k, e_1, psi_s, chi_s, labda_s: np.ndarray
+        see `FormFunction`. Geometries for which `FormFunction.multi_perf` would raise, i.e.
+        short grains that combust regressively, are NaN throughout.
+    """
+
+    arch_widths: Tuple[float, ...]
+    perforation_diameters: Tuple[float, ...]
+    heights: Tuple[float, ...]
+    shapes: Tuple[MultiPerfShape, ...]
+
+    chi: np.ndarray
+    labda: np.ndarray
+    mu: np.ndarray
+    Z_k: np.ndarray
+    e_1: np.ndarray
+
+    @classmethod
+    def multi_perf(
+        cls,
+        arch_widths: Sequence[float],
+        perforation_diameters: Sequence[float],
+        heights: Sequence[float],
+        shapes: Sequence[MultiPerfShape] = tuple(MultiPerfShape),
+    ) -> FormFunctionGrid:
+        """
+        vectorized `FormFunction.multi_perf`, over the outer product of the geometries, see there
+        for the parameters, each of which is supplied as a sequence of values.
+        """
+        import numpy as np
+
+        arch_widths, perforation_diameters, heights, shapes = (
+            tuple(v) for v in (arch_widths, perforation_diameters, heights, shapes)
+        )
+        if not shapes:
+            raise ValueError("at least one shape is required.")
+
+        arch_width, d_0, height = np.meshgrid(
+            np.array(arch_widths, dtype=float),
+            np.array(perforation_diameters, dtype=float),
+            np.array(heights, dtype=float),
+            indexing="ij",
+        )
+        e_1, c = 0.5 * arch_width, 0.5 * height
+        beta = e_1 / c
+        rho_base = e_1 + 0.5 * d_0
+
+        coefficients = []
+        for shape in shapes:
+            _, n, A, B, C, b, a, rho_ratio = shape(d_0=d_0, e_1=e_1)
+            rho = rho_ratio * rho_base
+            Pi = (A * b + B * d_0) / (2 * c)
+            Q = (C * a**2 + A * b**2 - B * d_0**2) / (2 * c) ** 2
+            labda = beta * (n - 1 - 2 * Pi) / (Q + 2 * Pi)
+            chi = beta * (Q + 2 * Pi) / Q
+            mu = beta**2 * (1 - n) / (Q + 2 * Pi)
+            Z_k = (e_1 + rho) / e_1
+            coefficients.append([np.where(labda < 0, np.nan, v) for v in (chi, labda, mu, Z_k, e_1)])
+
+        chi, labda, mu, Z_k, e_1 = (np.stack(v, axis=-1) for v in zip(*coefficients))
+
+        return cls(
+            arch_widths=arch_widths,
+            perforation_diameters=perforation_diameters,
+            heights=heights,
+            shapes=shapes,
+            chi=chi,
+            labda=labda,
+            mu=mu,
+            Z_k=Z_k,
+            e_1=e_1,
+        )
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.chi.shape
+
+    @cached_property
+    def psi_s(self) -> np.ndarray:
+        return self.chi * (1 + self.labda + self.mu)
+
+    @cached_property
+    def chi_s(self) -> np.ndarray:
+        import numpy as np
+
+        Z_k = self.Z_k
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(Z_k == 1, 0.0, (1 - self.psi_s * Z_k**2) / (Z_k - Z_k**2))
+
+    @cached_property
+    def labda_s(self) -> np.ndarray:
+        import numpy as np
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.Z_k == 1, 0.0, self.psi_s / self.chi_s - 1)
+
+    def psi(self, Z: ArrayLike) -> np.ndarray:
+        """
+        `FormFunction.psi` of every geometry in the grid at once, with `Z` broadcast against the
+        coefficient arrays of shape `FormFunctionGrid.shape`. For instance, a scalar evaluates
+        each geometry at the same Z, and an array of shape `(m, 1, 1, 1, 1)` evaluates each at
+        `m` values of Z. Geometries that are NaN evaluate to NaN.
+        """
+        return _psi(Z, self.chi, self.labda, self.mu, self.chi_s, self.labda_s, self.Z_k)
+
+    def get_form_function(self, index: Tuple[int, int, int, int]) -> FormFunction:
+        """the `FormFunction` of the geometry at `index`, as built by `FormFunction.multi_perf`."""
+        i_arch_width, i_perforation_diameter, i_height, i_shape = index
+        return FormFunction.multi_perf(
+            arch_width=self.arch_widths[i_arch_width],
+            perforation_diameter=self.perforation_diameters[i_perforation_diameter],
+            height=self.heights[i_height],
+            shape=self.shapes[i_shape],
+        )
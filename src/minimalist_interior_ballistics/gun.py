@@ -4,15 +4,30 @@ import json
 import logging
 from bisect import insort
 from functools import cached_property
-from math import inf
-from typing import Callable, Dict, Iterable, Optional, Tuple
+from math import exp, inf, log
+from typing import Callable, ClassVar, Dict, Iterable, Iterator, Optional, Tuple, Union
 
-from attrs import field, frozen
+from attrs import evolve, field, frozen
 from cattrs import Converter
-
-from . import DEFAULT_ACC, DEFAULT_GUN_LOSS_FRACTION, DEFAULT_GUN_START_PRESSURE, DEFAULT_STEPS, MAX_DT, Significance
-from .charge import Charge
-from .num import dekker, gss_max
+from cattrs.gen import make_dict_unstructure_fn, override
+
+from . import (
+    AMBIENT_PRESSURE,
+    DEFAULT_ACC,
+    DEFAULT_GUN_LOSS_FRACTION,
+    DEFAULT_GUN_START_PRESSURE,
+    DEFAULT_STEPS,
+    MAX_BURNUP_REFINEMENTS,
+    MAX_DT,
+    START_CACHE_SIZE,
+    Integrator,
+    PeakFinder,
+    Significance,
+)
+from .cache import LRUCache
+from .charge import Charge, Propellant
+from .form_function import FormFunction
+from .num import brent_max, dekker, dopri5, dopri5_dense, dopri5_step, gauss_legendre, gss_max, hermite, intg, rk4
 from .state import State, StateList, StateVector
 
 logger = logging.getLogger(__name__)
@@ -42,6 +57,9 @@ class Gun:
     start_pressure: float = DEFAULT_GUN_START_PRESSURE
     travel: float = 0.0
 
+    start_cache: ClassVar[LRUCache] = LRUCache(maxsize=START_CACHE_SIZE)
+    """memoizes `Gun.to_start` across all instances, see there."""
+
     def __attrs_post_init__(self):
         if self.charge and self.charge_mass:
             object.__setattr__(self, "charges", tuple([self.charge]))
@@ -53,13 +71,13 @@ class Gun:
         else:
             raise ValueError("invalid parameters.")
 
-    def to_json(self):
-        converter = Converter()
-        return converter.unstructure(self)
+    def to_json(self) -> Dict:
+        """unstructures this gun into JSON-compatible built-ins, with the shared `converter`."""
+        return converter.unstructure(self, Gun)
 
     @staticmethod
     def from_json(json_dict: Dict) -> Gun:
-        converter = Converter()
+        """structures a gun from the output of `Gun.to_json`, with the shared `converter`."""
         return converter.structure(json_dict, Gun)
 
     @staticmethod
@@ -76,6 +94,28 @@ class Gun:
 
         return tuple(guns)
 
+    @staticmethod
+    def to_jsonl(guns: Iterable[Gun], filename: str):
+        """
+        writes guns to a JSON-lines file, as one compact `Gun.to_json` object per line.
+        The guns are written as they are iterated over, such that a catalog need not be held in
+        memory at once.
+        """
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        with open(filename, mode="w", encoding="utf-8") as f:
+            for gun in guns:
+                f.write(encode(gun.to_json()))
+                f.write("\n")
+
+    @staticmethod
+    def iter_jsonl(filename: str) -> Iterator[Gun]:
+        """reads guns back from a JSON-lines file written by `Gun.to_jsonl`, one line at a time."""
+        decode = json.JSONDecoder().decode
+        with open(filename, mode="r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield Gun.from_json(decode(line))
+
     @cached_property
     def l_0(self) -> float:
         return self.chamber_volume / self.cross_section
@@ -100,6 +140,16 @@ class Gun:
     def phi_1(self) -> float:
         return 1 + self.loss_fraction
 
+    @cached_property
+    def shot_pressure_ratio(self) -> float:
+        """ratio of the average pressure to the shot pressure, under the Lagrange gradient."""
+        return 1 + self.gross_charge_mass / (3 * self.shot_mass * self.phi_1)
+
+    @cached_property
+    def breech_pressure_ratio(self) -> float:
+        """ratio of the breech pressure to the shot pressure, under the Lagrange gradient."""
+        return 1 + self.gross_charge_mass / (2 * self.shot_mass * self.phi_1)
+
     @cached_property
     def bomb_free_fraction(self) -> float:
         return (
@@ -148,8 +198,12 @@ class Gun:
             marker=Significance.BOMB,
         )
 
-    def get_start_state(self, n_intg: int = DEFAULT_STEPS, acc: float = DEFAULT_ACC) -> State:
-        return self.to_start(n_intg=n_intg, acc=acc).get_state_by_marker(significance=Significance.START)
+    def get_start_state(
+        self, n_intg: int = DEFAULT_STEPS, acc: float = DEFAULT_ACC, integrator: Integrator = Integrator.RK4
+    ) -> State:
+        return self.to_start(n_intg=n_intg, acc=acc, integrator=integrator).get_state_by_marker(
+            significance=Significance.START
+        )
 
     def gas_energy(self, *, psis: tuple[float, ...], v: float) -> float:
 
@@ -167,16 +221,234 @@ class Gun:
 
         return incompressible_fraction
 
-    def dt(self, state: State) -> StateVector:
-        P = state.average_pressure
-        dZs = tuple(charge.dZdt(P) for charge in self.charges)
-        return StateVector(
-            time=1,
-            travel=state.velocity if state.is_started else 0,
-            velocity=(self.cross_section * P / (self.phi * self.shot_mass) if state.is_started else 0),
-            burnup_fractions=dZs,
+    def get_volume_burnup_fractions(self, burnup_fractions: Iterable[float]) -> tuple[float, ...]:
+        return tuple(
+            charge.psi(max(min(burnup_fraction, charge.Z_k), 0))
+            for charge, burnup_fraction in zip(self.charges, burnup_fractions)
         )
 
+    def get_average_pressure(self, *, travel: float, velocity: float, psis: tuple[float, ...]) -> float:
+        """
+        See documentation for `minimalist_interior_ballistics.state.State.average_pressure`.
+        """
+        l_psi = self.l_0 * (1 - self.incompressible_fraction(psis))
+        if l_psi <= 0:
+            return inf
+        else:
+            return self.gas_energy(psis=psis, v=velocity) / (self.cross_section * (l_psi + travel))
+
+    @cached_property
+    def pressure_coefficients(self) -> Tuple[float, float, tuple[tuple[float, ...], ...]]:
+        """
+        Constants of the average pressure as a function of the flat state, shared between
+        `Gun.compile_average_pressure` and `Gun.compile_pressure_rate`: the free length at
+        ignition, the coefficient of the kinetic energy of the shot, and per charge, the
+        form function coefficients, the gas energy and the free length per unit volume burnup.
+        """
+        l_0 = self.l_0
+        l_psi_0 = l_0 * (1 - self.incompressible_fraction(tuple(0 for _ in self.charges)))
+        energy_coefficient = 0.5 * self.theta * self.phi * self.shot_mass
+
+        coefficients = []
+        for charge, charge_mass in zip(self.charges, self.charge_masses):
+            ff = charge.form_function
+            delta = charge_mass / self.chamber_volume
+            coefficients.append(
+                (
+                    charge.Z_k,
+                    ff.chi,
+                    ff.chi * ff.labda,
+                    ff.chi * ff.mu,
+                    ff.chi_s,
+                    ff.chi_s * ff.labda_s,
+                    charge.force * charge_mass,  # gas energy per unit volume burnup
+                    l_0 * delta * (1 / charge.density - charge.covolume),  # free length per unit volume burnup
+                )
+            )
+        return l_psi_0, energy_coefficient, tuple(coefficients)
+
+    def compile_average_pressure(self) -> Callable[[list[float]], float]:
+        """
+        Returns the average pressure as a function of the flat state (see `Gun.get_state`),
+        specialized for this gun, see `Gun.compile`.
+        """
+        cross_section = self.cross_section
+        l_psi_0, energy_coefficient, coefficients = self.pressure_coefficients
+
+        def average_pressure(y: list[float]) -> float:
+            v = y[2]
+            gas_energy, l_psi = -energy_coefficient * v * v, l_psi_0
+            for Z, (Z_k, a_1, a_2, a_3, b_1, b_2, f_m, l_m) in zip(y[3:], coefficients):
+                if Z > Z_k:
+                    Z = Z_k
+                if Z <= 0:
+                    continue
+                psi = Z * (a_1 + Z * (a_2 + Z * a_3)) if Z <= 1 else Z * (b_1 + Z * b_2)
+                gas_energy += f_m * psi
+                l_psi += l_m * psi
+
+            if l_psi <= 0:
+                return inf
+            return gas_energy / (cross_section * (l_psi + y[1]))
+
+        return average_pressure
+
+    def compile_pressure_rate(self) -> Callable[[list[float], list[float]], float]:
+        """
+        Returns the rate of change of the average pressure, as a function of the flat state and
+        its derivative, specialized for this gun. The average pressure being an explicit function
+        of the flat state, this is its gradient dotted with the derivative: for the time derivative
+        (see `Gun.compile`) this is dP/dt, and for the derivative in burn-up fraction (see
+        `Gun.compile_burnup`) this is dP/dZ.
+        """
+        cross_section = self.cross_section
+        l_psi_0, energy_coefficient, coefficients = self.pressure_coefficients
+
+        def pressure_rate(y: list[float], dy: list[float]) -> float:
+            v = y[2]
+            gas_energy, l_psi, d_gas_energy, d_l_psi = -energy_coefficient * v * v, l_psi_0, 0.0, 0.0
+            for Z, dZ, (Z_k, a_1, a_2, a_3, b_1, b_2, f_m, l_m) in zip(y[3:], dy[3:], coefficients):
+                if Z > Z_k:
+                    Z, dZ = Z_k, 0.0
+                if Z <= 0:
+                    continue
+                if Z <= 1:
+                    psi, dpsi = Z * (a_1 + Z * (a_2 + Z * a_3)), a_1 + Z * (2 * a_2 + 3 * Z * a_3)
+                else:
+                    psi, dpsi = Z * (b_1 + Z * b_2), b_1 + 2 * Z * b_2
+                gas_energy += f_m * psi
+                l_psi += l_m * psi
+                d_gas_energy += f_m * dpsi * dZ
+                d_l_psi += l_m * dpsi * dZ
+
+            free_length = l_psi + y[1]
+            if free_length <= 0:
+                return 0.0
+            d_gas_energy -= 2 * energy_coefficient * v * dy[2]
+            # quotient rule on P = E / (S * L)
+            return (d_gas_energy - gas_energy * (d_l_psi + dy[1]) / free_length) / (cross_section * free_length)
+
+        return pressure_rate
+
+    def compile(self, is_started: bool = True) -> Callable[[list[float]], list[float]]:
+        """
+        Returns the time derivative of the flat state (see `Gun.get_state`), specialized for this gun.
+
+        Parameters
+        ----------
+        is_started: bool
+            whether the projectile has started moving. If not, the derivatives of travel
+            and velocity are zero.
+
+        Notes
+        -----
+        The generic computation, via `Gun.get_average_pressure` and
+        `minimalist_interior_ballistics.charge.Charge.dZdt`, loops over the charges and recomputes
+        the loading density and the incompressible volume of each on every evaluation. Here, all
+        of these charge-invariant coefficients are computed once, and folded into the form function
+        polynomials, such that each evaluation is only arithmetic over plain floats. The burn rate
+        is clamped to that at `minimalist_interior_ballistics.AMBIENT_PRESSURE` as in
+        `minimalist_interior_ballistics.charge.Charge.dZdt`, and the common case of a unitary
+        pressure exponent skips the exponentiation.
+
+        The kernels for either value of `is_started` are cached, as `Gun.compiled_dt` and
+        `Gun.compiled_pre_start_dt`, and are used by all propagation methods of this class.
+        """
+        average_pressure = self.compile_average_pressure()
+        acceleration_coefficient = self.cross_section / (self.phi * self.shot_mass)
+        burn_rates = tuple((charge.reduced_burnrate, charge.pressure_exponent) for charge in self.charges)
+
+        if all(n == 1 for _, n in burn_rates):
+            reduced_burnrates = tuple(r for r, _ in burn_rates)
+
+            def dZs(P: float) -> list[float]:
+                P = P if P > AMBIENT_PRESSURE else AMBIENT_PRESSURE
+                return [r * P for r in reduced_burnrates]
+
+        else:
+
+            def dZs(P: float) -> list[float]:
+                P = P if P > AMBIENT_PRESSURE else AMBIENT_PRESSURE
+                return [r * P**n for r, n in burn_rates]
+
+        if is_started:
+
+            def dt(y: list[float]) -> list[float]:
+                P = average_pressure(y)
+                return [1.0, y[2], acceleration_coefficient * P, *dZs(P)]
+
+        else:
+
+            def dt(y: list[float]) -> list[float]:
+                return [1.0, 0.0, 0.0, *dZs(average_pressure(y))]
+
+        return dt
+
+    def compile_burnup(self) -> Callable[[list[float]], list[float]]:
+        """
+        Returns the derivative of the flat state (see `Gun.get_state`) with respect to the burn-up
+        fraction of the charge, for a started gun loaded with a single charge. This is the time
+        derivative, see `Gun.compile`, divided by that of the burn-up fraction.
+
+        Notes
+        -----
+        For a pressure exponent of unity, the velocity derivative reduces to the constant
+        ```
+        dv/dZ = S / (φ m r)
+        ```
+        i.e. the velocity is a linear function of burn-up, which any Runge-Kutta method reproduces
+        exactly. Only time and travel remain to be integrated numerically.
+        """
+        (charge,) = self.charges
+        average_pressure = self.compiled_average_pressure
+        acceleration_coefficient = self.cross_section / (self.phi * self.shot_mass)
+        r, n = charge.reduced_burnrate, charge.pressure_exponent
+
+        if n == 1:
+            dv = acceleration_coefficient / r
+
+            def dZ(y: list[float]) -> list[float]:
+                P = average_pressure(y)
+                if P > AMBIENT_PRESSURE:
+                    dt = 1 / (r * P)
+                    return [dt, y[2] * dt, dv, 1.0]
+                else:
+                    dt = 1 / (r * AMBIENT_PRESSURE)
+                    return [dt, y[2] * dt, acceleration_coefficient * P * dt, 1.0]
+
+        else:
+
+            def dZ(y: list[float]) -> list[float]:
+                P = average_pressure(y)
+                dt = 1 / (r * (P if P > AMBIENT_PRESSURE else AMBIENT_PRESSURE) ** n)
+                return [dt, y[2] * dt, acceleration_coefficient * P * dt, 1.0]
+
+        return dZ
+
+    @cached_property
+    def compiled_average_pressure(self) -> Callable[[list[float]], float]:
+        return self.compile_average_pressure()
+
+    @cached_property
+    def compiled_pressure_rate(self) -> Callable[[list[float], list[float]], float]:
+        return self.compile_pressure_rate()
+
+    @cached_property
+    def compiled_dt(self) -> Callable[[list[float]], list[float]]:
+        return self.compile(is_started=True)
+
+    @cached_property
+    def compiled_pre_start_dt(self) -> Callable[[list[float]], list[float]]:
+        return self.compile(is_started=False)
+
+    @cached_property
+    def compiled_dZ(self) -> Callable[[list[float]], list[float]]:
+        return self.compile_burnup()
+
+    def dt(self, state: State) -> StateVector:
+        time, travel, velocity, *dZs = self.flat_dt(self.get_flat(state), is_started=state.is_started)
+        return StateVector(time=time, travel=travel, velocity=velocity, burnup_fractions=tuple(dZs))
+
     def dl(self, state: State) -> StateVector:
         # d/dl = d/dt * dt/dl
         # dt / dl = 1/v
@@ -215,7 +487,544 @@ class Gun:
         k4 = df(s_i(k3 * dx, dx, Significance.INTERMEDIATE))
         return s_i((k1 + k2 * 2 + k3 * 2 + k4) * dx / 6, dx, marker)
 
-    def to_start(self, *, n_intg: int = DEFAULT_STEPS, acc: float = DEFAULT_ACC) -> StateList:
+    # The methods below operate on the flat representation of state, a list of floats laid out as
+    # `[time, travel, velocity, Z_1, ..., Z_n]`, such that integration does not need to allocate
+    # `minimalist_interior_ballistics.state.State` objects except for the points that are returned.
+
+    def get_state(self, y: list[float], marker: Significance, is_started: bool = True) -> State:
+        """converts the flat representation of state into a `minimalist_interior_ballistics.state.State`"""
+        time, travel, velocity, *burnup_fractions = y
+        return State(
+            gun=self,
+            sv=StateVector(time=time, travel=travel, velocity=velocity, burnup_fractions=tuple(burnup_fractions)),
+            marker=marker,
+            is_started=is_started,
+        )
+
+    @staticmethod
+    def get_flat(state: State) -> list[float]:
+        """converts a `minimalist_interior_ballistics.state.State` into its flat representation"""
+        return [state.time, state.travel, state.velocity, *state.burnup_fractions]
+
+    def flat_average_pressure(self, y: list[float]) -> float:
+        return self.compiled_average_pressure(y)
+
+    def flat_pressure_rate(self, y: list[float], dy: list[float]) -> float:
+        return self.compiled_pressure_rate(y, dy)
+
+    def flat_is_burnout(self, y: list[float]) -> bool:
+        return all(Z > charge.Z_k for charge, Z in zip(self.charges, y[3:]))
+
+    def flat_dt(self, y: list[float], is_started: bool = True) -> list[float]:
+        return self.compiled_dt(y) if is_started else self.compiled_pre_start_dt(y)
+
+    def flat_pre_start_dt(self, y: list[float]) -> list[float]:
+        return self.compiled_pre_start_dt(y)
+
+    def flat_dl(self, y: list[float]) -> list[float]:
+        dt = self.compiled_dt(y)
+        v = y[2]
+        return [d / v for d in dt]
+
+    def flat_dv(self, y: list[float]) -> list[float]:
+        dt = self.compiled_dt(y)
+        a = dt[2]
+        return [d / a for d in dt]
+
+    @staticmethod
+    def flat_step(
+        f: Callable[[list[float]], list[float]], y: list[float], h: float, integrator: Integrator = Integrator.RK4
+    ) -> list[float]:
+        """takes a single step of size `h`, without error control."""
+        if integrator == Integrator.DOPRI5:
+            y_next, _, _ = dopri5_step(f=f, y=y, h=h)
+            return y_next
+        else:
+            return rk4(f=f, y=y, h=h)
+
+    def flat_step_in_time(
+        self, y: list[float], dt: float, integrator: Integrator = Integrator.RK4, is_started: bool = True
+    ) -> list[float]:
+        f = self.compiled_dt if is_started else self.compiled_pre_start_dt
+        return Gun.flat_step(f=f, y=y, h=dt, integrator=integrator)
+
+    def flat_step_in_travel(self, y: list[float], dl: float, integrator: Integrator = Integrator.RK4) -> list[float]:
+        y_next = Gun.flat_step(f=self.flat_dl, y=y, h=dl, integrator=integrator)
+        y_next[1] = y[1] + dl
+        return y_next
+
+    def flat_step_in_velocity(self, y: list[float], dv: float, integrator: Integrator = Integrator.RK4) -> list[float]:
+        y_next = Gun.flat_step(f=self.flat_dv, y=y, h=dv, integrator=integrator)
+        y_next[2] = y[2] + dv
+        return y_next
+
+    @staticmethod
+    def flat_interpolant(
+        f: Callable[[list[float]], list[float]],
+        y_0: list[float],
+        dy_0: list[float],
+        y_1: list[float],
+        dy_1: list[float],
+        integrator: Integrator = Integrator.RK4,
+    ) -> Callable[[float], list[float]]:
+        """
+        Dense output on a step in time from flat state `y_0` to `y_1`, where the respective time
+        derivatives, as evaluated by `f`, are `dy_0` and `dy_1`. Returns the interpolated flat state
+        as a function of time.
+
+        For `minimalist_interior_ballistics.Integrator.RK4`, this is the cubic Hermite interpolant,
+        see `minimalist_interior_ballistics.num.hermite`, and costs nothing to construct. For
+        `minimalist_interior_ballistics.Integrator.DOPRI5`, the step is repeated to recover the
+        native, fourth-order accurate interpolant, see `minimalist_interior_ballistics.num.dopri5_dense`.
+        """
+        if integrator == Integrator.DOPRI5:
+            return dopri5_dense(f=f, x_0=y_0[0], y=y_0, h=y_1[0] - y_0[0], k1=dy_0)
+        else:
+            return hermite(x_0=y_0[0], y_0=y_0, f_0=dy_0, x_1=y_1[0], y_1=y_1, f_1=dy_1)
+
+    @staticmethod
+    def flat_integrate(
+        f: Callable[[list[float]], list[float]],
+        y_0: list[float],
+        stop: Callable[[list[float]], bool],
+        integrator: Integrator = Integrator.RK4,
+        acc: float = DEFAULT_ACC,
+        n_intg: int = 0,
+        delta_t: float = MAX_DT,
+    ) -> Tuple[list[list[float]], list[list[float]]]:
+        """
+        Integrates in time from `y_0` until `stop` is satisfied.
+
+        Parameters
+        ----------
+        f: Callable[[list[float]], list[float]]
+            time derivative of the flat state.
+        y_0: list[float]
+            flat state to start integration from.
+        stop: Callable[[list[float]], bool]
+            integration stops at the first point for which this returns True.
+        integrator: `minimalist_interior_ballistics.Integrator`
+            the integration method.
+        acc: float
+            relative tolerance for the `minimalist_interior_ballistics.Integrator.DOPRI5` method.
+        n_intg: int
+            minimum number of points for the `minimalist_interior_ballistics.Integrator.RK4` methods.
+        delta_t: float
+            (initial) step size.
+
+        Returns
+        -------
+        ys: list[list[float]]
+            the points integrated, beginning with `y_0`. The last point is the first to satisfy
+            `stop`, and is the only one that does.
+        dys: list[list[float]]
+            time derivatives at each of `ys`, such that every step can be interpolated with
+            `Gun.flat_interpolant`. These come at no extra cost as they are needed to start
+            the next step in any case.
+
+        Notes
+        -----
+        For `minimalist_interior_ballistics.Integrator.RK4`, a uniform step of `delta_t` is used.
+        If fewer than `n_intg` points resulted, the elapsed time is divided by `n_intg` as the step
+        size for another run, and this is repeated until at least `n_intg` points were taken.
+
+        For `minimalist_interior_ballistics.Integrator.RK4_SINGLE_PASS`, a run that falls short is
+        kept, and the missing points are inserted by subdividing its steps on the dense output, see
+        `Gun.flat_subdivide`. Only a run of a single step, which leaves no step to subdivide ahead
+        of the last, is repeated as for `minimalist_interior_ballistics.Integrator.RK4`. This costs
+        one evaluation of `f` per point inserted, against four per step for a repeated run, at the
+        price of the accuracy of the step `delta_t` of the first run, as the inserted points are
+        interpolated and not integrated.
+
+        For `minimalist_interior_ballistics.Integrator.DOPRI5`, `delta_t` seeds the step size,
+        which is then controlled so that the local error is within relative tolerance `acc`, and
+        absolute tolerance `acc` squared, on every component. Step size is therefore small where
+        the solution varies rapidly, e.g. around shot start and peak pressure, and no run is
+        repeated, and the step size never exceeds `minimalist_interior_ballistics.MAX_DT`.
+        """
+        if integrator == Integrator.DOPRI5:
+            ys, dys, y, k, h = [], [], y_0, f(y_0), min(delta_t, MAX_DT)
+            while not stop(y):
+                ys.append(y)
+                dys.append(k)
+                _, y, k, h = dopri5(f=f, y=y, h=h, rtol=acc, atol=acc**2, k1=k, h_max=MAX_DT)
+
+            ys.append(y)
+            dys.append(k)
+            return ys, dys
+
+        k_0 = f(y_0)
+        while True:
+            ys, dys, y_next, k_next = [], [], y_0, k_0
+            while not stop(y_next):
+                ys.append(y_now := y_next)
+                dys.append(k_now := k_next)
+                y_next = rk4(f=f, y=y_now, h=delta_t, k1=k_now)
+                k_next = f(y_next)
+
+            if len(ys) >= n_intg:
+                ys.append(y_next)
+                dys.append(k_next)
+                return ys, dys
+
+            if integrator == Integrator.RK4_SINGLE_PASS and len(ys) > 1:
+                ys.append(y_next)
+                dys.append(k_next)
+                return Gun.flat_subdivide(f=f, ys=ys, dys=dys, n_intg=n_intg)
+
+            delta_t = (y_next[0] - y_0[0]) / n_intg
+
+    @staticmethod
+    def flat_subdivide(
+        f: Callable[[list[float]], list[float]], ys: list[list[float]], dys: list[list[float]], n_intg: int
+    ) -> Tuple[list[list[float]], list[list[float]]]:
+        """
+        Inserts points into the steps of a run returned by `Gun.flat_integrate`, until at least
+        `n_intg` points precede the last. The inserted points are spaced uniformly within each
+        step, and are spread as evenly as possible among the steps, except the last which is left
+        intact for event location. They are interpolated by `Gun.flat_interpolant`, so that only
+        their derivative has to be evaluated.
+        """
+        n_steps = len(ys) - 2
+        n_missing = n_intg - (len(ys) - 1)
+        if n_missing <= 0 or n_steps <= 0:
+            return ys, dys
+
+        ys_sub, dys_sub = [], []
+        for i in range(n_steps):
+            y_0, dy_0, y_1, dy_1 = ys[i], dys[i], ys[i + 1], dys[i + 1]
+            ys_sub.append(y_0)
+            dys_sub.append(dy_0)
+
+            n_insert = n_missing // n_steps + (i < n_missing % n_steps)
+            if n_insert:
+                y_at_time = Gun.flat_interpolant(f=f, y_0=y_0, dy_0=dy_0, y_1=y_1, dy_1=dy_1)
+                for j in range(1, n_insert + 1):
+                    y = y_at_time(y_0[0] + (y_1[0] - y_0[0]) * j / (n_insert + 1))
+                    ys_sub.append(y)
+                    dys_sub.append(f(y))
+
+        ys_sub.extend(ys[-2:])
+        dys_sub.extend(dys[-2:])
+        return ys_sub, dys_sub
+
+    def flat_integrate_in_burnup(
+        self, y_0: list[float], stop: Callable[[list[float]], bool], n_intg: int = DEFAULT_STEPS
+    ) -> Tuple[list[list[float]], list[list[float]]]:
+        """
+        Integrates in the burn-up fraction of the single charge, from `y_0` up to burnout, see
+        `Gun.compile_burnup`.
+
+        Parameters
+        ----------
+        y_0: list[float]
+            flat state of the started gun to integrate from.
+        stop: Callable[[list[float]], bool]
+            integration stops early at the first point for which this returns True.
+        n_intg: int
+            number of steps to be taken up to burnout.
+
+        Returns
+        -------
+        ys, dys: list[list[float]]
+            the points integrated, beginning with `y_0`, and their derivatives with respect to
+            the burn-up fraction, as in `Gun.flat_integrate`. Unless stopped early, the last point
+            is exactly at burnout.
+
+        Notes
+        -----
+        Unlike integration in time, the interval to be integrated over is known beforehand, so
+        the classic 4th order Runge-Kutta method is applied in a single run of `n_intg` steps. The
+        `i`-th point is placed at a burn-up of `Z_0 + (Z_k - Z_0) * (i / n_intg) ^ 2`, i.e. the steps
+        are graded towards shot start, where the pressure, and hence every derivative, changes
+        most rapidly with burn-up. On the single-charge test gun, this reduces the error in time
+        and travel to burnout twenty-fold over uniform steps, at `n_intg = 10`. If the form function
+        fractures before burnout, that is, `minimalist_interior_ballistics.form_function.FormFunction.Z_k`
+        exceeds unity, the steps are divided between either side of fracture in proportion, with
+        uniform steps past fracture, such that the form function is smooth over each step.
+        """
+        f = self.compiled_dZ
+        Z_0, Z_k = y_0[3], self.charges[0].Z_k
+
+        if Z_0 < 1 < Z_k:
+            n_intg = max(n_intg, 2)
+            n_pre = min(max(round(n_intg * (1 - Z_0) / (Z_k - Z_0)), 1), n_intg - 1)
+            Zs = [Z_0 + (1 - Z_0) * (i / n_pre) ** 2 for i in range(1, n_pre)]
+            Zs.extend(1 + (Z_k - 1) * i / (n_intg - n_pre) for i in range(n_intg - n_pre))
+        else:
+            Zs = [Z_0 + (Z_k - Z_0) * (i / n_intg) ** 2 for i in range(1, n_intg)]
+        Zs.append(Z_k)
+
+        ys, dys = [y_0], [f(y_0)]
+        for Z in Zs:
+            y = rk4(f=f, y=ys[-1], h=Z - ys[-1][3], k1=dys[-1])
+            y[3] = Z
+            ys.append(y)
+            dys.append(f(y))
+            if stop(y):
+                break
+
+        return ys, dys
+
+    def flat_max_pressure_in_burnup(
+        self,
+        ys: list[list[float]],
+        dys: list[list[float]],
+        acc: float,
+        peak_finder: PeakFinder = PeakFinder.ANALYTIC,
+    ) -> list[float]:
+        """
+        Returns the flat state at maximum pressure, among points integrated by
+        `Gun.flat_integrate_in_burnup`. As in `Gun.mark_max_pressure`, this is located by
+        `Gun.flat_locate_max_pressure` on the dense output of the steps on either side of the
+        highest pressure point, here to `acc` times the burn-up fraction integrated.
+        """
+        if len(ys) == 1:
+            return ys[0]
+
+        pressures = [self.flat_average_pressure(y) for y in ys]
+        j = pressures.index(max(pressures))
+        i, k = max(j - 1, 0), min(j + 1, len(ys) - 1)
+
+        y_at_Z_ij = hermite(x_0=ys[i][3], y_0=ys[i], f_0=dys[i], x_1=ys[j][3], y_1=ys[j], f_1=dys[j])
+        y_at_Z_jk = hermite(x_0=ys[j][3], y_0=ys[j], f_0=dys[j], x_1=ys[k][3], y_1=ys[k], f_1=dys[k])
+
+        def y_at_Z(Z: float) -> list[float]:
+            if Z < ys[j][3] or j == k:
+                return y_at_Z_ij(Z)
+            else:
+                return y_at_Z_jk(Z)
+
+        Z_p_max = self.flat_locate_max_pressure(
+            f=self.compiled_dZ,
+            y_at=y_at_Z,
+            ys=(ys[i], ys[j], ys[k]),
+            dys=(dys[i], dys[j], dys[k]),
+            index=3,
+            tol=acc * (ys[-1][3] - ys[0][3]),
+            peak_finder=peak_finder,
+        )
+        return y_at_Z(Z_p_max)
+
+    def flat_locate_max_pressure(
+        self,
+        f: Callable[[list[float]], list[float]],
+        y_at: Callable[[float], list[float]],
+        ys: Tuple[list[float], list[float], list[float]],
+        dys: Tuple[list[float], list[float], list[float]],
+        index: int,
+        tol: float,
+        peak_finder: PeakFinder = PeakFinder.ANALYTIC,
+    ) -> float:
+        """
+        Locates the maximum average pressure on the dense output `y_at` of two consecutive
+        steps, given as the points `ys` and their derivatives `dys` as evaluated by `f`, the
+        middle point being the one of highest pressure. The steps are taken in the `index`-th
+        component of the flat state, i.e. 0 for time and 3 for the burn-up fraction. Returns
+        the value of that component at maximum pressure, to within `tol`.
+
+        Notes
+        -----
+        For `minimalist_interior_ballistics.PeakFinder.ANALYTIC`, the root of the pressure rate
+        (see `Gun.compile_pressure_rate`) is found using `minimalist_interior_ballistics.num.dekker`
+        on the step over which it changes sign. The rates at the points come from the known
+        derivatives, and each probe costs one evaluation of `f`. This converges super-linearly
+        and typically needs 3 to 5 probes. Where the rate does not change sign, such as when
+        the maximum is at either end of a trajectory, or `dekker` fails to converge, this falls
+        back to `minimalist_interior_ballistics.PeakFinder.BRENT`.
+
+        For `minimalist_interior_ballistics.PeakFinder.GOLDEN_SECTION`, the maximum of average
+        pressure across both steps is found by `minimalist_interior_ballistics.num.gss_max`,
+        where each probe costs no evaluation of `f`, but the interval only shrinks by a constant
+        ratio of 0.618 per probe. `minimalist_interior_ballistics.PeakFinder.BRENT` instead uses
+        `minimalist_interior_ballistics.num.brent_max`, which also costs no evaluation of `f`,
+        and steps to the vertex of a parabola through the best probes where it can.
+        """
+        (y_i, y_j, y_k), (dy_i, dy_j, dy_k) = ys, dys
+        x_i, x_j, x_k = y_i[index], y_j[index], y_k[index]
+
+        if peak_finder == PeakFinder.ANALYTIC:
+            rate_j = self.flat_pressure_rate(y_j, dy_j)
+            known_rates = {
+                x_i: self.flat_pressure_rate(y_i, dy_i),
+                x_j: rate_j,
+                x_k: self.flat_pressure_rate(y_k, dy_k),
+            }
+
+            def pressure_rate(x: float) -> float:
+                if x in known_rates:
+                    return known_rates[x]
+                y = y_at(x)
+                return self.flat_pressure_rate(y, f(y))
+
+            try:
+                x_p_max, _ = dekker(f=pressure_rate, x_0=x_j, x_1=x_k if rate_j > 0 else x_i, tol=tol)
+                return x_p_max
+            except ValueError:
+                pass
+
+        def average_pressure(x: float) -> float:
+            return self.flat_average_pressure(y_at(x))
+
+        if peak_finder == PeakFinder.GOLDEN_SECTION:
+            return 0.5 * sum(gss_max(f=average_pressure, x_0=x_i, x_1=x_k, tol=tol))
+
+        x_p_max, _ = brent_max(f=average_pressure, x_0=x_i, x_1=x_k, tol=tol)
+        return x_p_max
+
+    def flat_to_burnout_in_burnup(
+        self,
+        *,
+        n_intg: int,
+        acc: float,
+        abort_velocity: float = inf,
+        abort_travel: float = inf,
+        stop: Optional[Callable[[list[float]], bool]] = None,
+    ) -> Optional[Tuple[list[list[float]], list[list[float]], bool]]:
+        """
+        Integrates from shot start up to burnout, or the abort point, by
+        `Gun.flat_integrate_in_burnup`. Returns the points integrated and their derivatives,
+        the last of which is at burnout or the abort point, and whether the run was aborted. The
+        abort point is located by `minimalist_interior_ballistics.num.dekker` on the dense output
+        of the last step, to `acc` squared times the burn-up fraction integrated, as this costs
+        no evaluation of the derivative. If `stop` is supplied, the points are cut at the first
+        that satisfies it, which is then the last point returned and is not located further.
+
+        Returns None where the run cannot be trusted to `acc`, for the caller to integrate in time
+        instead.
+
+        Notes
+        -----
+        The steps are fixed in burn-up fraction, so that a step spanning a small change in burn-up
+        may span a long stretch of time and travel, e.g. where the charge burns too slowly to burn
+        out before the muzzle, and nothing bounds its error. Therefore, a first run is taken with
+        half of `n_intg` steps, and the number of steps doubled for every next run. A run is
+        accepted where it has at least `n_intg` steps up to its last point, time increases and travel
+        does not decrease over each of its steps, and the time, travel and velocity at its last point
+        agree with that of the previous run to within `acc`, relatively. This is given up after
+        `minimalist_interior_ballistics.MAX_BURNUP_REFINEMENTS` runs past the one of `n_intg` steps.
+        """
+        start_state = self.get_start_state(n_intg=n_intg, acc=acc)
+        y_0 = [0.0, 0.0, 0.0, *start_state.burnup_fractions]
+
+        def abort(y: list[float]) -> bool:
+            return y[1] > abort_travel or y[2] > abort_velocity
+
+        def is_monotonic(ys: list[list[float]]) -> bool:
+            return all(y_j[0] > y_i[0] and y_j[1] >= y_i[1] for y_i, y_j in zip(ys, ys[1:]))
+
+        y_last = None
+        n = max(-(-n_intg // 2), 1)
+        while n <= n_intg << MAX_BURNUP_REFINEMENTS:
+            ys, dys = self.flat_integrate_in_burnup(y_0=y_0, stop=abort, n_intg=n)
+            n *= 2
+            is_abort = abort(ys[-1])
+            if is_abort:
+                y_at_Z = hermite(x_0=ys[-2][3], y_0=ys[-2], f_0=dys[-2], x_1=ys[-1][3], y_1=ys[-1], f_1=dys[-1])
+
+                def Z_abort(Z: float) -> float:
+                    y = y_at_Z(Z)
+                    return max(y[1] - abort_travel, y[2] - abort_velocity)
+
+                try:
+                    Z_end = max(dekker(f=Z_abort, x_0=ys[-2][3], x_1=ys[-1][3], tol=(ys[-1][3] - ys[0][3]) * acc**2))
+                except ValueError:
+                    y_last = None
+                    continue
+                ys[-1] = y_at_Z(Z_end)
+                dys[-1] = self.compiled_dZ(ys[-1])
+
+            if not is_monotonic(ys):
+                y_last = None
+                continue
+
+            is_converged = y_last is not None and all(abs(y - z) <= acc * abs(z) for y, z in zip(ys[-1][:3], y_last))
+            y_last = ys[-1][:3]
+            if is_converged and len(ys) > n_intg:
+                break
+        else:
+            return None
+
+        if stop is not None:
+            i = next((i for i, y in enumerate(ys) if stop(y)), len(ys) - 1)
+            ys, dys, is_abort = ys[: i + 1], dys[: i + 1], is_abort and i == len(ys) - 1
+        return ys, dys, is_abort
+
+    @cached_property
+    def pre_start_key(self) -> tuple:
+        """
+        The parameters that determine the pre-start phase (see `Gun.to_start`), in time normalized by
+        `Gun.pre_start_time_scale`. Before the projectile moves, the pressure is the gas energy over the
+        free volume of the chamber, hence the cross section, shot mass and losses are irrelevant. Since
+        this pressure depends only on the burn-up fractions, scaling the reduced burn rate of every
+        charge by a common factor only rescales time, hence the reduced burn rates are kept only as
+        ratios to that of the first charge, rounded to 12 significant figures such that the ratios
+        passed in by e.g. `minimalist_interior_ballistics.problem.BaseProblem.get_gun_at_pressure`
+        compare equal regardless of rounding in the product.
+        """
+        return (
+            self.chamber_volume,
+            self.start_pressure,
+            tuple(
+                evolve(charge, reduced_burnrate=float(f"{charge.reduced_burnrate / self.pre_start_time_scale:.12g}"))
+                for charge in self.charges
+            ),
+            tuple(self.charge_masses),
+        )
+
+    @cached_property
+    def pre_start_time_scale(self) -> float:
+        """The reduced burn rate of the first charge, by which time is normalized in `Gun.start_cache`."""
+        return self.charges[0].reduced_burnrate
+
+    @staticmethod
+    def flat_rescale_time(
+        ys: Iterable[list[float]], y: list[float], factor: float
+    ) -> Tuple[Tuple[list[float], ...], list[float]]:
+        """Multiplies the time of the flat points `ys` and `y` by `factor`."""
+        return tuple([y_i[0] * factor, *y_i[1:]] for y_i in ys), [y[0] * factor, *y[1:]]
+
+    def to_start(
+        self, *, n_intg: int = DEFAULT_STEPS, acc: float = DEFAULT_ACC, integrator: Integrator = Integrator.RK4
+    ) -> StateList:
+        """
+        Computes the combustion of the charge in the closed chamber, from ignition up to the shot
+        start point, where the average pressure reaches `Gun.start_pressure`.
+
+        Parameters
+        ----------
+        n_intg, acc, integrator:
+            see documentation for `Gun.to_burnout`.
+
+        Returns
+        -------
+        list of `minimalist_interior_ballistics.state.State`, of which the first is marked by
+        `minimalist_interior_ballistics.Significance.IGNITION` and the last by
+        `minimalist_interior_ballistics.Significance.START`.
+
+        Raises
+        ------
+        ValueError
+            if the bomb pressure is insufficient to start the projectile.
+
+        Notes
+        -----
+        The result is memoized in `Gun.start_cache`, a `minimalist_interior_ballistics.cache.LRUCache`,
+        keyed by `Gun.pre_start_key`, `n_intg`, `acc` and `integrator`, such that the pre-start phase
+        is computed only once per distinct gun, however many times `Gun.to_burnout`, `Gun.to_travel` or
+        `Gun.get_start_state` is called. As the entries are stored in normalized time, and rescaled on
+        lookup, guns that differ only by a common factor on the reduced burn rates, e.g. those tried by
+        `minimalist_interior_ballistics.problem.BaseProblem.get_gun_at_pressure`, share the same entry.
+        When the pre-start phase is integrated in time, the points returned on a hit are then those of
+        the gun that was first computed, rescaled, which are of the same accuracy. The cache is enabled
+        by default, and can be switched off with `Gun.start_cache.disable()`, while
+        `Gun.start_cache.info()` reports hit/miss statistics.
+
+        Unless charges of differing pressure exponents are loaded together, the shot start point is
+        solved for directly, with the time taken from a one-dimensional integral, see
+        `Gun.flat_to_start_by_quadrature`, in which case `n_intg` and `integrator` have no effect,
+        and only the ignition and the shot start point are returned.
+        """
         # sanity check: maximum possible pressure developed is higher than start:
         if self.get_bomb_state().average_pressure < self.start_pressure:
             raise ValueError(
@@ -223,53 +1032,140 @@ class Gun:
  insufficient to overcome starting resistance."
             )
 
-        initial_state = State(
-            gun=self,
-            sv=StateVector(time=0.0, travel=0.0, velocity=0.0, burnup_fractions=tuple(0 for _ in self.charges)),
-            marker=Significance.IGNITION,
-            is_started=False,
+        scale = self.pre_start_time_scale
+        ys, y_start = Gun.flat_rescale_time(
+            *Gun.start_cache.get_or_compute(
+                (self.pre_start_key, n_intg, acc, integrator),
+                lambda: Gun.flat_rescale_time(
+                    *self.flat_to_start(n_intg=n_intg, acc=acc, integrator=integrator), factor=scale
+                ),
+            ),
+            factor=1 / scale,
         )
 
-        delta_t, rough_ttb = MAX_DT, 0.0
-        states = StateList()
+        states = StateList.from_flat(
+            self,
+            ys,
+            markers=(Significance.STEP if i else Significance.IGNITION for i in range(len(ys))),
+            is_started=False,
+        )
+        states.append_flat(self, y_start, marker=Significance.START, is_started=False)
 
-        s_now = s_next = initial_state
+        return states
 
-        while len(states) < n_intg:
-            if rough_ttb > 0:
-                delta_t = rough_ttb / n_intg
+    def flat_to_start(
+        self, *, n_intg: int = DEFAULT_STEPS, acc: float = DEFAULT_ACC, integrator: Integrator = Integrator.RK4
+    ) -> Tuple[Tuple[list[float], ...], list[float]]:
+        """
+        Uncached computation behind `Gun.to_start`, returning the flat points before shot start,
+        and the flat shot start point. Dispatches to `Gun.flat_to_start_by_quadrature` if all
+        charges share the same pressure exponent, and to `Gun.flat_to_start_by_integration`
+        otherwise.
+        """
+        if len({charge.pressure_exponent for charge in self.charges}) == 1:
+            return self.flat_to_start_by_quadrature(acc=acc)
+        else:
+            return self.flat_to_start_by_integration(n_intg=n_intg, acc=acc, integrator=integrator)
 
-            s_next = initial_state
-            states = StateList([s_next])
+    def flat_to_start_by_integration(
+        self, *, n_intg: int = DEFAULT_STEPS, acc: float = DEFAULT_ACC, integrator: Integrator = Integrator.RK4
+    ) -> Tuple[Tuple[list[float], ...], list[float]]:
+        """
+        Integrates the pre-start phase in time, returning the flat points integrated before shot
+        start, and the flat shot start point, which is located on the interpolant of the last step.
+        """
+        ys, dys = Gun.flat_integrate(
+            f=self.compiled_pre_start_dt,
+            y_0=[0.0, 0.0, 0.0, *(0.0 for _ in self.charges)],
+            stop=lambda y: self.flat_average_pressure(y) >= self.start_pressure,
+            integrator=integrator,
+            acc=acc,
+            n_intg=n_intg,
+        )
+        y_at_time = Gun.flat_interpolant(self.compiled_pre_start_dt, ys[-2], dys[-2], ys[-1], dys[-1], integrator)
 
-            while s_next.average_pressure < self.start_pressure:
-                states.append(s_now := s_next)
-                s_next = self.propagate_rk4_in_time(s_now, dt=delta_t)
+        start_time, _ = dekker(
+            f=lambda t: self.flat_average_pressure(y_at_time(t)) - self.start_pressure,
+            x_0=ys[-2][0],
+            x_1=ys[-1][0],
+            tol=ys[-1][0] * acc,
+        )
 
-            rough_ttb = s_next.time
+        return tuple(ys[:-1]), y_at_time(start_time)
 
-        def state_at_time(time: float, marker: Significance = Significance.INTERMEDIATE) -> State:
-            return self.propagate_rk4_in_time(s_now, dt=time - s_now.time, marker=marker)
+    def flat_to_start_by_quadrature(self, *, acc: float = DEFAULT_ACC) -> Tuple[Tuple[list[float], ...], list[float]]:
+        """
+        Solves for the shot start point without time stepping, for charges that share the same
+        pressure exponent. Returns the flat ignition point, and the flat shot start point.
 
-        start_time, _ = dekker(
-            f=lambda t: state_at_time(t).average_pressure - self.start_pressure,
-            x_0=s_now.time,
-            x_1=s_next.time,
-            tol=rough_ttb * acc,
-        )
+        Notes
+        -----
+        Before shot start, the projectile is stationary, and each charge burns as
+        ```
+        dZ_i/dt = r_i * max(P, P_a)^n
+        ```
+        where `P_a` is `minimalist_interior_ballistics.AMBIENT_PRESSURE`. Introducing the variable
+        `s` by `ds/dt = max(P, P_a)^n`, it follows that `Z_i = r_i * s`, hence the average pressure
+        `P(s)` is a closed form function of `s` alone, see `Gun.compile_average_pressure`. The
+        shot start point is then found as the root of `P(s) = start_pressure` with
+        `minimalist_interior_ballistics.num.dekker`, and the time from the one-dimensional integral
+        ```
+                 s_a             s_start
+        t = ∫ ds / P_a^n + ∫ ds / P(s)^n
+                 0                 s_a
+        ```
+        where `P(s_a) = P_a`, the second term of which is taken with
+        `minimalist_interior_ballistics.num.intg`. As the pressure is nearly proportional to `s` at
+        first, both the root finding and the integral are done in terms of `log(s)`, where the
+        functions involved are nearly linear. Both are solved to the tolerance `acc`.
+        """
+        n = self.charges[0].pressure_exponent
+        reduced_burnrates = tuple(charge.reduced_burnrate for charge in self.charges)
+        x_max = log(max(charge.Z_k / r for charge, r in zip(self.charges, reduced_burnrates)))
+        x_min = x_max - 50  # pressure is near proportional to s, thus practically nil here.
+
+        def y_at(x: float) -> list[float]:
+            s = exp(x)
+            return [0.0, 0.0, 0.0, *(r * s for r in reduced_burnrates)]
+
+        def solve(pressure: float) -> float:
+            x, _ = dekker(
+                f=lambda x: log(self.flat_average_pressure(y_at(x)) / pressure), x_0=x_min, x_1=x_max, tol=acc
+            )
+            return x
 
-        s_start = state_at_time(time=start_time, marker=Significance.START)
-        states.append(s_start)
+        x_start = solve(self.start_pressure)
+        if self.start_pressure <= AMBIENT_PRESSURE:
+            start_time = exp(x_start) / AMBIENT_PRESSURE**n
+        else:
+            x_ambient = solve(AMBIENT_PRESSURE)
+            rest_time, _ = intg(
+                f=lambda x: exp(x) / self.flat_average_pressure(y_at(x)) ** n, l=x_ambient, u=x_start, tol=acc
+            )
+            start_time = exp(x_ambient) / AMBIENT_PRESSURE**n + rest_time
 
-        return states
+        y_start = y_at(x_start)
+        y_start[0] = start_time
+        return ([0.0 for _ in y_start],), y_start
 
     def get_velocity_post_burnout(self, *, burnout_state: State, travel: float) -> float:
+        return self.compile_velocity_post_burnout(burnout_state=burnout_state)(travel)
+
+    def compile_velocity_post_burnout(self, *, burnout_state: State) -> Callable[[float], float]:
+        """
+        Returns the velocity past burnout as a function of travel, see `Gun.get_velocity_post_burnout`,
+        with the coefficients that depend only on the burnout point computed once.
+        """
         l_k, v_k = burnout_state.travel, burnout_state.velocity
         l_1 = self.l_0 * (1 - self.incompressible_fraction(tuple(1 for _ in self.charges)))
         v_j = self.asymptotic_velocity
         theta = self.theta
+        c = 1 - (v_k / v_j) ** 2
+
+        def velocity(travel: float) -> float:
+            return (1 - c / ((l_1 + travel) / (l_1 + l_k)) ** theta) ** 0.5 * v_j
 
-        return (1 - (1 - (v_k / v_j) ** 2) / ((l_1 + travel) / (l_1 + l_k)) ** theta) ** 0.5 * v_j
+        return velocity
 
     def get_travel_post_burnout(self, *, burnout_state: State, velocity: float) -> float:
         l_k, v_k = burnout_state.travel, burnout_state.velocity
@@ -279,12 +1175,368 @@ class Gun:
 
         return (l_1 + l_k) * ((1 - (velocity / v_j) ** 2) / (1 - (v_k / v_j) ** 2)) ** (-1 / theta) - l_1
 
+    def flat_iter_trajectory(
+        self,
+        until: Significance = Significance.MUZZLE,
+        travel: Optional[float] = None,
+        velocity: Optional[float] = None,
+        n_intg: int = DEFAULT_STEPS,
+        acc: float = DEFAULT_ACC,
+        abort_velocity: float = inf,
+        abort_travel: float = inf,
+        integrator: Integrator = Integrator.RK4,
+        stop: Optional[Callable[[list[float]], bool]] = None,
+        n_adiabat: Optional[int] = None,
+        peak_finder: PeakFinder = PeakFinder.ANALYTIC,
+    ) -> Iterator[Tuple[list[float], Significance]]:
+        """
+        Generates the trajectory from shot start, as flat states (see `Gun.get_state`) paired
+        with their marker, in order of time. See `Gun.iter_trajectory` for the parameters, except
+        that `stop` is evaluated on the flat state.
+
+        Notes
+        -----
+        The trajectory is generated by segment. Up to burnout (or abort), the points are
+        integrated in one run, by `Gun.flat_integrate` or, with
+        `minimalist_interior_ballistics.Integrator.BURNUP` and a gun loaded with a single charge
+        of unit pressure exponent, by `Gun.flat_to_burnout_in_burnup`, as the step size is only
+        settled once the run is complete. Where the latter gives up, the gun is integrated in time
+        with `minimalist_interior_ballistics.Integrator.RK4` instead. The peak pressure point is
+        found among them, by `Gun.flat_max_pressure`, and the segment is yielded with it inserted.
+        Where the segment is cut short by `stop` or an abort criterion, the peak is only marked if
+        the pressure is falling by its last point, as it is not reached otherwise. Only when the
+        generator is advanced past burnout is the remainder of the trajectory up to the muzzle
+        integrated.
+
+        Where the muzzle is defined by `velocity`, it is reached by a single step in velocity,
+        see `Gun.flat_step_in_velocity`, from the last point before the velocity is exceeded, as
+        it is by a step in travel otherwise. Past burnout, the travel to that velocity is
+        estimated by `Gun.get_travel_post_burnout` to size the steps, and with
+        `minimalist_interior_ballistics.Integrator.BURNUP`, the muzzle is placed there directly.
+
+        Past burnout, with `n_adiabat` supplied, or with `minimalist_interior_ballistics.Integrator.BURNUP`,
+        no step is taken: the points follow from the adiabatic expansion of the propellant gas in
+        closed form, see `Gun.compile_velocity_post_burnout`, and the time to each by integrating
+        the reciprocal of velocity over travel with `minimalist_interior_ballistics.num.gauss_legendre`.
+        """
+        if until == Significance.MUZZLE:
+            if velocity is not None:
+                travel = None
+                if velocity >= self.asymptotic_velocity:
+                    raise ValueError(
+                        f"velocity {velocity:.1f} m/s cannot be achieved, as it is not below the asymptotic"
+                        + f" velocity {self.asymptotic_velocity:.1f} m/s."
+                    )
+            else:
+                travel = travel or self.travel
+                if not travel:
+                    raise ValueError("travel must be supplied either as a parameter or during instance instantiation")
+        elif until == Significance.BURNOUT:
+            travel, velocity = None, None
+        else:
+            raise ValueError(f"trajectory can only be generated until {Significance.BURNOUT} or {Significance.MUZZLE}")
+
+        is_stop = stop or (lambda _: False)
+        end_travel = abort_travel if travel is None else min(abort_travel, travel)
+        end_velocity = abort_velocity if velocity is None else min(abort_velocity, velocity)
+
+        def is_abort(y: list[float]) -> bool:
+            return y[1] > end_travel or y[2] > end_velocity
+
+        def is_at_muzzle(y: list[float]) -> bool:
+            # whether the projectile reached the muzzle before any abort condition is met.
+            if travel is not None:
+                return travel <= abort_travel and y[1] - end_travel >= y[2] - end_velocity
+            if velocity is not None:
+                return velocity <= abort_velocity and y[2] - end_velocity >= y[1] - end_travel
+            return False
+
+        def is_past_muzzle(y: list[float]) -> bool:
+            return y[1] >= travel if travel is not None else y[2] >= velocity
+
+        def step_to_muzzle(y: list[float]) -> list[float]:
+            if travel is not None:
+                return self.flat_step_in_travel(y, dl=travel - y[1], integrator=integrator)
+            return self.flat_step_in_velocity(y, dv=velocity - y[2], integrator=integrator)
+
+        def has_peak(ys: list[list[float]], dys: list[list[float]], end: Optional[Significance]) -> bool:
+            # a segment cut short by `stop` or an abort only holds the peak if the pressure falls by its end.
+            return bool(ys) and (end is not None or self.flat_pressure_rate(ys[-1], dys[-1]) < 0)
+
+        burnup_run = None
+        if integrator == Integrator.BURNUP:
+            integrator = Integrator.RK4
+            if len(self.charges) == 1 and self.charges[0].pressure_exponent == 1:
+                burnup_run = self.flat_to_burnout_in_burnup(
+                    n_intg=n_intg, acc=acc, abort_velocity=end_velocity, abort_travel=end_travel, stop=stop
+                )
+        is_burnup = burnup_run is not None
+
+        y_muzzle = None
+        if is_burnup:
+            f = self.compiled_dZ
+            ys, dys, is_end_abort = burnup_run
+            if is_stop(ys[0]):
+                return
+            if is_stop(ys[-1]):
+                end = None
+            elif not is_end_abort:
+                end = Significance.BURNOUT
+            elif is_at_muzzle(ys[-1]):
+                end = Significance.MUZZLE
+                if travel is not None:
+                    ys[-1][1] = travel
+                else:
+                    ys[-1][2] = velocity
+            else:
+                end = None
+
+            if end is None:
+                ys, dys = ys[:-1], dys[:-1]
+            markers = [Significance.STEP for _ in ys]
+            if end:
+                markers[-1] = end
+            y_peak = (
+                self.flat_max_pressure_in_burnup(ys, dys, acc=acc, peak_finder=peak_finder)
+                if has_peak(ys, dys, end)
+                else None
+            )
+
+        else:
+            f = self.compiled_dt
+            start_state = self.get_start_state(n_intg=n_intg, acc=acc, integrator=integrator)
+            y_0 = [0.0, 0.0, 0.0, *start_state.burnup_fractions]
+            if is_stop(y_0):
+                # nothing to integrate, and `Gun.flat_integrate` would never accept a run.
+                return
+            ys, dys = Gun.flat_integrate(
+                f=f,
+                y_0=y_0,
+                stop=lambda y: self.flat_is_burnout(y) or is_abort(y) or is_stop(y),
+                integrator=integrator,
+                acc=acc,
+                n_intg=n_intg,
+            )
+            end, y_end = None, None
+            if not is_stop(ys[-1]):
+                y_at_time = Gun.flat_interpolant(f, ys[-2], dys[-2], ys[-1], dys[-1], integrator)
+
+                def burnout_margin(y: list[float]) -> float:
+                    return min(Z - charge.Z_k for charge, Z in zip(self.charges, y[3:]))
+
+                def time_end(time: float) -> float:
+                    # positive if and only if burnout or abort condition is met.
+                    y = y_at_time(time)
+                    return max(burnout_margin(y), y[1] - end_travel, y[2] - end_velocity)
+
+                end_time = max(dekker(f=time_end, x_0=ys[-2][0], x_1=ys[-1][0], tol=ys[-1][0] * acc))
+                y_end = y_at_time(end_time)
+                if time_end(end_time) >= 0:
+                    if is_abort(y_end) or burnout_margin(y_end) < 0:
+                        # abort prioritized in case of both abort and burnout, and met exactly otherwise.
+                        if is_at_muzzle(y_end):
+                            # the muzzle is reached from the last point, see below.
+                            end = Significance.MUZZLE
+                    else:
+                        end = Significance.BURNOUT
+
+            ys, dys = ys[:-1], dys[:-1]
+            markers = [Significance.STEP for _ in ys]
+            if end == Significance.BURNOUT:
+                # the interpolant spans the kink at burnout, so the state is stepped to the time located on
+                # it, and moved along its derivative by a Newton step on the charge burning out last.
+                m = min(range(len(self.charges)), key=lambda m: y_end[3 + m] - self.charges[m].Z_k)
+                y_end = Gun.flat_step(f, ys[-1], h=end_time - ys[-1][0], integrator=integrator)
+                dy_end = f(y_end)
+                dt = (self.charges[m].Z_k - y_end[3 + m]) / dy_end[3 + m]
+                y_end = [y + d * dt for y, d in zip(y_end, dy_end)]
+                ys.append(y_end)
+                dys.append(f(y_end))
+                markers.append(Significance.BURNOUT)
+            elif end == Significance.MUZZLE:
+                y_muzzle = step_to_muzzle(ys[-1])
+
+            y_peak = (
+                self.flat_max_pressure(
+                    f, ys, dys, tol=acc * (ys[-1][0] - ys[0][0]), integrator=integrator, peak_finder=peak_finder
+                )
+                if has_peak(ys, dys, end)
+                else None
+            )
+
+        if not ys:
+            return
+        markers[0] = Significance.START
+
+        # yield the segment up to burnout, with the peak pressure point inserted in order of time.
+        for y, marker in zip(ys, markers):
+            if y_peak and y_peak[0] < y[0]:
+                yield y_peak, Significance.PEAK_PRESSURE
+                y_peak = None
+            yield y, marker
+        if y_peak:
+            yield y_peak, Significance.PEAK_PRESSURE
+
+        if y_muzzle and not is_stop(y_muzzle):
+            yield y_muzzle, Significance.MUZZLE
+        if end != Significance.BURNOUT or (travel is None and velocity is None):
+            return
+
+        y = ys[-1]
+        if is_burnup or n_adiabat is not None:
+            if not is_past_muzzle(y):
+                burnout_state = self.get_state(y, Significance.BURNOUT)
+                velocity_at = self.compile_velocity_post_burnout(burnout_state=burnout_state)
+                if travel is not None:
+                    l_muzzle, v_muzzle = travel, velocity_at(travel)
+                else:
+                    l_muzzle = self.get_travel_post_burnout(burnout_state=burnout_state, velocity=velocity)
+                    v_muzzle = velocity
+
+                # the points are spaced uniformly in travel, with the muzzle as the last point,
+                # and the time to each is integrated from the last, over at least `n_intg` panels
+                # in total.
+                n = n_adiabat or 0
+                n_panels = -(-n_intg // (n + 1))
+                time, l_0 = y[0], y[1]
+                for i in range(1, n + 2):
+                    l_1 = y[1] + (l_muzzle - y[1]) * i / (n + 1)
+                    time += gauss_legendre(f=lambda l: 1 / velocity_at(l), l=l_0, u=l_1, n=n_panels)
+                    l_0 = l_1
+                    if i <= n:
+                        y_adiabat = [time, l_1, velocity_at(l_1), *y[3:]]
+                        if is_stop(y_adiabat):
+                            return
+                        yield y_adiabat, Significance.ADIABAT
+
+                y_muzzle = [time, l_muzzle, v_muzzle, *y[3:]]
+            else:
+                y_muzzle = list(y)
+
+        else:
+            if not is_past_muzzle(y):
+                burnout_state = self.get_state(y, Significance.BURNOUT)
+
+                # use the analytical function to estimate mv, or the travel to the velocity.
+                if travel is not None:
+                    l_muzzle = travel
+                    v_muzzle = self.get_velocity_post_burnout(burnout_state=burnout_state, travel=travel)
+                else:
+                    l_muzzle = self.get_travel_post_burnout(burnout_state=burnout_state, velocity=velocity)
+                    v_muzzle = velocity
+                v_burnout = burnout_state.velocity
+
+                # estimate the number of steps needed to be taken
+                v_average = (v_muzzle + v_burnout) * 0.5
+                ttm_est = (l_muzzle - burnout_state.travel) / v_average
+
+                """
+                use a step size that is the greater of
+                > previous step size in the segment up to burnout, including the peak pressure point.
+                > a conservative estimate of the time to muzzle `ttm_est`, divided by `n_intg`.
+                """
+                dt = max((y[0] - ys[0][0]) / (len(ys) + 1), ttm_est / n_intg)
+
+                ys, _ = Gun.flat_integrate(
+                    f=f,
+                    y_0=y,
+                    stop=lambda y_: is_past_muzzle(y_) or is_stop(y_),
+                    integrator=integrator,
+                    acc=acc,
+                    delta_t=dt,
+                )
+                for y in ys[1:-1]:
+                    yield y, Significance.STEP
+                if is_stop(ys[-1]):
+                    return
+                y = ys[-2]
+
+            y_muzzle = step_to_muzzle(y)
+
+        if not is_stop(y_muzzle):
+            yield y_muzzle, Significance.MUZZLE
+
+    def iter_trajectory(
+        self,
+        until: Significance = Significance.MUZZLE,
+        travel: Optional[float] = None,
+        velocity: Optional[float] = None,
+        n_intg: int = DEFAULT_STEPS,
+        acc: float = DEFAULT_ACC,
+        abort_velocity: float = inf,
+        abort_travel: float = inf,
+        integrator: Integrator = Integrator.RK4,
+        stop: Optional[Callable[[State], bool]] = None,
+        keep: Optional[Callable[[State], bool]] = None,
+        n_adiabat: Optional[int] = None,
+    ) -> Iterator[State]:
+        """
+        Generates the trajectory from shot start as `minimalist_interior_ballistics.state.State`,
+        in order of time, such that it may be watched, or abandoned, without keeping the
+        whole of it. `Gun.to_burnout` and `Gun.to_travel` collect the same trajectory into a
+        `minimalist_interior_ballistics.state.StateList`, see there.
+
+        Parameters
+        ----------
+        until: `minimalist_interior_ballistics.Significance`
+            either `minimalist_interior_ballistics.Significance.BURNOUT`, to end at burnout as
+            `Gun.to_burnout`, or `minimalist_interior_ballistics.Significance.MUZZLE`, to end at
+            the muzzle as `Gun.to_travel`.
+        travel: float
+            the travel of the muzzle, if this is to differ from `Gun.travel`.
+        velocity: float
+            if supplied, the muzzle is instead placed where this velocity is achieved, as
+            `Gun.to_velocity`.
+        n_intg, acc, abort_velocity, abort_travel, integrator:
+            see documentation for `Gun.to_burnout`.
+        stop: Callable[[minimalist_interior_ballistics.state.State], bool]
+            integration ends at the first point that satisfies this, which is not generated.
+            Unlike the abort criteria, this is only evaluated at integrated points, and the
+            crossing is not located any further. Note this is evaluated on a state marked as
+            `minimalist_interior_ballistics.Significance.STEP` on every point attempted,
+            including those of runs that are discarded for too few points, see
+            `Gun.flat_integrate`.
+        keep: Callable[[minimalist_interior_ballistics.state.State], bool]
+            states for which this returns False are dropped, e.g.
+            `lambda state: state.marker != Significance.STEP` keeps only the characteristic points.
+        n_adiabat: int
+            see documentation for `Gun.to_travel`.
+
+        Examples
+        --------
+        To stop once the breech pressure exceeds a limit:
+
+        >>> for state in gun.iter_trajectory(stop=lambda state: state.breech_pressure > 400e6):
+        ...     print(state.travel, state.breech_pressure)
+
+        Notes
+        -----
+        See `Gun.flat_iter_trajectory` for the order in which the trajectory is computed.
+        """
+        flat_stop = None if stop is None else lambda y: stop(self.get_state(y, marker=Significance.STEP))
+        for y, marker in self.flat_iter_trajectory(
+            until=until,
+            travel=travel,
+            velocity=velocity,
+            n_intg=n_intg,
+            acc=acc,
+            abort_velocity=abort_velocity,
+            abort_travel=abort_travel,
+            integrator=integrator,
+            stop=flat_stop,
+            n_adiabat=n_adiabat,
+        ):
+            state = self.get_state(y, marker=marker)
+            if keep is None or keep(state):
+                yield state
+
     def to_burnout(
         self,
         n_intg: int = DEFAULT_STEPS,
         acc: float = DEFAULT_ACC,
         abort_velocity: float = inf,
         abort_travel: float = inf,
+        integrator: Integrator = Integrator.RK4,
     ) -> StateList:
         """
         Integrates projectile motion up to the propellant burnout point and returns
@@ -302,6 +1554,10 @@ class Gun:
         abort_travel, abort_velocity: float
             additional criteria to abort the calculation before burnout point is
             reached.
+        integrator: `minimalist_interior_ballistics.Integrator`
+            the integration method. With `minimalist_interior_ballistics.Integrator.DOPRI5`,
+            `acc` also serves as the tolerance for the step size control, and `n_intg` is
+            not used to determine the step size.
 
         Returns
         -------
@@ -315,63 +1571,46 @@ class Gun:
         exceeded. The total time of which is used as a better approximate to
         time-to-burnout (or abort), divided by `n_intg` as the step size for the next run.
         This is repeated until at least `n_intg` steps were taken (including the
-        initial step, and the post-burnout/abort step).
+        initial step, and the post-burnout/abort step). See `Gun.flat_integrate` for
+        more information.
 
         In the burnout case, the last two steps brackets the actual burnout point,
         from which `minimalist_interior_ballistics.num.dekker` is called to numerically find the burnout
-        point to an accuracy of `acc` times the approximate total time.
+        point to an accuracy of `acc` times the approximate total time, on the dense output of
+        the bracketing step (see `Gun.flat_interpolant`).
 
         In the abort case, the last step is dropped such that the returned
         `minimalist_interior_ballistics.state.StateList` does not contain any point that exceeds the abort
         criteria, whether travel or velocity.
 
-        In either case, the result is passed through `Gun.mark_max_pressure` to mark
-        the peak pressure point.
-        """
-        s_now = s_next = start_state = self.get_start_state(n_intg=n_intg, acc=acc)
-        Z_c0s = start_state.burnup_fractions
-
-        def abort(state: State) -> bool:
-            return state.travel > abort_travel or state.velocity > abort_velocity
-
-        states = StateList()
-        delta_t = MAX_DT
-        rough_ttb = 0.0
-        while len(states) < n_intg:
-            if rough_ttb > 0:
-                delta_t = rough_ttb / n_intg
-            states = StateList()
-            s_next = State(
-                gun=self,
-                sv=StateVector(time=0.0, travel=0.0, velocity=0.0, burnup_fractions=Z_c0s),
-                marker=Significance.START,
-            )
-
-            while not (s_next.is_burnout or abort(s_next)):
-                states.append(s_now := s_next)
-                s_next = self.propagate_rk4_in_time(s_now, dt=delta_t)
+        In either case, the peak pressure point is marked, see `Gun.flat_max_pressure`.
 
-            rough_ttb = s_next.time
+        With `minimalist_interior_ballistics.Integrator.BURNUP`, a gun loaded with a single charge
+        of unit pressure exponent is integrated in the burn-up fraction instead, see
+        `Gun.flat_to_burnout_in_burnup`, unless this does not meet `acc`.
 
-        def time_end(time: float) -> float:
-            s = self.propagate_rk4_in_time(s_now, dt=time - s_now.time)
-            return -1 if (s.is_burnout or abort(s)) else 1
-
-        end_time = max(dekker(f=time_end, x_0=s_now.time, x_1=s_next.time, tol=rough_ttb * acc))
-
-        s_end = self.propagate_rk4_in_time(s_now, dt=end_time - s_now.time)
-
-        if abort(s_end):
-            # abort prioritized in case of both abort and burnout.
-            pass
-        elif s_end.is_burnout:
-            s_burnout = State.remark(s_end, new_significance=Significance.BURNOUT)
-            states.append(s_burnout)
-
-        return self.mark_max_pressure(states, acc=acc)
+        The trajectory is collected from `Gun.flat_iter_trajectory`.
+        """
+        ys, markers = [], []
+        for y, marker in self.flat_iter_trajectory(
+            until=Significance.BURNOUT,
+            n_intg=n_intg,
+            acc=acc,
+            abort_velocity=abort_velocity,
+            abort_travel=abort_travel,
+            integrator=integrator,
+        ):
+            ys.append(y)
+            markers.append(marker)
+        return StateList.from_flat(self, ys, markers=markers)
 
     def to_travel(
-        self, travel: Optional[float] = None, n_intg: int = DEFAULT_STEPS, acc: float = DEFAULT_ACC
+        self,
+        travel: Optional[float] = None,
+        n_intg: int = DEFAULT_STEPS,
+        acc: float = DEFAULT_ACC,
+        integrator: Integrator = Integrator.RK4,
+        n_adiabat: Optional[int] = None,
     ) -> StateList:
         """
         Conducts integration up to the desired shot-travel using time-wise ODE, if
@@ -382,94 +1621,195 @@ class Gun:
         ----------
         travel: float
             the projectile travel to which the integration is done to.
-        n_intg, acc: int, float
+        n_intg, acc, integrator: int, float, `minimalist_interior_ballistics.Integrator`
             see documentation for `Gun.to_burnout`.
+        n_adiabat: int
+            if supplied, the trajectory past burnout is not integrated, but generated in closed
+            form, as `n_adiabat` points spaced uniformly in travel between burnout and the muzzle,
+            marked as `minimalist_interior_ballistics.Significance.ADIABAT`. Use 0 for the muzzle
+            alone, which then costs the same however long the barrel.
 
         Returns
         -------
         list of `minimalist_interior_ballistics.state.State`.
-        """
-
-        travel = travel or self.travel
-        if not travel:
-            raise ValueError("travel must be supplied either as a parameter or during instance instantiation")
-
-        states = self.to_burnout(n_intg=n_intg, acc=acc, abort_travel=travel)
-        state = max(states)
-
-        if states.has_state_with_marker(Significance.BURNOUT):
-            burnout_state = states.get_state_by_marker(Significance.BURNOUT)
-
-            # use the analytical function to estimate mv.
-            v_muzzle = self.get_velocity_post_burnout(burnout_state=burnout_state, travel=travel)
-            v_burnout = burnout_state.velocity
 
-            # estimate the number of steps needed to be taken
-            v_average = (v_muzzle + v_burnout) * 0.5
-            ttm_est = (travel - burnout_state.travel) / v_average
-
-            """
-            use a step size that is the greater of
-            > previous step size in `to_burnout`
-            > a conservative estimate of the time to muzzle `ttm_est`, divided by `n_intg`.
-            """
-            dt = max((max(states).time - min(states).time) / len(states), ttm_est / n_intg)
-
-            next_state = self.propagate_rk4_in_time(state, dt=dt)
+        Notes
+        -----
+        With `minimalist_interior_ballistics.Integrator.BURNUP`, a gun loaded with a single charge
+        of unit pressure exponent is integrated in the burn-up fraction up to burnout, see
+        `Gun.flat_to_burnout_in_burnup`, unless this does not meet `acc`. Past burnout, the muzzle
+        is then found in closed form, as with `n_adiabat` supplied, see `Gun.flat_iter_trajectory`.
 
-            while next_state.travel < travel:
-                states.append(state := next_state)
-                next_state = self.propagate_rk4_in_time(state, dt=dt)
+        The trajectory is collected from `Gun.flat_iter_trajectory`.
+        """
+        ys, markers = [], []
+        for y, marker in self.flat_iter_trajectory(
+            until=Significance.MUZZLE,
+            travel=travel,
+            n_intg=n_intg,
+            acc=acc,
+            integrator=integrator,
+            n_adiabat=n_adiabat,
+        ):
+            ys.append(y)
+            markers.append(marker)
+        return StateList.from_flat(self, ys, markers=markers)
+
+    def to_velocity(
+        self,
+        velocity: float,
+        n_intg: int = DEFAULT_STEPS,
+        acc: float = DEFAULT_ACC,
+        integrator: Integrator = Integrator.RK4,
+        n_adiabat: Optional[int] = None,
+    ) -> StateList:
+        """
+        Integrates projectile motion until the desired velocity is achieved, the point of which
+        is marked as `minimalist_interior_ballistics.Significance.MUZZLE`, such that its travel
+        is that of a barrel cut to give the velocity at the muzzle.
 
-        states.append(self.propagate_rk4_in_travel(state, dl=travel - state.travel, marker=Significance.MUZZLE))
+        Parameters
+        ----------
+        velocity: float
+            the velocity to integrate to, must be below `Gun.asymptotic_velocity`.
+        n_intg, acc, integrator: int, float, `minimalist_interior_ballistics.Integrator`
+            see documentation for `Gun.to_burnout`.
+        n_adiabat: int
+            see documentation for `Gun.to_travel`.
 
-        return self.mark_max_pressure(states, acc=acc)
+        Returns
+        -------
+        list of `minimalist_interior_ballistics.state.State`.
 
-    # def to_velocity(
-    #     self,
-    #     velocity: float,
-    #     n_intg: int = DEFAULT_STEPS,
-    #     acc: float = DEFAULT_ACC,
-    # ):
-    #
-    #     pass
+        Raises
+        ------
+        ValueError
+            if the velocity is not below `Gun.asymptotic_velocity`.
 
-    def mark_max_pressure(self, states: StateList, acc: float = DEFAULT_ACC) -> StateList:
+        Notes
+        -----
+        As `Gun.to_travel`, the integration is in time until the velocity is bracketed, from
+        which a single step in velocity lands on the target, see `Gun.flat_iter_trajectory`.
+        This takes one integration, where searching for the travel by `Gun.to_travel` takes
+        one per iteration.
+        """
+        ys, markers = [], []
+        for y, marker in self.flat_iter_trajectory(
+            until=Significance.MUZZLE,
+            velocity=velocity,
+            n_intg=n_intg,
+            acc=acc,
+            integrator=integrator,
+            n_adiabat=n_adiabat,
+        ):
+            ys.append(y)
+            markers.append(marker)
+        return StateList.from_flat(self, ys, markers=markers)
+
+    def flat_max_pressure(
+        self,
+        f: Callable[[list[float]], list[float]],
+        ys: list[list[float]],
+        dys: list[list[float]],
+        tol: float,
+        integrator: Integrator = Integrator.RK4,
+        peak_finder: PeakFinder = PeakFinder.ANALYTIC,
+    ) -> list[float]:
+        """
+        Returns the flat state at maximum pressure, among consecutive points integrated in time
+        by `Gun.flat_integrate`, and their derivatives as evaluated by `f`. This is located by
+        `Gun.flat_locate_max_pressure` in the interval bracketed by the points before and after
+        the highest pressure point, to `tol` in time, on the dense output of the bracketing
+        steps (see `Gun.flat_interpolant`). The state is then stepped to from the point before,
+        as the dense output is less accurate where a step spans burnout. Where the maximum is
+        not above the highest pressure point, or within `tol` of it, as it is when the pressure
+        peaks at burnout, that point is returned instead.
+        """
+        if len(ys) == 1:
+            return ys[0]
+
+        pressures = [self.flat_average_pressure(y) for y in ys]
+        j = pressures.index(max(pressures))
+        i, k = max(j - 1, 0), min(j + 1, len(ys) - 1)
+
+        y_at_time_ij = Gun.flat_interpolant(f, ys[i], dys[i], ys[j], dys[j], integrator)
+        y_at_time_jk = Gun.flat_interpolant(f, ys[j], dys[j], ys[k], dys[k], integrator)
+
+        def y_at_time(time: float) -> list[float]:
+            if time < ys[j][0] or j == k:
+                return y_at_time_ij(time)
+            else:
+                return y_at_time_jk(time)
+
+        time_p_max = self.flat_locate_max_pressure(
+            f=f,
+            y_at=y_at_time,
+            ys=(ys[i], ys[j], ys[k]),
+            dys=(dys[i], dys[j], dys[k]),
+            index=0,
+            tol=tol,
+            peak_finder=peak_finder,
+        )
+        if abs(time_p_max - ys[j][0]) <= tol:
+            return ys[j]
+        y_0 = ys[i] if time_p_max < ys[j][0] or j == k else ys[j]
+        y_p_max = Gun.flat_step(f, y_0, h=time_p_max - y_0[0], integrator=integrator)
+        # a maximum at a kink, i.e. at burnout, is the highest point itself.
+        return y_p_max if self.flat_average_pressure(y_p_max) > pressures[j] else ys[j]
+
+    def mark_max_pressure(
+        self,
+        states: StateList,
+        acc: float = DEFAULT_ACC,
+        integrator: Integrator = Integrator.RK4,
+        peak_finder: PeakFinder = PeakFinder.ANALYTIC,
+    ) -> StateList:
         """
         Finds the maximum pressure point and insert it into a list of
         `minimalist_interior_ballistics.state.State`, passed in as argument.
 
         Notes
         -----
-        Implementation wise, conducts a gold-section search using `minimalist_interior_ballistics.num.gss_max`
-        in the interval bracketed by the step before and after the step where maximum
-        pressure is recorded. By intercepting the accuracy specification passed to the
-        generating functions, the peak-pressure point is determined to (at worst) step size
-        times `acc`.
+        Implementation wise, the maximum is located by `Gun.flat_max_pressure`, in the
+        interval bracketed by the step before and after the step where maximum pressure is
+        recorded. By intercepting the accuracy specification passed to the generating functions,
+        the peak-pressure point is determined to (at worst) step size times `acc`.
 
         If a previous round of peak pressure finding is recognized (by the presence
         of the `minimalist_interior_ballistics.Significance.PEAK_PRESSURE` marker).
         """
-        if not any(s.marker == Significance.PEAK_PRESSURE for s in states):
-            total_time = max(states).time - min(states).time
-            pressures = [s.average_pressure for s in states]
+        if not states.has_state_with_marker(Significance.PEAK_PRESSURE):
+            times = states.times
+            total_time = max(times) - min(times)
+            pressures = states.average_pressures
             j = pressures.index(max(pressures))
 
-            # find the bracketing points.
-            i, k = max(j - 1, 0), min(j + 1, len(states) - 1)
-
-            s_i, s_j, s_k = states[i], states[j], states[k]
+            # only the bracketing points are needed.
+            ys = [states.get_flat(n) for n in range(max(j - 1, 0), min(j + 1, len(states) - 1) + 1)]
+            is_started = states[j].is_started
+            f = self.compiled_dt if is_started else self.compiled_pre_start_dt
 
-            def time_pressure(time: float) -> float:
-                if time < s_j.time:
-                    p_t = self.propagate_rk4_in_time(s_i, dt=time - s_i.time).average_pressure
-                else:
-                    p_t = self.propagate_rk4_in_time(s_j, dt=time - s_j.time).average_pressure
-                return p_t
+            y_p_max = self.flat_max_pressure(
+                f, ys, [f(y) for y in ys], tol=acc * total_time, integrator=integrator, peak_finder=peak_finder
+            )
+            insort(states, self.get_state(y_p_max, marker=Significance.PEAK_PRESSURE, is_started=is_started))
 
-            time_p_max = sum(gss_max(f=time_pressure, x_0=s_i.time, x_1=s_k.time, tol=acc * total_time)) * 0.5
-            s_p_max = self.propagate_rk4_in_time(s_j, dt=time_p_max - s_j.time, marker=Significance.PEAK_PRESSURE)
+        return states
 
-            insort(states, s_p_max)
 
-        return states
+converter = Converter()
+"""
+`cattrs.Converter` shared by `Gun.to_json` and `Gun.from_json`, which also round trips
+`minimalist_interior_ballistics.charge.Charge` and
+`minimalist_interior_ballistics.form_function.FormFunction` on their own. The hooks of the classes
+are generated on first use, and kept, such that importing this module does not resolve their
+annotations. The family of a propellant is left out when empty, as it is for most guns.
+"""
+converter.register_unstructure_hook_factory(
+    lambda cls: isinstance(cls, type) and issubclass(cls, Propellant),
+    lambda cls: make_dict_unstructure_fn(cls, converter, family=override(omit_if_default=True)),
+)
+converter.register_structure_hook(Union[tuple[float, ...], list[float]], lambda v, _: tuple(float(x) for x in v))
+converter.register_structure_hook(
+    Union[tuple[Charge, ...], list[Charge]], lambda v, _: tuple(converter.structure(c, Charge) for c in v)
+)
@@ -0,0 +1,275 @@
+"""
+Indexed collection of `minimalist_interior_ballistics.charge.Propellant`, backed by a binary
+cache of the propellant CSV file, see `PropellantLibrary`.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+from bisect import bisect_left, bisect_right
+from math import isnan, nan
+from os import PathLike
+from typing import Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from .charge import Propellant
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"MIBPLIB1"
+"""leading bytes of a cache file, changed with the layout."""
+
+_header = struct.Struct("<8sqqII")
+_record = struct.Struct("<6d6I")
+_index = struct.Struct("<I")
+
+
+class _Column(Sequence):
+    """read-only view of one string field of every record, which is decoded as accessed."""
+
+    def __init__(self, read: Callable[[int], str], n: int):
+        self._read = read
+        self._n = n
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, i: int) -> str:
+        return self._read(i)
+
+    def __iter__(self) -> Iterator[str]:
+        return map(self._read, range(self._n))
+
+
+class PropellantLibrary:
+    """
+    Read-only mapping of propellants by name, which also groups them by
+    `minimalist_interior_ballistics.charge.Propellant.family`.
+
+    Notes
+    -----
+    The library is a single buffer, of a header, one fixed-size record per propellant sorted by
+    name, the order of the records by family then name, and a table of UTF-8 strings that the
+    records refer to by offset and length. Both lookups are binary searches over the buffer, and
+    `minimalist_interior_ballistics.charge.Propellant` objects are only built for the records
+    actually accessed, after which they are kept.
+
+    `PropellantLibrary.from_csv_file` stores the buffer next to the CSV file, along with the
+    size and modification time of the latter, and memory-maps it on later loads, until the CSV
+    file changes. Loading a cached library thus costs the same regardless of its size, and
+    processes that load the same library share the pages of the cache. A library so loaded is
+    pickled as the path of its cache, such that it is sent to worker processes by reference.
+    Where several propellants share a name, lookups return the first in file order.
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap], cache_file: Optional[str] = None):
+        magic, _, _, n, n_strings = _header.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError("buffer is not a propellant library.")
+
+        self._buffer = buffer
+        self._n = n
+        self._index_offset = _header.size + n * _record.size
+        self._strings_offset = self._index_offset + n * _index.size
+        if len(buffer) != self._strings_offset + n_strings:
+            raise ValueError("propellant library is truncated.")
+
+        self.cache_file = cache_file
+        self._propellants: Dict[int, Propellant] = {}
+        self._names = _Column(self._name, n)
+        self._families = _Column(self._family, n)
+
+    @staticmethod
+    def pack(propellants: Iterable[Propellant], source_size: int = 0, source_mtime_ns: int = 0) -> bytes:
+        """
+        packs propellants into the buffer of a library, tagged with the size and modification
+        time, in nanoseconds, of the file they are read from.
+        """
+        propellants = sorted(propellants, key=lambda propellant: propellant.name)
+        strings = bytearray()
+        records = []
+        for propellant in propellants:
+            spans = []
+            for text in (propellant.name, propellant.description, propellant.family):
+                encoded = text.encode("utf-8")
+                spans.extend((len(strings), len(encoded)))
+                strings.extend(encoded)
+
+            burn_rate_coefficient = propellant.burn_rate_coefficient
+            records.append(
+                _record.pack(
+                    propellant.adiabatic_index,
+                    propellant.density,
+                    propellant.force,
+                    propellant.covolume,
+                    propellant.pressure_exponent,
+                    nan if burn_rate_coefficient is None else burn_rate_coefficient,
+                    *spans,
+                )
+            )
+
+        family_order = sorted(range(len(propellants)), key=lambda i: (propellants[i].family, propellants[i].name))
+        return b"".join(
+            (
+                _header.pack(MAGIC, source_size, source_mtime_ns, len(propellants), len(strings)),
+                *records,
+                *(_index.pack(i) for i in family_order),
+                strings,
+            )
+        )
+
+    @classmethod
+    def from_propellants(cls, propellants: Iterable[Propellant]) -> PropellantLibrary:
+        """builds an uncached library in memory."""
+        return cls(cls.pack(propellants))
+
+    @classmethod
+    def from_cache_file(cls, cache_file: Union[str, PathLike]) -> PropellantLibrary:
+        """memory-maps a cache written by `PropellantLibrary.from_csv_file`, as is."""
+        cache_file = os.fspath(cache_file)
+        with open(cache_file, mode="rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), cache_file=cache_file)
+
+    @classmethod
+    def from_csv_file(
+        cls, file_name: Union[str, PathLike], cache_file: Optional[Union[str, PathLike]] = None, use_cache: bool = True
+    ) -> PropellantLibrary:
+        """
+        Loads the propellants of a CSV file, see `minimalist_interior_ballistics.charge.Propellant.from_csv_file`.
+
+        Parameters
+        ----------
+        file_name: str | PathLike
+            the CSV file.
+        cache_file: str | PathLike, optional
+            where the binary cache is kept, defaults to `file_name` suffixed by `.cache`.
+        use_cache: bool
+            whether to read and write the cache at all.
+
+        Notes
+        -----
+        The cache is used if it was written for a CSV file of the same size and modification
+        time, and is otherwise rebuilt. It is replaced atomically, such that concurrent loads
+        never read a partial cache, and if it cannot be written the library is kept in memory.
+        """
+        file_name = os.fspath(file_name)
+        cache_file = os.fspath(cache_file) if cache_file else f"{file_name}.cache"
+        stat = os.stat(file_name)
+
+        if use_cache:
+            try:
+                library = cls.from_cache_file(cache_file)
+            except (OSError, ValueError, struct.error):
+                pass
+            else:
+                _, source_size, source_mtime_ns, *_ = _header.unpack_from(library._buffer)
+                if (source_size, source_mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+                    return library
+                library.close()
+
+        buffer = cls.pack(Propellant.from_csv_file(file_name), stat.st_size, stat.st_mtime_ns)
+        if use_cache:
+            temp_file = f"{cache_file}.{os.getpid()}.tmp"
+            try:
+                with open(temp_file, mode="wb") as f:
+                    f.write(buffer)
+                os.replace(temp_file, cache_file)
+            except OSError as e:
+                logger.warning(f"propellant library cache not written: {e}")
+            else:
+                return cls.from_cache_file(cache_file)
+
+        return cls(buffer)
+
+    def close(self):
+        """releases the memory map of a cached library, after which it is no longer usable."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __reduce__(self):
+        if self.cache_file:
+            return PropellantLibrary.from_cache_file, (self.cache_file,)
+        return PropellantLibrary, (bytes(self._buffer),)
+
+    def _unpack(self, i: int) -> tuple:
+        return _record.unpack_from(self._buffer, _header.size + i * _record.size)
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return self._buffer[start : start + length].decode("utf-8")
+
+    def _name(self, i: int) -> str:
+        return self._string(*self._unpack(i)[6:8])
+
+    def _family_member(self, j: int) -> int:
+        return _index.unpack_from(self._buffer, self._index_offset + j * _index.size)[0]
+
+    def _family(self, j: int) -> str:
+        return self._string(*self._unpack(self._family_member(j))[10:12])
+
+    def _get(self, i: int) -> Propellant:
+        try:
+            return self._propellants[i]
+        except KeyError:
+            pass
+
+        adiabatic_index, density, force, covolume, pressure_exponent, burn_rate_coefficient, *spans = self._unpack(i)
+        propellant = Propellant(
+            name=self._string(*spans[0:2]),
+            description=self._string(*spans[2:4]),
+            family=self._string(*spans[4:6]),
+            adiabatic_index=adiabatic_index,
+            density=density,
+            force=force,
+            covolume=covolume,
+            pressure_exponent=pressure_exponent,
+            burn_rate_coefficient=None if isnan(burn_rate_coefficient) else burn_rate_coefficient,
+        )
+        self._propellants[i] = propellant
+        return propellant
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __iter__(self) -> Iterator[Propellant]:
+        """iterates over the propellants in order of name."""
+        return (self._get(i) for i in range(self._n))
+
+    def __contains__(self, name: str) -> bool:
+        i = bisect_left(self._names, name)
+        return i < self._n and self._names[i] == name
+
+    def __getitem__(self, name: str) -> Propellant:
+        i = bisect_left(self._names, name)
+        if i < self._n and self._names[i] == name:
+            return self._get(i)
+        raise KeyError(name)
+
+    def get(self, name: str, default: Optional[Propellant] = None) -> Optional[Propellant]:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """names of the propellants, sorted."""
+        return tuple(self._names)
+
+    @property
+    def families(self) -> Tuple[str, ...]:
+        """distinct families of the propellants, sorted."""
+        families = []
+        j = 0
+        while j < self._n:
+            families.append(family := self._families[j])
+            j = bisect_right(self._families, family, lo=j)
+        return tuple(families)
+
+    def get_family(self, family: str) -> Tuple[Propellant, ...]:
+        """the propellants of `family`, in order of name."""
+        lo = bisect_left(self._families, family)
+        hi = bisect_right(self._families, family, lo=lo)
+        return tuple(self._get(self._family_member(j)) for j in range(lo, hi))
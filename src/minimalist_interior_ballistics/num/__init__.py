@@ -2,7 +2,12 @@
 A collection of useful numerical routines used here.
 """
 
+from .brent import brent_max, brent_min
 from .dekker import dekker
+from .dopri5 import dopri5, dopri5_dense, dopri5_step
+from .gauss import gauss_legendre
 from .gss import gss_max, gss_min
+from .hermite import hermite
 from .intg import intg
+from .rk4 import rk4
 from .secant import secant
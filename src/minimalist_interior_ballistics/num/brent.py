@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import math
+import sys
+from typing import Callable
+
+_cgold = (3 - math.sqrt(5)) / 2  # 1 / phi^2
+_sqrt_eps = math.sqrt(sys.float_info.epsilon)
+
+
+def brent_min(
+    f: Callable[[float], float],
+    x_0: float,
+    x_1: float,
+    tol: float,
+    max_it: int = 100,
+) -> tuple[float, float]:
+    """Calls `_brent` with boolean flag set to true. See `_brent` for documentation"""
+    return _brent(f=f, x_0=x_0, x_1=x_1, tol=tol, max_it=max_it, find_min=True)
+
+
+def brent_max(
+    f: Callable[[float], float],
+    x_0: float,
+    x_1: float,
+    tol: float,
+    max_it: int = 100,
+) -> tuple[float, float]:
+    """Calls `_brent` with boolean flag set to false. See `_brent` for documentation"""
+    return _brent(f=f, x_0=x_0, x_1=x_1, tol=tol, max_it=max_it, find_min=False)
+
+
+def _brent(
+    f: Callable[[float], float],
+    x_0: float,
+    x_1: float,
+    tol: float,
+    max_it: int = 100,
+    find_min: bool = True,
+) -> tuple[float, float]:
+    """
+    Brent's method, for the solution of local extremum of a univariate function within a
+    specified interval. Steps to the extremum of the parabola through the three best points
+    found so far, and falls back to golden section where the parabolic step is not trusted.
+
+    Parameters
+    ----------
+    f : callable[[float],float]
+        univariate objective function, valid on [min(`x_0`, `x_1`), max(`x_0`, `x_1`)].
+    x_0, x_1 : float
+        bounds of the extremum. Values can be provided in any order.
+    tol : float
+        convergence criteria, maximum allowed width of the interval known to contain the
+        extremum, as with `minimalist_interior_ballistics.num.gss_min`.
+    max_it: int
+        terminating condition, maximum numbers of evaluations of `f` allowed.
+    find_min: bool
+        boolean flag to determine the direction of the search.
+
+    Returns
+    -------
+    x_best, f_best : float
+        the best estimate of the extremum, and the value of `f` there.
+
+    Notes
+    -----
+    Like `minimalist_interior_ballistics.num.gss_min`, the algorithm returns without
+    raising any error when either the convergence criteria or the terminating condition is
+    met. On a smooth function, the parabolic steps converge super-linearly once close to the
+    extremum, whereas golden section only shrinks the interval by a constant ratio of 0.618
+    per evaluation. The latter bounds the worst case, which is about twice as many evaluations
+    as golden section.
+
+    References
+    ----------
+    - **[1]** Brent, R. P. (1973), "Algorithms for Minimization without Derivatives",
+    Chapter 5, Englewood Cliffs, NJ: Prentice-Hall, ISBN 0-13-022335-2
+
+    Examples
+    --------
+    >>> x, y = brent_min(lambda x: (x - 1) ** 2, 0, 3, tol=1e-6)
+    >>> round(x, 6), round(y, 12)
+    (1.0, 0.0)
+    """
+    sign = 1 if find_min else -1
+    tol = abs(tol)
+
+    a, b = min(x_0, x_1), max(x_0, x_1)
+    x = w = v = a + _cgold * (b - a)
+    fx = fw = fv = sign * f(x)
+    d = e = 0.0
+
+    for _ in range(max_it - 1):
+        m = 0.5 * (a + b)
+        tol_1 = _sqrt_eps * abs(x) + 0.25 * tol
+        tol_2 = 2 * tol_1
+        if abs(x - m) <= tol_2 - 0.5 * (b - a):
+            break
+
+        is_parabolic = False
+        if abs(e) > tol_1:
+            # parabola through x, w and v.
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            q = abs(q)
+
+            e_prev, e = e, d
+            # accept a step into (a, b), of less than half the one before last.
+            if abs(p) < abs(0.5 * q * e_prev) and q * (a - x) < p < q * (b - x):
+                d = p / q
+                if x + d - a < tol_2 or b - (x + d) < tol_2:
+                    d = math.copysign(tol_1, m - x)
+                is_parabolic = True
+
+        if not is_parabolic:
+            e = (a if x >= m else b) - x
+            d = _cgold * e
+
+        u = x + (d if abs(d) >= tol_1 else math.copysign(tol_1, d))
+        fu = sign * f(u)
+
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            (v, fv), (w, fw), (x, fx) = (w, fw), (x, fx), (u, fu)
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                (v, fv), (w, fw) = (w, fw), (u, fu)
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+
+    return x, sign * fx
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from math import inf
+from typing import Callable, Optional, Tuple
+
+# fmt: off
+_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+_E = (71 / 57600, 0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40)
+_D = (
+    -12715105075 / 11282082432, 0, 87487479700 / 32700410799, -10690763975 / 1880347072,
+    701980252875 / 199316789632, -1453857185 / 822651844, 69997945 / 29380423,
+)
+# fmt: on
+
+
+def _stages(
+    f: Callable[[list[float]], list[float]], y: list[float], h: float, k1: Optional[list[float]]
+) -> Tuple[list[float], list[list[float]]]:
+    ks = [f(y) if k1 is None else k1]
+    for a_row in _A[1:]:
+        y_stage = y
+        for a, k in zip(a_row, ks):
+            if a:
+                ha = h * a
+                y_stage = [y_i + ha * k_i for y_i, k_i in zip(y_stage, k)]
+        ks.append(f(y_stage))
+
+    return y_stage, ks
+
+
+def dopri5_step(
+    f: Callable[[list[float]], list[float]], y: list[float], h: float, k1: Optional[list[float]] = None
+) -> Tuple[list[float], list[float], list[float]]:
+    """
+    Takes a single step of the Dormand-Prince 5(4) embedded Runge-Kutta pair on an autonomous
+    system of ordinary differential equations, whose state is stored as a flat list of floats.
+
+    Parameters
+    ----------
+    f: Callable[[list[float]], list[float]]
+        derivative of the system, returns a list of the same length as its argument.
+    y: list[float]
+        state at the beginning of the step.
+    h: float
+        step size.
+    k1: list[float], optional
+        derivative at `y`, if already known. Saves one evaluation of `f`.
+
+    Returns
+    -------
+    y_next, error, k_next: list[float]
+        the 5th order solution at the end of the step, the difference between it and the embedded
+        4th order solution, and the derivative at the end of the step.
+
+    Notes
+    -----
+    The last stage is evaluated at the solution itself (first same as last), such that the
+    returned derivative can be passed as `k1` to the next step free of charge.
+    """
+    y_next, ks = _stages(f, y, h, k1)
+
+    error = [0.0 for _ in y]
+    for e, k in zip(_E, ks):
+        if e:
+            he = h * e
+            error = [e_i + he * k_i for e_i, k_i in zip(error, k)]
+
+    return y_next, error, ks[-1]
+
+
+def dopri5_dense(
+    f: Callable[[list[float]], list[float]], x_0: float, y: list[float], h: float, k1: Optional[list[float]] = None
+) -> Callable[[float], list[float]]:
+    """
+    Takes a single step of the Dormand-Prince 5(4) method, and returns its continuous (dense)
+    output, as a function of the independent variable.
+
+    Parameters
+    ----------
+    f, y, h, k1:
+        see `dopri5_step`.
+    x_0: float
+        independent variable at the start of the step.
+
+    Returns
+    -------
+    Callable[[float], list[float]]
+        the interpolated solution, intended to be called on [min(`x_0`, `x_0 + h`), max(`x_0`, `x_0 + h`)].
+
+    Notes
+    -----
+    The interpolant is the fourth order continuous extension due to Shampine, which adds a
+    quartic correction term, constructed from the stages of the step, to the cubic Hermite
+    interpolant (see `minimalist_interior_ballistics.num.hermite`). Repeating a step that
+    was previously accepted exactly reproduces the same solution, therefore this can be called
+    after the fact, when the dense output is found to be needed on a step.
+
+    References
+    ----------
+    - **[1]** Hairer, E., Nørsett, S. P., Wanner, G. (1993), Solving Ordinary Differential
+    Equations I: Nonstiff Problems, Springer Series in Computational Mathematics, vol 8,
+    Section II.6.
+    """
+    y_next, ks = _stages(f, y, h, k1)
+
+    dys = [b - a for a, b in zip(y, y_next)]
+    r_3 = [h * k - dy for k, dy in zip(ks[0], dys)]
+    r_4 = [dy - h * k - c for dy, k, c in zip(dys, ks[-1], r_3)]
+    r_5 = [0.0 for _ in y]
+    for d, k in zip(_D, ks):
+        if d:
+            hd = h * d
+            r_5 = [r_i + hd * k_i for r_i, k_i in zip(r_5, k)]
+
+    def interpolant(x: float) -> list[float]:
+        t = (x - x_0) / h
+        u = 1 - t
+        return [a + t * (b + u * (c + t * (d + u * e))) for a, b, c, d, e in zip(y, dys, r_3, r_4, r_5)]
+
+    return interpolant
+
+
+def dopri5(
+    f: Callable[[list[float]], list[float]],
+    y: list[float],
+    h: float,
+    rtol: float,
+    atol: float,
+    k1: Optional[list[float]] = None,
+    h_max: float = inf,
+    max_it: int = 33,
+) -> Tuple[float, list[float], list[float], float]:
+    """
+    Takes a single, error controlled step of the Dormand-Prince 5(4) method. The trial step
+    is repeatedly shrunk until the estimated local error is within tolerance.
+
+    Parameters
+    ----------
+    f, y, k1:
+        see `dopri5_step`.
+    h: float
+        trial step size.
+    rtol, atol: float
+        relative and absolute tolerance on each component of the solution.
+    h_max: float
+        maximum step size that will be attempted.
+    max_it: int
+        terminating condition, maximum number of rejected trial steps.
+
+    Returns
+    -------
+    h_taken: float
+        the accepted step size.
+    y_next, k_next: list[float]
+        see `dopri5_step`.
+    h_next: float
+        suggested size for the next step.
+
+    Raises
+    ------
+    ValueError
+        if the maximum number of rejected trial steps has been exceeded.
+
+    Notes
+    -----
+    The error is measured as the root-mean-square of each component's error, scaled by
+    `atol + rtol * max(|y|, |y_next|)`, and the step is accepted if this is at most unity.
+    The step size is then adjusted by `0.9 * error ** (-1/5)`, limited to between 0.2 and 5
+    times the current step.
+
+    References
+    ----------
+    - **[1]** Hairer, E., Nørsett, S. P., Wanner, G. (1993), Solving Ordinary Differential
+    Equations I: Nonstiff Problems, Springer Series in Computational Mathematics, vol 8,
+    Section II.4.
+    """
+    rtol, atol = abs(rtol), abs(atol)
+    if k1 is None:
+        k1 = f(y)
+
+    h = min(h, h_max)
+    for _ in range(max_it):
+        y_next, error, k_next = dopri5_step(f, y, h, k1)
+        err = sum((e / (atol + rtol * max(abs(a), abs(b)))) ** 2 for a, b, e in zip(y, y_next, error))
+        err = (err / len(y)) ** 0.5
+
+        if err <= 1:
+            factor = 5 if err == 0 else min(5, 0.9 * err**-0.2)
+            return h, y_next, k_next, min(h * factor, h_max)
+
+        h *= max(0.2, 0.9 * err**-0.2)
+
+    else:
+        raise ValueError("Maximum iteration exceeded.")
+
+
+if __name__ == "__main__":
+
+    def f(y: list[float]) -> list[float]:
+        return [1, y[1]]
+
+    print(dopri5(f, [0, 1], 1.0, rtol=1e-6, atol=1e-9))
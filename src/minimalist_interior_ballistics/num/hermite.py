@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import Callable
+
+
+def hermite(
+    x_0: float, y_0: list[float], f_0: list[float], x_1: float, y_1: list[float], f_1: list[float]
+) -> Callable[[float], list[float]]:
+    """
+    Constructs the cubic Hermite interpolant of a step taken by an ordinary differential equation
+    integrator, from the solution and its derivative at both ends. This provides continuous (dense)
+    output, without needing to re-integrate from the start of the step.
+
+    Parameters
+    ----------
+    x_0, x_1: float
+        independent variable at the start and end of the step.
+    y_0, y_1: list[float]
+        solution at the start and end of the step.
+    f_0, f_1: list[float]
+        derivative of the solution at the start and end of the step.
+
+    Returns
+    -------
+    Callable[[float], list[float]]
+        the interpolated solution, as a function of the independent variable. Intended to
+        be called on [min(`x_0`, `x_1`), max(`x_0`, `x_1`)].
+
+    Notes
+    -----
+    With `h = x_1 - x_0` and `t = (x - x_0) / h`, the interpolant is written as
+    ```
+    y(t) = y_0 + t * (Δy + (1 - t) * (h * f_0 - Δy + t * (2 * Δy - h * (f_0 + f_1))))
+    ```
+    where `Δy = y_1 - y_0`. This is third order accurate, and since the derivative is
+    matched at the ends, the interpolant of successive steps join smoothly.
+
+    References
+    ----------
+    - **[1]** Hairer, E., Nørsett, S. P., Wanner, G. (1993), Solving Ordinary Differential
+    Equations I: Nonstiff Problems, Springer Series in Computational Mathematics, vol 8,
+    Section II.6.
+    """
+    h = x_1 - x_0
+    dys = [b - a for a, b in zip(y_0, y_1)]
+    r_3 = [h * f - dy for f, dy in zip(f_0, dys)]
+    r_4 = [2 * dy - h * (f + g) for dy, f, g in zip(dys, f_0, f_1)]
+
+    def interpolant(x: float) -> list[float]:
+        t = (x - x_0) / h
+        return [a + t * (dy + (1 - t) * (c + t * d)) for a, dy, c, d in zip(y_0, dys, r_3, r_4)]
+
+    return interpolant
+
+
+if __name__ == "__main__":
+    from math import exp
+
+    print(hermite(0, [1], [1], 1, [exp(1)], [exp(1)])(0.5), exp(0.5))
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+
+def rk4(
+    f: Callable[[list[float]], list[float]], y: list[float], h: float, k1: Optional[list[float]] = None
+) -> list[float]:
+    """
+    Takes a single step of the classic 4th order Runge-Kutta method on an autonomous system of
+    ordinary differential equations, whose state is stored as a flat list of floats.
+
+    Parameters
+    ----------
+    f: Callable[[list[float]], list[float]]
+        derivative of the system, returns a list of the same length as its argument.
+    y: list[float]
+        state at the beginning of the step.
+    h: float
+        step size.
+    k1: list[float], optional
+        derivative at `y`, if already known. Saves one evaluation of `f`.
+
+    Returns
+    -------
+    list[float]
+        state at the end of the step.
+
+    Notes
+    -----
+    Non-autonomous systems can be integrated by including the independent variable in the
+    state, with a derivative of unity. Only flat lists are allocated in the process, which
+    is considerably cheaper than constructing intermediate objects for each stage.
+    """
+    if k1 is None:
+        k1 = f(y)
+
+    h_2 = 0.5 * h
+    k2 = f([a + h_2 * b for a, b in zip(y, k1)])
+    k3 = f([a + h_2 * b for a, b in zip(y, k2)])
+    k4 = f([a + h * b for a, b in zip(y, k3)])
+
+    h_6 = h / 6
+    return [a + h_6 * (b + 2 * (c + d) + e) for a, b, c, d, e in zip(y, k1, k2, k3, k4)]
+
+
+if __name__ == "__main__":
+
+    def f(y: list[float]) -> list[float]:
+        return [1, y[1]]
+
+    print(rk4(f, [0, 1], 1.0))
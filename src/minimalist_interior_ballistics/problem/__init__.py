@@ -1,5 +1,6 @@
 from .base_problem import BaseProblem
-from .fixed_charge_problem import FixedChargeProblem
-from .fixed_volume_problem import FixedVolumeProblem
+from .fixed_charge_problem import FixedChargeProblem, FixedChargeSession
+from .fixed_volume_problem import FixedVolumeProblem, FixedVolumeSession
 from .known_gun_problem import KnownGunProblem
 from .pressure_target import PressureTarget
+from .session import ProblemSession
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Optional
-from functools import wraps
+from math import copysign, exp, log
+from typing import TYPE_CHECKING, Optional, Tuple
+from functools import cached_property, wraps
 from attrs import field, frozen
 from .. import (
     DEFAULT_ACC,
     DEFAULT_GUN_LOSS_FRACTION,
     DEFAULT_GUN_START_PRESSURE,
     DEFAULT_STEPS,
+    PROBLEM_CACHE_SIZE,
     REDUCED_BURN_RATE_INITIAL_GUESS,
+    REDUCED_BURN_RATE_PRESSURE_SLOPE,
     Significance,
 )
+from ..cache import CacheInfo, LRUCache
 from ..charge import Charge, Propellant
 from ..gun import Gun
 from ..num import dekker
+from ..state import StateList
 from .pressure_target import PressureTarget
 
 if TYPE_CHECKING:
@@ -70,6 +75,30 @@ def accepts_reduced_burnrate(func):
     return handled_func
 
 
+def memoized_at_pressure(func):
+    @wraps(func)
+    def handled_func(
+        self: BaseProblem,
+        pressure_target: PressureTarget,
+        chamber_volume: float,
+        charge_masses: tuple[float, ...],
+        reduced_burnrate_ratios: list[float] | tuple[float, ...] = tuple([1.0]),
+    ):
+        reduced_burnrate_ratios = tuple(reduced_burnrate_ratios)
+        return self.gun_cache.get_or_compute(
+            (chamber_volume, charge_masses, reduced_burnrate_ratios, pressure_target),
+            lambda: func(
+                self,
+                pressure_target=pressure_target,
+                chamber_volume=chamber_volume,
+                charge_masses=charge_masses,
+                reduced_burnrate_ratios=reduced_burnrate_ratios,
+            ),
+        )
+
+    return handled_func
+
+
 @frozen(kw_only=True)
 class BaseProblem:
     name: str = field(default="")
@@ -101,6 +130,42 @@ class BaseProblem:
         else:
             raise ValueError("invalid BaseProblem parameters.")
 
+    @cached_property
+    def gun_cache(self) -> LRUCache[Gun]:
+        """
+        memoizes `BaseProblem.get_gun_at_pressure`, keyed by chamber volume, charge masses,
+        reduced burn rate ratios and pressure target, for this problem only. The nested searches
+        of the derived problems, e.g. `minimalist_interior_ballistics.problem.FixedVolumeProblem`,
+        revisit the same guns when the limits are refined, and again when the solution is
+        returned, so that each is only solved once. Bounded to
+        `minimalist_interior_ballistics.PROBLEM_CACHE_SIZE` entries, and switched off by
+        `minimalist_interior_ballistics.cache.LRUCache.disable`.
+        """
+        return LRUCache(maxsize=PROBLEM_CACHE_SIZE)
+
+    @cached_property
+    def travel_cache(self) -> LRUCache[StateList]:
+        """memoizes `BaseProblem.to_travel`, keyed by the gun, see `BaseProblem.gun_cache`."""
+        return LRUCache(maxsize=PROBLEM_CACHE_SIZE)
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """hit/miss statistics of `BaseProblem.gun_cache` and `BaseProblem.travel_cache`."""
+        return {"gun": self.gun_cache.info(), "travel": self.travel_cache.info()}
+
+    def clear_cache(self):
+        self.gun_cache.clear()
+        self.travel_cache.clear()
+
+    def to_travel(self, gun: Gun) -> StateList:
+        """
+        `minimalist_interior_ballistics.gun.Gun.to_travel` of `gun` to the travel, and at the
+        accuracy, of this problem, memoized in `BaseProblem.travel_cache`. The returned list is
+        shared between calls, and is not to be modified.
+        """
+        return self.travel_cache.get_or_compute(
+            gun, lambda: gun.to_travel(travel=self.travel, n_intg=self.n_intg, acc=self.acc)
+        )
+
     @accepts_reduced_burnrate
     @accepts_charge_mass
     def get_gun(
@@ -129,6 +194,79 @@ class BaseProblem:
         )
 
     @accepts_charge_mass
+    def get_covolume(self, charge_masses: tuple[float, ...]) -> float:
+        """
+        total covolume of the charges, which limits the loading, see
+        `minimalist_interior_ballistics.gun.Gun.bomb_free_fraction`.
+        """
+        return sum(
+            charge_mass * propellant.covolume for charge_mass, propellant in zip(charge_masses, self.propellants)
+        )
+
+    @accepts_charge_mass
+    def get_bomb_coefficients(self, charge_masses: tuple[float, ...]) -> Tuple[float, float]:
+        r"""
+        Coefficients $F, A$ of the average pressure of the bomb state, see
+        `minimalist_interior_ballistics.gun.Gun.get_bomb_state`, which is $F / (V - A)$ in a
+        chamber of volume $V$. Both are the sums over the charges, of the gas energy and of the
+        volume taken by the products and the remaining solid, and are linear in the charge masses.
+        """
+        force_term = volume_term = 0.0
+        for charge_mass, propellant, form_function in zip(charge_masses, self.propellants, self.form_functions):
+            psi = form_function(form_function.Z_k)
+            force_term += propellant.force * charge_mass * psi
+            volume_term += charge_mass * (propellant.covolume * psi + (1 - psi) / propellant.density)
+        return force_term, volume_term
+
+    def get_pressure_factors(self, pressure_target: PressureTarget) -> Tuple[float, float]:
+        r"""
+        Coefficients $k_s, k_b$ relating the targeted pressure to the average pressure $p$ at
+        rest, as $p (1 + k_b \omega) / (1 + k_s \omega)$ for a gross charge mass $\omega$, see
+        `minimalist_interior_ballistics.state.State.shot_pressure` and
+        `minimalist_interior_ballistics.state.State.breech_pressure`.
+        """
+        if pressure_target.target == PressureTarget.AVERAGE:
+            return 0.0, 0.0
+
+        k = 1 / (self.shot_mass * (1 + self.loss_fraction))
+        if pressure_target.target == PressureTarget.SHOT:
+            return k / 3, 0.0
+        return k / 3, k / 2
+
+    @staticmethod
+    def estimate_reduced_burnrate(gun: Gun, pressure: float) -> float:
+        r"""
+        Estimates the reduced burn rate of the main charge (by mass) of `gun` that develops
+        `pressure` at peak.
+
+        Notes
+        -----
+        In the closed chamber, `pressure` is reached once a volume fraction $\psi^*$ of the
+        propellant has burnt, which is solved from the Nobel-Abel equation of state. The shot
+        moves over a time scale of $t_m = \sqrt{m l_0 / (S p)}$, and the peak is reached when
+        $\psi^*$ burns within that time, at a rate of $u_1 p^n$ in Z. Fitting
+        $u_1 = K / (t_m p^n)$ to the solutions of the test problems gives $K \approx 2 \psi^*$,
+        to within a factor of 1.25 (rms) over a range of loading densities, chamber volumes
+        and pressure targets.
+
+        Returns `minimalist_interior_ballistics.REDUCED_BURN_RATE_INITIAL_GUESS` where
+        `pressure` cannot be reached in the closed chamber.
+        """
+        gas_energy = sum(charge.force * mass for charge, mass in zip(gun.charges, gun.charge_masses))
+        solid_volume = sum(mass / charge.density for charge, mass in zip(gun.charges, gun.charge_masses))
+        covolume = sum(mass * charge.covolume for charge, mass in zip(gun.charges, gun.charge_masses))
+
+        denominator = gas_energy - pressure * (solid_volume - covolume)
+        psi = pressure * (gun.chamber_volume - solid_volume) / denominator if denominator > 0 else 0
+        if not 0 < psi <= 1:
+            return REDUCED_BURN_RATE_INITIAL_GUESS
+
+        main_charge = gun.charges[gun.charge_masses.index(max(gun.charge_masses))]
+        motion_time = (gun.shot_mass * gun.l_0 / (gun.cross_section * pressure)) ** 0.5
+        return 2 * psi / (motion_time * pressure**main_charge.pressure_exponent)
+
+    @accepts_charge_mass
+    @memoized_at_pressure
     def get_gun_at_pressure(
         self,
         pressure_target: PressureTarget,
@@ -158,29 +296,45 @@ class BaseProblem:
         elif pressure_target.get_difference(unitary_gun.get_start_state(n_intg=self.n_intg, acc=self.acc)) > 0:
             raise ValueError("specified pressure is less than the starting state.")
 
+        values = {}
+
         def f(reduced_burnrate: float) -> float:
-            test_gun = self.get_gun(
-                reduced_burnrates=get_burnrates(reduced_burnrate),
-                charge_masses=charge_masses,
-                chamber_volume=chamber_volume,
-            )
-            states = test_gun.to_burnout(n_intg=self.n_intg, acc=self.acc, abort_travel=self.travel)
-            delta_p = pressure_target.get_difference(states.get_state_by_marker(Significance.PEAK_PRESSURE))
-            return delta_p
+            # memoized, as `minimalist_interior_ballistics.num.dekker` re-evaluates the bracket it is given.
+            if reduced_burnrate not in values:
+                test_gun = self.get_gun(
+                    reduced_burnrates=get_burnrates(reduced_burnrate),
+                    charge_masses=charge_masses,
+                    chamber_volume=chamber_volume,
+                )
+                states = test_gun.to_burnout(n_intg=self.n_intg, acc=self.acc, abort_travel=self.travel)
+                values[reduced_burnrate] = pressure_target.get_difference(
+                    states.get_state_by_marker(Significance.PEAK_PRESSURE)
+                )
+            return values[reduced_burnrate]
 
         """
         first, find two estimate, est and est' (rendered as est_prime) such that
-        the solution is bracketed
+        the solution is bracketed. Starting from the physical estimate, each probe is placed by
+        extrapolating log peak pressure linearly in log reduced burn rate, with the slope measured
+        from the last two probes, overshooting such that the next probe likely crosses the target.
+        The step is bounded to an order of magnitude.
         """
-        est = est_prime = REDUCED_BURN_RATE_INITIAL_GUESS
+        est = est_prime = self.estimate_reduced_burnrate(unitary_gun, pressure_target.value)
         f_est = f_est_prime = f(est)
+        slope = REDUCED_BURN_RATE_PRESSURE_SLOPE
         while f_est * f_est_prime >= 0:
-            if f_est > 0:  # burnt too fast
-                est, est_prime = est / 10, est  # reduce rbr by 1 oom
-            elif f_est == 0:  # this is *exceedingly* unlikely to happen but still.
-                est, est_prime = est / 10, est * 10
-            else:
-                est, est_prime = est * 10, est
+            if f_est == 0:  # this is *exceedingly* unlikely to happen but still.
+                est_prime = est
+                break
+
+            log_ratio = log(pressure_target.value / (f_est + pressure_target.value))
+            if est != est_prime:
+                slope = log((f_est + pressure_target.value) / (f_est_prime + pressure_target.value)) / log(
+                    est / est_prime
+                )
+            step = 1.25 * log_ratio / max(slope, 0.1)
+            step = copysign(min(max(abs(step), log(1.1)), log(10)), log_ratio)
+            est, est_prime = est * exp(step), est
             f_est, f_est_prime = f(est), f_est
 
         """
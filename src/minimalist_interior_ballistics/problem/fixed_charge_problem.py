@@ -8,9 +8,10 @@ from attrs import frozen, asdict
 
 from .. import Significance
 from ..gun import Gun
-from ..num import dekker, gss_max
+from ..num import brent_max
 from .base_problem import BaseProblem, accepts_charge_mass
 from .pressure_target import PressureTarget
+from .session import ProblemSession
 
 logger = logging.getLogger(__name__)
 
@@ -55,42 +56,32 @@ class FixedChargeProblem(BaseProblem):
         -----
         For more explanation of the rationale, reference
         `minimalist_interior_ballistics.problem.fixed_volume_problem.FixedVolumeProblem.get_charge_mass_limits`.
+        Here, the upper limit is linear in the targeted pressure, as the charge is fixed.
 
         """
         logger.info("get chamber volume limits")
 
-        def f_ff(chamber_volume: float) -> float:
-            test_gun = self.get_gun(
-                charge_mass=self.charge_mass,
-                charge_masses=self.charge_masses,
-                chamber_volume=chamber_volume,
-                reduced_burnrates=tuple(1.0 for _ in self.propellants),
-            )
-            return test_gun.bomb_free_fraction - self.acc
-
-        chamber_min_volume = self.chamber_min_volume
-
-        bound = chamber_min_volume
-        while f_ff(bound) <= 0:
-            bound *= 2
-
-        lower_limit = max(dekker(f=f_ff, x_0=chamber_min_volume, x_1=bound, tol=chamber_min_volume * self.acc))
+        lower_limit = max(
+            self.get_covolume(charge_mass=self.charge_mass, charge_masses=self.charge_masses) / (1 - self.acc),
+            self.chamber_min_volume,
+        )
 
-        safe_target = pressure_target * (1 + self.acc)
+        # with the charge fixed, the safe target converts directly to an average pressure.
+        gross_charge_mass = self.charge_mass or sum(self.charge_masses)
+        k_s, k_b = self.get_pressure_factors(pressure_target=pressure_target)
+        safe_pressure = (
+            pressure_target.value * (1 + self.acc) * (1 + k_s * gross_charge_mass) / (1 + k_b * gross_charge_mass)
+        )
+        force_term, volume_term = self.get_bomb_coefficients(
+            charge_mass=self.charge_mass, charge_masses=self.charge_masses
+        )
+        upper_limit = volume_term + force_term / safe_pressure
 
-        def f_p(chamber_volume: float) -> float:
-            test_gun = self.get_gun(
-                charge_mass=self.charge_mass,
-                charge_masses=self.charge_masses,
-                chamber_volume=chamber_volume,
-                reduced_burnrates=tuple(1.0 for _ in self.propellants),
+        if upper_limit < lower_limit:
+            raise ValueError(
+                f"{pressure_target.describe()} cannot be developed above the minimum chamber volume "
+                + f"{lower_limit * 1e3:.3f} L."
             )
-            return safe_target.get_difference(test_gun.get_bomb_state())
-
-        while f_p(bound) >= 0:
-            bound *= 2
-
-        upper_limit = min(dekker(f=f_p, x_0=lower_limit, x_1=bound, tol=chamber_min_volume * self.acc))
 
         logger.info(
             f"chamber volume limit for {pressure_target.describe()} solved to be "
@@ -103,6 +94,7 @@ class FixedChargeProblem(BaseProblem):
         chamber_volume: float,
         pressure_target: PressureTarget,
         reduced_burnrate_ratios: list[float] | tuple[float, ...] = tuple([1.0]),
+        chamber_volume_limits: Optional[Tuple[float, float]] = None,
     ) -> Gun:
         """
         solves the reduced burn rate such that the peak pressure developed in bore
@@ -120,6 +112,8 @@ class FixedChargeProblem(BaseProblem):
             volume of the chamber.
         pressure_target: float, `minimalist_interior_ballistics.problem.pressure_target.PressureTarget`
             the pressure to target, along with its point-of-measurement.
+        chamber_volume_limits: tuple[float, float], optional
+            the result of `FixedChargeProblem.get_chamber_volume_limits`, if already known.
 
         Raises
         ------
@@ -135,7 +129,7 @@ class FixedChargeProblem(BaseProblem):
         """
 
         logger.info(f"solve reduced burn rate for {pressure_target.describe()}")
-        min_vol, max_vol = self.get_chamber_volume_limits(pressure_target=pressure_target)
+        min_vol, max_vol = chamber_volume_limits or self.get_chamber_volume_limits(pressure_target=pressure_target)
 
         valid_range_prompt = f"valid range of chamber_volume: [{min_vol * 1e3:.3f} L, {max_vol * 1e3:.3f} L]"
         if chamber_volume < min_vol:
@@ -164,11 +158,12 @@ class FixedChargeProblem(BaseProblem):
         self,
         pressure_target: PressureTarget,
         reduced_burnrate_ratios: list[float] | tuple[float, ...] = tuple([1.0]),
+        chamber_volume_limits: Optional[Tuple[float, float]] = None,
     ) -> tuple[Gun, Gun, Gun]:
 
         logger.info("getting limiting cases for" + f" {pressure_target.describe()}")
 
-        vol_min, vol_max = self.get_chamber_volume_limits(pressure_target=pressure_target)
+        vol_min, vol_max = chamber_volume_limits or self.get_chamber_volume_limits(pressure_target=pressure_target)
 
         def get_gun_with_volume(chamber_volume: float) -> Gun:
             return self.get_gun_at_pressure(
@@ -181,12 +176,12 @@ class FixedChargeProblem(BaseProblem):
 
         def f(chamber_volume: float) -> float:
             gun = get_gun_with_volume(chamber_volume=chamber_volume)
-            states = gun.to_travel(travel=self.travel, n_intg=self.n_intg, acc=self.acc)
+            states = self.to_travel(gun)
             muzzle_state = states.get_state_by_marker(significance=Significance.MUZZLE)
 
             return muzzle_state.velocity
 
-        vol_opt = sum(gss_max(f, x_0=vol_min, x_1=vol_max, tol=self.chamber_min_volume * self.acc)) * 0.5
+        vol_opt, _ = brent_max(f, x_0=vol_min, x_1=vol_max, tol=self.chamber_min_volume * self.acc)
 
         results = (
             get_gun_with_volume(chamber_volume=vol_min),
@@ -207,57 +202,72 @@ class FixedChargeProblem(BaseProblem):
 
         logger.info(f"solve chamber volume for {velocity_target:.1f} m/s and {pressure_target.describe()}")
 
-        gun_vol_min, gun_opt, gun_vol_max = self.get_limiting_guns_at_pressure(
+        results = self.get_session(
             pressure_target=pressure_target, reduced_burnrate_ratios=reduced_burnrate_ratios
+        ).solve_for_velocity(velocity_target=velocity_target)
+
+        logger.info(
+            "low chamber volume "
+            + (f"{results[0].chamber_volume*1e3:.1f} L " if results[0] else "impossible ")
+            + "high chamber volume "
+            + (f"{results[1].chamber_volume*1e3:.1f} L " if results[1] else "impossible ")
         )
 
-        def get_mv(gun: Gun) -> float:
-            return gun.to_travel(n_intg=self.n_intg, acc=self.acc).muzzle_velocity
+        return results
 
-        v_vol_min = get_mv(gun_vol_min)
-        v_vol_max = get_mv(gun_vol_max)
-        v_opt = get_mv(gun_opt)
+    def get_session(
+        self,
+        pressure_target: PressureTarget,
+        reduced_burnrate_ratios: list[float] | tuple[float, ...] = tuple([1.0]),
+    ) -> FixedChargeSession:
+        """
+        a session of this problem at `pressure_target`, which answers repeated queries for
+        velocity or reduced burn rate with the limits and limiting guns solved only once, see
+        `minimalist_interior_ballistics.problem.session.ProblemSession`.
+        """
+        return FixedChargeSession(
+            problem=self, pressure_target=pressure_target, reduced_burnrate_ratios=reduced_burnrate_ratios
+        )
 
-        v_min = min(v_vol_min, v_vol_max)
-        logger.info(f"velocity from {v_min:.3f} and {v_opt:.3f} m/s")
 
-        vol_min = gun_vol_min.chamber_volume
-        vol_max = gun_vol_max.chamber_volume
-        vol_opt = gun_opt.chamber_volume
+@frozen(kw_only=True)
+class FixedChargeSession(ProblemSession):
+    """`minimalist_interior_ballistics.problem.session.ProblemSession` over the chamber volume."""
 
-        def f(chamber_volume: float) -> Gun:
-            return self.get_gun_at_pressure(
-                reduced_burnrate_ratios=reduced_burnrate_ratios,
-                chamber_volume=chamber_volume,
-                charge_mass=self.charge_mass,
-                charge_masses=self.charge_masses,
-                pressure_target=pressure_target,
-            )
+    problem: FixedChargeProblem
 
-        def g(vol_i: float, vol_j: float, v_i: float, v_j: float) -> Optional[Gun]:
-            if min(v_i, v_j) <= velocity_target <= max(v_i, v_j):
-                # target velocity is achievable, find the corresponding charge mass to get it.
-                chamber_volume, _ = dekker(
-                    f=lambda x: get_mv(f(x)) - velocity_target,
-                    x_0=vol_i,
-                    x_1=vol_j,
-                    tol=self.acc * self.chamber_min_volume,
-                )
-                gun = f(chamber_volume=chamber_volume)
-                return gun
-            else:
-                return None
+    @cached_property
+    def limits(self) -> Tuple[float, float]:
+        return self.problem.get_chamber_volume_limits(pressure_target=self.pressure_target)
 
-        results = (
-            g(vol_i=vol_min, vol_j=vol_opt, v_i=v_vol_min, v_j=v_opt),
-            g(vol_i=vol_opt, vol_j=vol_max, v_i=v_opt, v_j=v_vol_max),
+    @cached_property
+    def limiting_guns(self) -> Tuple[Gun, Gun, Gun]:
+        return self.problem.get_limiting_guns_at_pressure(
+            pressure_target=self.pressure_target,
+            reduced_burnrate_ratios=self.reduced_burnrate_ratios,
+            chamber_volume_limits=self.limits,
         )
 
-        logger.info(
-            "low chamber volume "
-            + (f"{results[0].chamber_volume*1e3:.1f} L " if results[0] else "impossible ")
-            + "high chamber volume "
-            + (f"{results[1].chamber_volume*1e3:.1f} L " if results[1] else "impossible ")
+    @cached_property
+    def tolerance(self) -> float:
+        return self.problem.acc * self.problem.chamber_min_volume
+
+    def get_design(self, gun: Gun) -> float:
+        return gun.chamber_volume
+
+    def get_gun_at(self, design: float) -> Gun:
+        return self.problem.get_gun_at_pressure(
+            reduced_burnrate_ratios=self.reduced_burnrate_ratios,
+            chamber_volume=design,
+            charge_mass=self.problem.charge_mass,
+            charge_masses=self.problem.charge_masses,
+            pressure_target=self.pressure_target,
         )
 
-        return results
+    def get_gun(self, design: float) -> Gun:
+        return self.problem.solve_reduced_burn_rate_for_volume_at_pressure(
+            chamber_volume=design,
+            pressure_target=self.pressure_target,
+            reduced_burnrate_ratios=self.reduced_burnrate_ratios,
+            chamber_volume_limits=self.limits,
+        )
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING, Optional, Tuple
 
-from attrs import asdict, frozen
+from attrs import asdict, field, frozen
 
 from .. import Significance
 from ..gun import Gun
-from ..num import dekker, gss_max
+from ..num import brent_max
 from .base_problem import BaseProblem, accepts_charge_mass
 from .pressure_target import PressureTarget
+from .session import ProblemSession
 
 
 logger = logging.getLogger(__name__)
@@ -87,35 +89,37 @@ class FixedVolumeProblem(BaseProblem):
         Since the returned results are required for further numerical solving, care is
         taken that the returned results are fudged on the conservative side, to ensure
         the interior ballistics system is always solved in domain.
+
+        Both limits are solved in closed form, as the bomb state follows the Noble-Abel equation
+        of state, with coefficients linear in the charge mass, see
+        `minimalist_interior_ballistics.problem.base_problem.BaseProblem.get_bomb_coefficients`.
+        The lower limit is the positive root of a quadratic for shot and breech pressure targets,
+        which depend on the charge mass as well.
         """
         logger.info("get charge mass limits")
 
-        def f_ff(total_charge_mass: float) -> float:
-            test_gun = self.get_gun(
-                chamber_volume=self.chamber_volume,
-                charge_masses=self.get_charge_masses(
-                    total_charge_mass=total_charge_mass, charge_mass_ratios=charge_mass_ratios
-                ),
-                reduced_burnrates=tuple(1.0 for _ in self.propellants),
-            )
-            return test_gun.bomb_free_fraction - self.acc
+        # per unit of total charge mass, since all the terms are linear in it.
+        unit_charge_masses = self.get_charge_masses(total_charge_mass=1.0, charge_mass_ratios=charge_mass_ratios)
 
         chamber_fill_mass = self.get_fill_mass(charge_mass_ratios=charge_mass_ratios)
-        upper_limit = min(dekker(f=f_ff, x_0=0, x_1=chamber_fill_mass, tol=chamber_fill_mass * self.acc))
-
-        safe_target = pressure_target * (1 + self.acc)
+        upper_limit = min(
+            self.chamber_volume * (1 - self.acc) / self.get_covolume(charge_masses=unit_charge_masses),
+            chamber_fill_mass,
+        )
 
-        def f_p(total_charge_mass: float) -> float:
-            test_gun = self.get_gun(
-                chamber_volume=self.chamber_volume,
-                charge_masses=self.get_charge_masses(
-                    total_charge_mass=total_charge_mass, charge_mass_ratios=charge_mass_ratios
-                ),
-                reduced_burnrates=tuple(1.0 for _ in self.propellants),
+        # the bomb pressure, as targeted, equals the safe target at the root of a quadratic.
+        safe_pressure = pressure_target.value * (1 + self.acc)
+        force_term, volume_term = self.get_bomb_coefficients(charge_masses=unit_charge_masses)
+        k_s, k_b = self.get_pressure_factors(pressure_target=pressure_target)
+        a = force_term * k_b + safe_pressure * k_s * volume_term
+        b = force_term + safe_pressure * (volume_term - k_s * self.chamber_volume)
+        c = safe_pressure * self.chamber_volume
+        lower_limit = 2 * c / (b + (b**2 + 4 * a * c) ** 0.5)
+
+        if lower_limit > upper_limit:
+            raise ValueError(
+                f"{pressure_target.describe()} cannot be developed below the maximum charge mass {upper_limit:.3f} kg."
             )
-            return safe_target.get_difference(test_gun.get_bomb_state())
-
-        lower_limit = max(dekker(f_p, x_0=0, x_1=upper_limit, tol=chamber_fill_mass * self.acc))
 
         logger.info(
             f"charge mass limit for {pressure_target.describe()} solved to be "
@@ -130,6 +134,7 @@ class FixedVolumeProblem(BaseProblem):
         pressure_target: PressureTarget,
         charge_masses=tuple[float, ...],
         reduced_burnrate_ratios: list[float] | tuple[float, ...] = tuple([1.0]),
+        charge_mass_limits: Optional[Tuple[float, float]] = None,
     ) -> Gun:
         """
         solves the reduced burn rate such that the peak pressure developed in bore
@@ -145,6 +150,8 @@ class FixedVolumeProblem(BaseProblem):
             ratio of reduced burnrates be provided.
         pressure_target: float, `minimalist_interior_ballistics.problem.pressure_target.PressureTarget`
             the pressure to target, along with its point-of-measurement.
+        charge_mass_limits: tuple[float, float], optional
+            the result of `FixedVolumeProblem.get_charge_mass_limits`, if already known.
 
         Raises
         ------
@@ -161,7 +168,7 @@ class FixedVolumeProblem(BaseProblem):
 
         logger.info(f"solve reduced burn rate for {pressure_target.describe()}")
 
-        min_mass, max_mass = self.get_charge_mass_limits(
+        min_mass, max_mass = charge_mass_limits or self.get_charge_mass_limits(
             pressure_target=pressure_target, charge_mass_ratios=charge_masses
         )
 
@@ -188,11 +195,12 @@ class FixedVolumeProblem(BaseProblem):
         pressure_target: PressureTarget,
         charge_mass_ratios: list[float] | tuple[float, ...] = tuple([1.0]),
         reduced_burnrate_ratios: list[float] | tuple[float, ...] = tuple([1.0]),
+        charge_mass_limits: Optional[Tuple[float, float]] = None,
     ) -> Tuple[Gun, Gun, Gun]:
 
         logger.info("getting limiting cases for" + f" {pressure_target.describe()}")
 
-        mass_min, mass_max = self.get_charge_mass_limits(
+        mass_min, mass_max = charge_mass_limits or self.get_charge_mass_limits(
             pressure_target=pressure_target, charge_mass_ratios=charge_mass_ratios
         )
 
@@ -208,14 +216,14 @@ class FixedVolumeProblem(BaseProblem):
 
         def f(total_charge_mass: float) -> float:
             gun = get_gun_with_charge_mass(total_charge_mass=total_charge_mass)
-            states = gun.to_travel(travel=self.travel, n_intg=self.n_intg, acc=self.acc)
+            states = self.to_travel(gun)
             muzzle_state = states.get_state_by_marker(significance=Significance.MUZZLE)
 
             return muzzle_state.velocity
 
         chamber_fill_mass = self.get_fill_mass(charge_mass_ratios=charge_mass_ratios)
 
-        mass_opt = sum(gss_max(f=f, x_0=mass_min, x_1=mass_max, tol=chamber_fill_mass * self.acc)) * 0.5
+        mass_opt, _ = brent_max(f=f, x_0=mass_min, x_1=mass_max, tol=chamber_fill_mass * self.acc)
 
         results = (
             get_gun_with_charge_mass(total_charge_mass=mass_min),
@@ -237,58 +245,84 @@ class FixedVolumeProblem(BaseProblem):
 
         logger.info(f"solve charge mass for {velocity_target:.1f} m/s and {pressure_target.describe()}")
 
-        gun_mass_min, gun_opt, gun_mass_max = self.get_limiting_guns_at_pressure(
+        results = self.get_session(
+            pressure_target=pressure_target,
+            charge_mass_ratios=charge_mass_ratios,
+            reduced_burnrate_ratios=reduced_burnrate_ratios,
+        ).solve_for_velocity(velocity_target=velocity_target)
+
+        logger.info(
+            "low charge mass "
+            + (f"{results[0].gross_charge_mass:.3f} kg " if results[0] else "impossible ")
+            + "high charge mass "
+            + (f"{results[1].gross_charge_mass:.3f} kg " if results[1] else "impossible ")
+        )
+        return results
+
+    def get_session(
+        self,
+        pressure_target: PressureTarget,
+        charge_mass_ratios: list[float] | tuple[float, ...] = tuple([1.0]),
+        reduced_burnrate_ratios: list[float] | tuple[float, ...] = tuple([1.0]),
+    ) -> FixedVolumeSession:
+        """
+        a session of this problem at `pressure_target`, which answers repeated queries for
+        velocity or reduced burn rate with the limits and limiting guns solved only once, see
+        `minimalist_interior_ballistics.problem.session.ProblemSession`.
+        """
+        return FixedVolumeSession(
+            problem=self,
             pressure_target=pressure_target,
             charge_mass_ratios=charge_mass_ratios,
             reduced_burnrate_ratios=reduced_burnrate_ratios,
         )
 
-        mass_min = gun_mass_min.gross_charge_mass
-        mass_max = gun_mass_max.gross_charge_mass
-        mass_opt = gun_opt.gross_charge_mass
 
-        def get_mv(gun: Gun) -> float:
-            return gun.to_travel(travel=self.travel, n_intg=self.n_intg, acc=self.acc).muzzle_velocity
+@frozen(kw_only=True)
+class FixedVolumeSession(ProblemSession):
+    """`minimalist_interior_ballistics.problem.session.ProblemSession` over the total charge mass."""
 
-        v_mass_min = get_mv(gun_mass_min)
-        v_mass_max = get_mv(gun_mass_max)
-        v_min = min(v_mass_min, v_mass_max)
-        v_max = get_mv(gun_opt)
-        logger.info(f"velocity from {v_min:.3f} to {v_max:.3f} m/s")
+    problem: FixedVolumeProblem
+    charge_mass_ratios: tuple[float, ...] = field(default=(1.0,), converter=tuple)
 
-        chamber_fill_mass = self.get_fill_mass(charge_mass_ratios=charge_mass_ratios)
+    @cached_property
+    def limits(self) -> Tuple[float, float]:
+        return self.problem.get_charge_mass_limits(
+            pressure_target=self.pressure_target, charge_mass_ratios=self.charge_mass_ratios
+        )
 
-        def f(charge_mass: float) -> Gun:
-            gun = self.get_gun_at_pressure(
-                chamber_volume=self.chamber_volume,
-                charge_masses=self.get_charge_masses(
-                    total_charge_mass=charge_mass, charge_mass_ratios=charge_mass_ratios
-                ),
-                reduced_burnrate_ratios=reduced_burnrate_ratios,
-                pressure_target=pressure_target,
-            )
-            return gun
-
-        def g(mass_i: float, mass_j: float, v_i: float, v_j: float) -> Optional[Gun]:
-            if min(v_i, v_j) <= velocity_target <= max(v_i, v_j):
-                # target velocity is achievable, find the corresponding charge mass to get it.
-                charge_mass, _ = dekker(
-                    f=lambda x: get_mv(f(x)) - velocity_target, x_0=mass_i, x_1=mass_j, tol=self.acc * chamber_fill_mass
-                )
-                gun = f(charge_mass=charge_mass)
-                return gun
-            else:
-                return None
+    @cached_property
+    def limiting_guns(self) -> Tuple[Gun, Gun, Gun]:
+        return self.problem.get_limiting_guns_at_pressure(
+            pressure_target=self.pressure_target,
+            charge_mass_ratios=self.charge_mass_ratios,
+            reduced_burnrate_ratios=self.reduced_burnrate_ratios,
+            charge_mass_limits=self.limits,
+        )
 
-        results = (
-            g(mass_i=mass_min, mass_j=mass_opt, v_i=v_mass_min, v_j=v_max),
-            g(mass_i=mass_opt, mass_j=mass_max, v_i=v_max, v_j=v_mass_max),
+    @cached_property
+    def tolerance(self) -> float:
+        return self.problem.acc * self.problem.get_fill_mass(charge_mass_ratios=self.charge_mass_ratios)
+
+    def get_design(self, gun: Gun) -> float:
+        return gun.gross_charge_mass
+
+    def get_gun_at(self, design: float) -> Gun:
+        return self.problem.get_gun_at_pressure(
+            chamber_volume=self.problem.chamber_volume,
+            charge_masses=self.problem.get_charge_masses(
+                total_charge_mass=design, charge_mass_ratios=self.charge_mass_ratios
+            ),
+            reduced_burnrate_ratios=self.reduced_burnrate_ratios,
+            pressure_target=self.pressure_target,
         )
 
-        logger.info(
-            "low charge mass "
-            + (f"{results[0].gross_charge_mass:.3f} kg " if results[0] else "impossible ")
-            + "high charge mass "
-            + (f"{results[1].gross_charge_mass:.3f} kg " if results[1] else "impossible ")
+    def get_gun(self, design: float) -> Gun:
+        return self.problem.solve_reduced_burn_rate_for_charge_at_pressure(
+            pressure_target=self.pressure_target,
+            charge_masses=self.problem.get_charge_masses(
+                total_charge_mass=design, charge_mass_ratios=self.charge_mass_ratios
+            ),
+            reduced_burnrate_ratios=self.reduced_burnrate_ratios,
+            charge_mass_limits=self.limits,
         )
-        return results
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from functools import cached_property
+from typing import Optional, Tuple
+
+from attrs import field, frozen
+
+from ..gun import Gun
+from ..num import dekker
+from .base_problem import BaseProblem
+from .pressure_target import PressureTarget
+
+logger = logging.getLogger(__name__)
+
+
+@frozen(kw_only=True)
+class ProblemSession(ABC):
+    """
+    Solutions of a problem at one pressure target, for answering many queries against it.
+
+    The design variable of the problem, e.g. the charge mass of a
+    `minimalist_interior_ballistics.problem.FixedVolumeProblem`, is limited, and the velocity
+    reaches a maximum between these limits, see `ProblemSession.limiting_guns`. These are found
+    once per session, as opposed to once per call of the problem methods, and shared by every
+    later query.
+
+    Each muzzle velocity found while solving for a velocity is kept, such that the next solution
+    starts from the closest pair of known designs bracketing its target, instead of from the
+    limits. Guns and their trajectories are furthermore memoized by the problem itself, see
+    `minimalist_interior_ballistics.problem.BaseProblem.gun_cache`.
+
+    Sessions are created by the problems, and not directly, e.g. by
+    `minimalist_interior_ballistics.problem.FixedVolumeProblem.get_session`.
+    """
+
+    problem: BaseProblem
+    pressure_target: PressureTarget
+    reduced_burnrate_ratios: tuple[float, ...] = field(default=(1.0,), converter=tuple)
+    velocities: dict[float, float] = field(factory=dict, init=False)
+    """muzzle velocities known so far, by design."""
+
+    @property
+    @abstractmethod
+    def limits(self) -> Tuple[float, float]:
+        """lower and upper limit of the design variable."""
+
+    @property
+    @abstractmethod
+    def limiting_guns(self) -> Tuple[Gun, Gun, Gun]:
+        """guns at the lower limit, at the maximum velocity and at the upper limit."""
+
+    @property
+    @abstractmethod
+    def tolerance(self) -> float:
+        """tolerance to which the design variable is solved."""
+
+    @abstractmethod
+    def get_design(self, gun: Gun) -> float:
+        """the design variable of a gun of this session."""
+
+    @abstractmethod
+    def get_gun_at(self, design: float) -> Gun:
+        """the gun at the pressure target with `design`, without validation against the limits."""
+
+    @abstractmethod
+    def get_gun(self, design: float) -> Gun:
+        """
+        the gun at the pressure target with `design`, after validation against
+        `ProblemSession.limits`.
+
+        Raises
+        ------
+        ValueError
+            if `design` is beyond the limits.
+        """
+
+    @cached_property
+    def designs(self) -> Tuple[float, float, float]:
+        """design variable of `ProblemSession.limiting_guns`."""
+        designs = tuple(self.get_design(gun) for gun in self.limiting_guns)
+        for design, gun in zip(designs, self.limiting_guns):
+            self.velocities[design] = self.problem.to_travel(gun).muzzle_velocity
+        return designs
+
+    @property
+    def optimal_gun(self) -> Gun:
+        """the gun developing the highest velocity at the pressure target."""
+        return self.limiting_guns[1]
+
+    @cached_property
+    def velocity_envelope(self) -> Tuple[float, float]:
+        """range of velocities that can be solved for, see `ProblemSession.solve_for_velocity`."""
+        v_lower, v_opt, v_upper = (self.velocities[design] for design in self.designs)
+        v_min = min(v_lower, v_upper)
+        logger.info(f"velocity from {v_min:.3f} to {v_opt:.3f} m/s")
+        return v_min, v_opt
+
+    def get_velocity(self, design: float) -> float:
+        """muzzle velocity of the gun at `design`, kept in `ProblemSession.velocities`."""
+        try:
+            return self.velocities[design]
+        except KeyError:
+            pass
+        velocity = self.problem.to_travel(self.get_gun_at(design)).muzzle_velocity
+        self.velocities[design] = velocity
+        return velocity
+
+    def solve_for_velocity(self, velocity_target: float) -> Tuple[Optional[Gun], Optional[Gun]]:
+        """
+        Solves for the designs developing `velocity_target`, at or below and at or above the
+        optimal design respectively.
+
+        Parameters
+        ----------
+        velocity_target: float
+            the muzzle velocity to target.
+
+        Returns
+        -------
+        lower_gun, upper_gun: `minimalist_interior_ballistics.gun.Gun`, optional
+            the solutions, if `velocity_target` is reached from the respective limit.
+        """
+        v_min, v_max = self.velocity_envelope
+        if not v_min <= velocity_target <= v_max:
+            return None, None
+
+        lower_limit, optimum, upper_limit = self.designs
+        return (
+            self.solve_between(lower_limit, optimum, velocity_target),
+            self.solve_between(optimum, upper_limit, velocity_target),
+        )
+
+    def solve_between(self, design_i: float, design_j: float, velocity_target: float) -> Optional[Gun]:
+        """solves for `velocity_target` between two designs of known velocity, see `ProblemSession.designs`."""
+        v_i, v_j = self.velocities[design_i], self.velocities[design_j]
+        if not min(v_i, v_j) <= velocity_target <= max(v_i, v_j):
+            return None
+
+        # the velocity is monotonic between the limits and the optimum.
+        known_designs = sorted(x for x in self.velocities if design_i <= x <= design_j)
+        for design_i, design_j in zip(known_designs, known_designs[1:]):
+            v_i, v_j = self.velocities[design_i], self.velocities[design_j]
+            if min(v_i, v_j) <= velocity_target <= max(v_i, v_j):
+                break
+
+        design, _ = dekker(
+            f=lambda x: self.get_velocity(x) - velocity_target, x_0=design_i, x_1=design_j, tol=self.tolerance
+        )
+        return self.get_gun_at(design)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import struct
 import sys
-from collections import UserList
-from functools import cached_property
-from math import inf
-from typing import TYPE_CHECKING, Iterable, Optional
+from array import array
+from collections.abc import MutableSequence, Sequence
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Optional, Union
 
 from attrs import field, frozen
 from tabulate import tabulate
@@ -30,19 +31,19 @@ class State:
     #     # this enables sorting and bisect operation with array of `minimalist_interior_ballistics.state.State`.
     #     return self.time < other.time
 
-    @cached_property
+    @property
     def time(self) -> float:
         return self.sv.time
 
-    @cached_property
+    @property
     def travel(self) -> float:
         return self.sv.travel
 
-    @cached_property
+    @property
     def velocity(self) -> float:
         return self.sv.velocity
 
-    @cached_property
+    @property
     def burnup_fractions(self) -> tuple[float, ...]:
         return self.sv.burnup_fractions
 
@@ -61,10 +62,7 @@ class State:
 
     @cached_property
     def volume_burnup_fractions(self) -> tuple[float, ...]:
-        return tuple(
-            charge.psi(max(min(burnup_fraction, charge.Z_k), 0))
-            for charge, burnup_fraction in zip(self.gun.charges, self.burnup_fractions)
-        )
+        return self.gun.get_volume_burnup_fractions(self.burnup_fractions)
 
     @cached_property
     def gross_volume_burnup_fraction(self) -> float:
@@ -88,26 +86,23 @@ class State:
         of conditions encountered in conventional firearms (although it is of more
         concern in light gas guns).
         """
-        l, v = self.travel, self.velocity
-        l_psi = self.gun.l_0 * (1 - self.gun.incompressible_fraction(self.volume_burnup_fractions))
-        if l_psi <= 0:
-            return inf
-        else:
-            return self.gun.gas_energy(psis=self.volume_burnup_fractions, v=v) / (self.gun.cross_section * (l_psi + l))
+        return self.gun.get_average_pressure(
+            travel=self.travel, velocity=self.velocity, psis=self.volume_burnup_fractions
+        )
 
     @cached_property
     def shot_pressure(self) -> float:
         """the shot-base pressure in the equivalent gun. For more info refer to
         `average_pressure`.
         """
-        return self.average_pressure / (1 + self.gun.gross_charge_mass / (3 * self.gun.shot_mass * self.gun.phi_1))
+        return self.average_pressure / self.gun.shot_pressure_ratio
 
     @cached_property
     def breech_pressure(self) -> float:
         """the breech face pressure in the equivalent gun. For more info refer to
         `average_pressure`.
         """
-        return self.shot_pressure * (1 + self.gun.gross_charge_mass / (2 * self.gun.shot_mass * self.gun.phi_1))
+        return self.shot_pressure * self.gun.breech_pressure_ratio
 
     @cached_property
     def is_burnout(self) -> bool:
@@ -183,34 +178,458 @@ class StateVector:
         return self * (1 / scalar)
 
 
+@lru_cache(maxsize=None)
+def _compact_layout(n_charges: int) -> struct.Struct:
+    return struct.Struct(f"{6 + n_charges}d")
+
+
+class CompactState:
+    """
+    Compact, read-only representation of a `State`, as returned for each row of a
+    `CompactStateList`, or built from a `State` with `CompactState.from_state`.
+
+    Notes
+    -----
+    Besides the gun, marker and whether the projectile has started, the time, travel, velocity,
+    average, shot and breech pressure, and the burn-up fractions are packed as doubles into a
+    single `bytes` object, such that no float object is allocated per value, and no
+    `StateVector` is kept. The pressures are computed once, on construction, into fixed fields.
+    The overhead of the slotted instance and of the `bytes` object remains, so for keeping large
+    numbers of points, keep a `CompactStateList` instead, see `StateList.compact`.
+
+    Conversely, each access unpacks the values anew, and the volume burn-up fractions are
+    recomputed on every access. Use `CompactState.to_state` where these are used repeatedly.
+    """
+
+    __slots__ = ("gun", "marker", "is_started", "_data")
+
+    def __init__(self, *, gun: Gun, y: list[float], average_pressure: float, marker: Significance, is_started=True):
+        shot_pressure = average_pressure / gun.shot_pressure_ratio
+        breech_pressure = shot_pressure * gun.breech_pressure_ratio
+        self.gun = gun
+        self.marker = marker
+        self.is_started = is_started
+        self._data = _compact_layout(len(y) - 3).pack(
+            y[0], y[1], y[2], average_pressure, shot_pressure, breech_pressure, *y[3:]
+        )
+
+    @classmethod
+    def _from_packed(cls, *, gun: Gun, data: bytes, marker: Significance, is_started: bool) -> CompactState:
+        compact_state = cls.__new__(cls)
+        compact_state.gun = gun
+        compact_state.marker = marker
+        compact_state.is_started = is_started
+        compact_state._data = data
+        return compact_state
+
+    @classmethod
+    def from_state(cls, state: State) -> CompactState:
+        return cls(
+            gun=state.gun,
+            y=[state.time, state.travel, state.velocity, *state.burnup_fractions],
+            average_pressure=state.average_pressure,
+            marker=state.marker,
+            is_started=state.is_started,
+        )
+
+    def to_state(self) -> State:
+        time, travel, velocity, *burnup_fractions = self.get_flat()
+        return State(
+            gun=self.gun,
+            sv=StateVector(time=time, travel=travel, velocity=velocity, burnup_fractions=tuple(burnup_fractions)),
+            marker=self.marker,
+            is_started=self.is_started,
+        )
+
+    def get_flat(self) -> list[float]:
+        """returns the flat representation of state, see `minimalist_interior_ballistics.gun.Gun.get_state`."""
+        time, travel, velocity, _, _, _, *burnup_fractions = _compact_layout(len(self.gun.charges)).unpack(self._data)
+        return [time, travel, velocity, *burnup_fractions]
+
+    def _unpack(self, index: int) -> float:
+        return struct.unpack_from("d", self._data, 8 * index)[0]
+
+    @property
+    def time(self) -> float:
+        return self._unpack(0)
+
+    @property
+    def travel(self) -> float:
+        return self._unpack(1)
+
+    @property
+    def velocity(self) -> float:
+        return self._unpack(2)
+
+    @property
+    def average_pressure(self) -> float:
+        return self._unpack(3)
+
+    @property
+    def shot_pressure(self) -> float:
+        return self._unpack(4)
+
+    @property
+    def breech_pressure(self) -> float:
+        return self._unpack(5)
+
+    @property
+    def burnup_fractions(self) -> tuple[float, ...]:
+        return tuple(self.get_flat()[3:])
+
+    @property
+    def volume_burnup_fractions(self) -> tuple[float, ...]:
+        return self.gun.get_volume_burnup_fractions(self.burnup_fractions)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CompactState):
+            return (self.gun, self.marker, self.is_started, self._data) == (
+                other.gun,
+                other.marker,
+                other.is_started,
+                other._data,
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(marker={self.marker!r}, time={self.time!r}, travel={self.travel!r},"
+            + f" velocity={self.velocity!r}, average_pressure={self.average_pressure!r})"
+        )
+
+
 # this is a limitation of pre-Python 3.9 style type annotations
 if sys.version_info >= (3, 9):
-    BaseList = UserList[State]
+    BaseList = MutableSequence[State]
+    BaseCompactList = Sequence[CompactState]
 else:
-    BaseList = UserList
+    BaseList = MutableSequence
+    BaseCompactList = Sequence
 
 
 class StateList(BaseList):
+    """
+    Mutable sequence of `State`, stored column-wise.
+
+    Notes
+    -----
+    Each row is kept as parallel columns of gun, time, travel, velocity, burn-up fractions,
+    marker and whether the projectile has started, such that rows can be added from the flat
+    representation of state (see `minimalist_interior_ballistics.gun.Gun.get_state`) with
+    `StateList.append_flat` or `StateList.from_flat`, and `State` objects are only built when
+    a row is accessed, after which they are kept. The columns are exposed as tuples through
+    `StateList.guns`, `StateList.times`, `StateList.travels`, `StateList.velocities`,
+    `StateList.burnup_fractions`, `StateList.markers` and `StateList.are_started`, from which
+    `StateList.from_columns` builds a list in turn. The average pressure of each row is computed
+    on demand with the compiled kernel of the gun, and kept, see `StateList.average_pressures`,
+    from which `StateList.shot_pressures` and `StateList.breech_pressures` follow. The index of
+    the first row bearing each marker is mapped, such that `StateList.get_state_by_marker` and
+    `StateList.has_state_with_marker` do not scan the rows. The map is updated on append and
+    rebuilt on the first lookup after any other modification.
+    """
+
     def __init__(self, seq: Optional[Iterable[State]] = None) -> None:
-        super().__init__(seq)
+        self._guns: list[Gun] = []
+        self._times: list[float] = []
+        self._travels: list[float] = []
+        self._velocities: list[float] = []
+        self._burnup_fractions: list[tuple[float, ...]] = []
+        self._markers: list[Significance] = []
+        self._is_started: list[bool] = []
+        self._states: list[Optional[State]] = []
+        self._average_pressures: list[Optional[float]] = []
+        self._marker_indices: Optional[Dict[Significance, int]] = {}
+        if seq is not None:
+            self.extend(seq)
+
+    @classmethod
+    def from_flat(
+        cls, gun: Gun, ys: Iterable[list[float]], markers: Iterable[Significance], is_started: bool = True
+    ) -> StateList:
+        """builds a `StateList` from flat states `ys`, each marked by the corresponding `markers`."""
+        states = cls()
+        for y, marker in zip(ys, markers):
+            states.append_flat(gun, y, marker=marker, is_started=is_started)
+        return states
+
+    @classmethod
+    def from_columns(
+        cls,
+        *,
+        guns: Iterable[Gun],
+        times: Iterable[float],
+        travels: Iterable[float],
+        velocities: Iterable[float],
+        burnup_fractions: Iterable[tuple[float, ...]],
+        markers: Iterable[Significance],
+        are_started: Iterable[bool],
+    ) -> StateList:
+        """builds a `StateList` from its columns, as returned by the properties of the same names."""
+        states = cls()
+        states._guns = list(guns)
+        states._times = list(times)
+        states._travels = list(travels)
+        states._velocities = list(velocities)
+        states._burnup_fractions = [tuple(Zs) for Zs in burnup_fractions]
+        states._markers = [Significance(marker) for marker in markers]
+        states._is_started = [bool(is_started) for is_started in are_started]
+
+        n = len(states._guns)
+        if any(len(column) != n for column in states._columns[:7]):
+            raise ValueError("columns must be of equal length.")
+        states._states = [None] * n
+        states._average_pressures = [None] * n
+        states._marker_indices = None
+        return states
+
+    @property
+    def _columns(self) -> tuple[list, ...]:
+        return (
+            self._guns,
+            self._times,
+            self._travels,
+            self._velocities,
+            self._burnup_fractions,
+            self._markers,
+            self._is_started,
+            self._states,
+            self._average_pressures,
+        )
+
+    @staticmethod
+    def _row(state: State) -> tuple:
+        return (
+            state.gun,
+            state.time,
+            state.travel,
+            state.velocity,
+            state.burnup_fractions,
+            state.marker,
+            state.is_started,
+            state,
+            None,
+        )
+
+    def _get_state(self, index: int) -> State:
+        state = self._states[index]
+        if state is None:
+            state = self._states[index] = State(
+                gun=self._guns[index],
+                sv=StateVector(
+                    time=self._times[index],
+                    travel=self._travels[index],
+                    velocity=self._velocities[index],
+                    burnup_fractions=self._burnup_fractions[index],
+                ),
+                marker=self._markers[index],
+                is_started=self._is_started[index],
+            )
+        return state
+
+    def append_flat(self, gun: Gun, y: list[float], marker: Significance, is_started: bool = True):
+        """appends a row from the flat representation of state, without building a `State`."""
+        if self._marker_indices is not None and marker not in self._marker_indices:
+            self._marker_indices[marker] = len(self._times)
+        for column, value in zip(self._columns, (gun, y[0], y[1], y[2], tuple(y[3:]), marker, is_started, None, None)):
+            column.append(value)
+
+    def append(self, state: State):
+        if self._marker_indices is not None and state.marker not in self._marker_indices:
+            self._marker_indices[state.marker] = len(self._times)
+        for column, value in zip(self._columns, self._row(state)):
+            column.append(value)
+
+    def get_flat(self, index: int) -> list[float]:
+        """returns the row at `index` in the flat representation of state."""
+        return [self._times[index], self._travels[index], self._velocities[index], *self._burnup_fractions[index]]
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def __iter__(self) -> Iterator[State]:
+        for i in range(len(self._times)):
+            yield self._get_state(i)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[State, StateList]:
+        if isinstance(index, slice):
+            states = StateList()
+            for column, own_column in zip(states._columns, self._columns):
+                column.extend(own_column[index])
+            states._marker_indices = None
+            return states
+        return self._get_state(range(len(self._times))[index])
+
+    def __setitem__(self, index: Union[int, slice], value: Union[State, Iterable[State]]):
+        if isinstance(index, slice):
+            rows = [self._row(state) for state in value]
+            for i, column in enumerate(self._columns):
+                column[index] = [row[i] for row in rows]
+        else:
+            for column, item in zip(self._columns, self._row(value)):
+                column[index] = item
+        self._marker_indices = None
 
-    def __len__(self):
-        return len(self.data)
+    def __delitem__(self, index: Union[int, slice]):
+        for column in self._columns:
+            del column[index]
+        self._marker_indices = None
 
-    def __iter__(self):
-        return iter(self.data)
+    def insert(self, index: int, state: State):
+        for column, value in zip(self._columns, self._row(state)):
+            column.insert(index, value)
+        self._marker_indices = None
+
+    @property
+    def data(self) -> list[State]:
+        """the rows as a list of `State`, as held by `collections.UserList`. Assigning to it replaces the rows."""
+        return list(self)
+
+    @data.setter
+    def data(self, seq: Iterable[State]):
+        self.clear()
+        self.extend(seq)
+
+    def sort(self, *, key=None, reverse: bool = False):
+        """sorts the rows in place, as `list.sort`, by permuting the columns."""
+        order = sorted(
+            range(len(self._times)),
+            key=lambda i: self._get_state(i) if key is None else key(self._get_state(i)),
+            reverse=reverse,
+        )
+        for column in self._columns:
+            column[:] = [column[i] for i in order]
+        self._marker_indices = None
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (StateList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __lt__(self, other) -> bool:
+        if isinstance(other, (StateList, list)):
+            return list(self) < list(other)
+        return NotImplemented
+
+    def __le__(self, other) -> bool:
+        if isinstance(other, (StateList, list)):
+            return list(self) <= list(other)
+        return NotImplemented
+
+    def __gt__(self, other) -> bool:
+        if isinstance(other, (StateList, list)):
+            return list(self) > list(other)
+        return NotImplemented
+
+    def __ge__(self, other) -> bool:
+        if isinstance(other, (StateList, list)):
+            return list(self) >= list(other)
+        return NotImplemented
+
+    def __add__(self, other: Iterable[State]) -> StateList:
+        states = self[:]
+        states.extend(other)
+        return states
+
+    def __radd__(self, other: Iterable[State]) -> StateList:
+        states = StateList(other)
+        states.extend(self)
+        return states
+
+    def __mul__(self, n: int) -> StateList:
+        states = self[:]
+        states *= n
+        return states
+
+    __rmul__ = __mul__
+
+    def __imul__(self, n: int) -> StateList:
+        for column in self._columns:
+            column *= n
+        self._marker_indices = None
+        return self
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def copy(self) -> StateList:
+        return self[:]
+
+    __copy__ = copy
+
+    @property
+    def guns(self) -> tuple[Gun, ...]:
+        return tuple(self._guns)
+
+    @property
+    def times(self) -> tuple[float, ...]:
+        return tuple(self._times)
+
+    @property
+    def travels(self) -> tuple[float, ...]:
+        return tuple(self._travels)
+
+    @property
+    def velocities(self) -> tuple[float, ...]:
+        return tuple(self._velocities)
+
+    @property
+    def burnup_fractions(self) -> tuple[tuple[float, ...], ...]:
+        return tuple(self._burnup_fractions)
+
+    @property
+    def markers(self) -> tuple[Significance, ...]:
+        return tuple(self._markers)
+
+    @property
+    def are_started(self) -> tuple[bool, ...]:
+        return tuple(self._is_started)
+
+    @property
+    def average_pressures(self) -> tuple[float, ...]:
+        """see `State.average_pressure`. Computed on first access for each row, and kept."""
+        pressures = self._average_pressures
+        for i, pressure in enumerate(pressures):
+            if pressure is None:
+                pressures[i] = self._guns[i].flat_average_pressure(self.get_flat(i))
+        return tuple(pressures)
+
+    @property
+    def shot_pressures(self) -> tuple[float, ...]:
+        """see `State.shot_pressure`."""
+        return tuple(pressure / gun.shot_pressure_ratio for gun, pressure in zip(self._guns, self.average_pressures))
+
+    @property
+    def breech_pressures(self) -> tuple[float, ...]:
+        """see `State.breech_pressure`."""
+        return tuple(pressure * gun.breech_pressure_ratio for gun, pressure in zip(self._guns, self.shot_pressures))
+
+    def compact(self) -> CompactStateList:
+        """
+        Returns the rows as a `CompactStateList`, built from the columns directly, for keeping
+        large numbers of points.
+        """
+        return CompactStateList(self)
+
+    def index_of_marker(self, significance: Significance) -> int:
+        """returns the index of the first row marked by `significance`."""
+        if self._marker_indices is None:
+            self._marker_indices = {}
+            for i, marker in enumerate(self._markers):
+                self._marker_indices.setdefault(marker, i)
+        try:
+            return self._marker_indices[Significance(significance)]
+        except (KeyError, ValueError):
+            raise ValueError(f"StateList does not contain State with marker {significance}.")
 
     def get_state_by_marker(self, significance: Significance) -> State:
-        for s in self.data:
-            if s.marker == significance:
-                return s
-        raise ValueError(f"StateList does not contain State with marker {significance}.")
+        return self._get_state(self.index_of_marker(significance))
 
     def has_state_with_marker(self, significance: Significance) -> bool:
-        for s in self.data:
-            if s.marker == significance:
-                return True
-        return False
+        try:
+            self.index_of_marker(significance)
+        except ValueError:
+            return False
+        return True
 
     @property
     def burnout_velocity(self) -> float:
@@ -302,3 +721,101 @@ class StateList(BaseList):
             *args,
             **{**{"headers": headers, "floatfmt": floatfmt}, **kwargs},  # feeds additional arguments
         )
+
+
+_MARKER_CODES = {marker: code for code, marker in enumerate(Significance)}
+_MARKERS = tuple(Significance)
+_IS_STARTED_FLAG = 0x80
+
+
+class CompactStateList(BaseCompactList):
+    """
+    Compact, read-only sequence of the rows of a `StateList`, for keeping large numbers of
+    points, e.g. the trajectories of a sweep over many guns. See `StateList.compact`.
+
+    Notes
+    -----
+    The time, travel, velocity, average, shot and breech pressure, and the burn-up fractions of
+    every row are packed as doubles into a single `array.array`, such that no object is kept per
+    value, nor per row. Each distinct gun is kept once, and each row refers to it by index,
+    alongside a single byte holding its marker and whether the projectile has started. Rows of
+    guns with fewer charges than the most are padded.
+
+    A `CompactState` is built anew each time a row is accessed, and is not kept.
+    """
+
+    __slots__ = ("_guns", "_gun_indices", "_flags", "_data", "_width")
+
+    def __init__(self, states: Optional[StateList] = None):
+        self._guns: tuple[Gun, ...] = ()
+        self._gun_indices = array("I")
+        self._flags = bytearray()
+        self._data = array("d")
+        self._width = 6
+        if states is None:
+            return
+
+        gun_indices: Dict[int, int] = {}
+        guns: list[Gun] = []
+        for gun in states.guns:
+            if id(gun) not in gun_indices:
+                gun_indices[id(gun)] = len(guns)
+                guns.append(gun)
+            self._gun_indices.append(gun_indices[id(gun)])
+        self._guns = tuple(guns)
+        self._width = 6 + max((len(gun.charges) for gun in guns), default=0)
+
+        for i, (marker, is_started, average_pressure, shot_pressure, breech_pressure) in enumerate(
+            zip(
+                states.markers,
+                states.are_started,
+                states.average_pressures,
+                states.shot_pressures,
+                states.breech_pressures,
+            )
+        ):
+            time, travel, velocity, *burnup_fractions = states.get_flat(i)
+            self._flags.append(_MARKER_CODES[marker] | (_IS_STARTED_FLAG if is_started else 0))
+            self._data.extend((time, travel, velocity, average_pressure, shot_pressure, breech_pressure))
+            self._data.extend(burnup_fractions)
+            self._data.extend(0.0 for _ in range(self._width - 6 - len(burnup_fractions)))
+
+    def _get_compact_state(self, index: int) -> CompactState:
+        gun = self._guns[self._gun_indices[index]]
+        flag = self._flags[index]
+        offset = index * self._width
+        return CompactState._from_packed(
+            gun=gun,
+            data=self._data[offset : offset + 6 + len(gun.charges)].tobytes(),
+            marker=_MARKERS[flag & ~_IS_STARTED_FLAG],
+            is_started=bool(flag & _IS_STARTED_FLAG),
+        )
+
+    def get_flat(self, index: int) -> list[float]:
+        """returns the row at `index` in the flat representation of state."""
+        index = range(len(self._flags))[index]
+        offset = index * self._width
+        n_charges = len(self._guns[self._gun_indices[index]].charges)
+        return [*self._data[offset : offset + 3], *self._data[offset + 6 : offset + 6 + n_charges]]
+
+    def to_state_list(self) -> StateList:
+        """unpacks the rows back into a `StateList`."""
+        return StateList(compact_state.to_state() for compact_state in self)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[CompactState, CompactStateList]:
+        if isinstance(index, slice):
+            states = CompactStateList()
+            states._guns = self._guns
+            states._width = self._width
+            for i in range(len(self._flags))[index]:
+                states._gun_indices.append(self._gun_indices[i])
+                states._flags.append(self._flags[i])
+                states._data.extend(self._data[i * self._width : (i + 1) * self._width])
+            return states
+        return self._get_compact_state(range(len(self._flags))[index])
+
+    def __len__(self) -> int:
+        return len(self._flags)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self)} states>)"
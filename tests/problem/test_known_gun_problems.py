@@ -1,3 +1,4 @@
+from minimalist_interior_ballistics import Significance
 from minimalist_interior_ballistics.problem import KnownGunProblem
 from tests.problem.test_problems import MultipleChargeProblem, SingleChargeProblem
 
@@ -12,6 +13,12 @@ class TestKnownGunProblemWithSingleCharge(SingleChargeProblem):
     def testKnownGunProblem(self):
         self.result = self.kgp_BS_3_53_UOF_412.get_gun_at_pressure(pressure_target=self.pressure_target)
 
+        peak = self.result.to_burnout().get_state_by_marker(Significance.PEAK_PRESSURE)
+        self.assertAlmostEqual(self.pressure_target.retrieve_from(peak) / self.pressure_target.value, 1, delta=1e-2)
+
+        estimate = self.base_problem.estimate_reduced_burnrate(self.result, self.pressure_target.value)
+        self.assertAlmostEqual(estimate / self.result.charges[0].reduced_burnrate, 1, delta=0.5)
+
     def tearDown(self):
         super().tearDown()
 
@@ -28,5 +35,12 @@ class TestKnownGunProblemWithMultipleCharges(MultipleChargeProblem):
             reduced_burnrate_ratios=self.reduced_burnrate_ratios, pressure_target=self.pressure_target
         )
 
+        peak = self.result.to_burnout().get_state_by_marker(Significance.PEAK_PRESSURE)
+        self.assertAlmostEqual(self.pressure_target.retrieve_from(peak) / self.pressure_target.value, 1, delta=1e-2)
+
+        main_charge = self.result.charges[self.result.charge_masses.index(max(self.result.charge_masses))]
+        estimate = self.base_problem.estimate_reduced_burnrate(self.result, self.pressure_target.value)
+        self.assertAlmostEqual(estimate / main_charge.reduced_burnrate, 1, delta=0.5)
+
     def tearDown(self):
         super().tearDown()
@@ -0,0 +1,124 @@
+from minimalist_interior_ballistics.problem import FixedChargeProblem, FixedVolumeProblem, PressureTarget
+from tests.problem.test_problems import MultipleChargeProblem, SingleChargeProblem
+
+
+class TestLimitsWithOneCharge(SingleChargeProblem):
+    def setUp(self):
+        super().setUp()
+        value = self.pressure_target.value
+        self.pressure_targets = (
+            PressureTarget.average_pressure(value),
+            PressureTarget.shot_pressure(value),
+            PressureTarget.breech_pressure(1.5 * value),
+        )
+
+    def testChargeMassLimits(self):
+        problem = FixedVolumeProblem.from_base_problem(
+            base_problem=self.base_problem, chamber_volume=self.chamber_volume
+        )
+        for pressure_target in self.pressure_targets:
+            limits = problem.get_charge_mass_limits(pressure_target=pressure_target)
+            self.assertLess(*limits)
+            lower_gun, upper_gun = (
+                problem.get_gun(chamber_volume=self.chamber_volume, charge_mass=charge_mass, reduced_burnrate=1.0)
+                for charge_mass in limits
+            )
+            # the bomb pressure matches the target, exceeded by the conservative margin.
+            self.assertAlmostEqual(
+                pressure_target.retrieve_from(lower_gun.get_bomb_state()) / (pressure_target.value * (1 + problem.acc)),
+                1,
+                delta=1e-12,
+            )
+            self.assertAlmostEqual(upper_gun.bomb_free_fraction, problem.acc, delta=1e-12)
+
+        with self.assertRaises(ValueError):
+            problem.get_charge_mass_limits(pressure_target=self.pressure_target * 1e5)
+
+    def testChamberVolumeLimits(self):
+        problem = FixedChargeProblem.from_base_problem(base_problem=self.base_problem, charge_mass=self.charge_mass)
+        for pressure_target in self.pressure_targets:
+            limits = problem.get_chamber_volume_limits(pressure_target=pressure_target)
+            self.assertLess(*limits)
+            lower_gun, upper_gun = (
+                problem.get_gun(chamber_volume=chamber_volume, charge_mass=self.charge_mass, reduced_burnrate=1.0)
+                for chamber_volume in limits
+            )
+            self.assertAlmostEqual(lower_gun.bomb_free_fraction, problem.acc, delta=1e-12)
+            self.assertAlmostEqual(
+                pressure_target.retrieve_from(upper_gun.get_bomb_state()) / (pressure_target.value * (1 + problem.acc)),
+                1,
+                delta=1e-12,
+            )
+
+        with self.assertRaises(ValueError):
+            problem.get_chamber_volume_limits(pressure_target=self.pressure_target * 1e5)
+
+    def tearDown(self):
+        super().tearDown()
+
+
+class TestLimitsWithMultipleCharges(MultipleChargeProblem):
+    def setUp(self):
+        super().setUp()
+        value = self.pressure_target.value
+        self.pressure_targets = (
+            PressureTarget.average_pressure(value),
+            PressureTarget.shot_pressure(value),
+            PressureTarget.breech_pressure(1.5 * value),
+        )
+
+    def testChargeMassLimits(self):
+        problem = FixedVolumeProblem.from_base_problem(
+            base_problem=self.base_problem, chamber_volume=self.chamber_volume
+        )
+        for pressure_target in self.pressure_targets:
+            limits = problem.get_charge_mass_limits(
+                pressure_target=pressure_target, charge_mass_ratios=self.charge_masses
+            )
+            self.assertLess(*limits)
+            lower_gun, upper_gun = (
+                problem.get_gun(
+                    chamber_volume=self.chamber_volume,
+                    charge_masses=problem.get_charge_masses(
+                        total_charge_mass=total_charge_mass, charge_mass_ratios=self.charge_masses
+                    ),
+                    reduced_burnrates=(1.0, 1.0),
+                )
+                for total_charge_mass in limits
+            )
+            # the bomb pressure matches the target, exceeded by the conservative margin.
+            self.assertAlmostEqual(
+                pressure_target.retrieve_from(lower_gun.get_bomb_state()) / (pressure_target.value * (1 + problem.acc)),
+                1,
+                delta=1e-12,
+            )
+            self.assertAlmostEqual(upper_gun.bomb_free_fraction, problem.acc, delta=1e-12)
+
+        with self.assertRaises(ValueError):
+            problem.get_charge_mass_limits(
+                pressure_target=self.pressure_target * 1e5, charge_mass_ratios=self.charge_masses
+            )
+
+    def testChamberVolumeLimits(self):
+        problem = FixedChargeProblem.from_base_problem(base_problem=self.base_problem, charge_masses=self.charge_masses)
+        for pressure_target in self.pressure_targets:
+            limits = problem.get_chamber_volume_limits(pressure_target=pressure_target)
+            self.assertLess(*limits)
+            lower_gun, upper_gun = (
+                problem.get_gun(
+                    chamber_volume=chamber_volume, charge_masses=self.charge_masses, reduced_burnrates=(1.0, 1.0)
+                )
+                for chamber_volume in limits
+            )
+            self.assertAlmostEqual(lower_gun.bomb_free_fraction, problem.acc, delta=1e-12)
+            self.assertAlmostEqual(
+                pressure_target.retrieve_from(upper_gun.get_bomb_state()) / (pressure_target.value * (1 + problem.acc)),
+                1,
+                delta=1e-12,
+            )
+
+        with self.assertRaises(ValueError):
+            problem.get_chamber_volume_limits(pressure_target=self.pressure_target * 1e5)
+
+    def tearDown(self):
+        super().tearDown()
@@ -6,6 +6,9 @@ class SingleChargeProblem(SingleChargeTestCase):
     def setUp(self):
         super().setUp()
         self.base_problem = BaseProblem(**self.base_args, travel=self.travel)
+        self.gun = self.base_problem.get_gun(
+            chamber_volume=self.chamber_volume, charge_mass=self.charge_mass, reduced_burnrate=6e-7
+        )
 
     def tearDown(self):
         super().tearDown()
@@ -15,6 +18,11 @@ class MultipleChargeProblem(MultipleChargeTestCase):
     def setUp(self):
         super().setUp()
         self.base_problem = BaseProblem(**self.base_args, travel=self.travel)
+        self.gun = self.base_problem.get_gun(
+            chamber_volume=self.chamber_volume,
+            charge_masses=self.charge_masses,
+            reduced_burnrates=[r * 1.6e-5 for r in self.reduced_burnrate_ratios],
+        )
 
     def tearDown(self):
         super().tearDown()
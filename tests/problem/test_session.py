@@ -0,0 +1,110 @@
+from minimalist_interior_ballistics.problem import FixedChargeProblem, FixedVolumeProblem
+from tests.problem.test_problems import MultipleChargeProblem, SingleChargeProblem
+
+
+class TestSessionWithOneCharge(SingleChargeProblem):
+    def setUp(self):
+        super().setUp()
+        self.fvp_BS_3_53_UOF_412 = FixedVolumeProblem.from_base_problem(
+            base_problem=self.base_problem, chamber_volume=self.chamber_volume
+        )
+        self.fcp_BS_3_53_UOF_412 = FixedChargeProblem.from_base_problem(
+            base_problem=self.base_problem, charge_mass=self.charge_mass
+        )
+
+    def testSessions(self):
+        for problem in (self.fvp_BS_3_53_UOF_412, self.fcp_BS_3_53_UOF_412):
+            session = problem.get_session(pressure_target=self.pressure_target)
+            lower_limit, upper_limit = session.limits
+            lower_design, optimal_design, upper_design = session.designs
+            self.assertLessEqual(lower_limit, optimal_design)
+            self.assertLessEqual(optimal_design, upper_limit)
+            self.assertIs(session.optimal_gun, session.limiting_guns[1])
+
+            v_min, v_max = session.velocity_envelope
+            self.assertEqual(v_max, session.get_velocity(optimal_design))
+            self.assertEqual(session.solve_for_velocity(v_max * 1.01), (None, None))
+
+            for velocity_target in (v_min + 0.5 * (v_max - v_min), v_min + 0.25 * (v_max - v_min)):
+                guns = session.solve_for_velocity(velocity_target)
+                self.assertTrue(any(guns))
+                for gun in filter(None, guns):
+                    self.assertAlmostEqual(
+                        problem.to_travel(gun).muzzle_velocity / velocity_target, 1, delta=problem.acc
+                    )
+
+            # the second target is bracketed by the solution of the first.
+            n_known = len(session.velocities)
+            session.solve_for_velocity(v_min + 0.375 * (v_max - v_min))
+            self.assertLess(len(session.velocities) - n_known, n_known)
+
+            self.result = session.get_gun(0.5 * (lower_design + optimal_design))
+            with self.assertRaises(ValueError):
+                session.get_gun(upper_limit * 1.01)
+
+        session = self.fvp_BS_3_53_UOF_412.get_session(pressure_target=self.pressure_target)
+        gun, _ = self.fvp_BS_3_53_UOF_412.solve_charge_mass_at_pressure_for_velocity(
+            pressure_target=self.pressure_target, velocity_target=self.velocity_target
+        )
+        self.assertAlmostEqual(
+            session.solve_for_velocity(self.velocity_target)[0].gross_charge_mass / gun.gross_charge_mass,
+            1,
+            delta=self.fvp_BS_3_53_UOF_412.acc,
+        )
+
+    def tearDown(self):
+        super().tearDown()
+
+
+class TestSessionWithMultipleCharges(MultipleChargeProblem):
+    def setUp(self):
+        super().setUp()
+        self.fvp_D_44_UO_365K = FixedVolumeProblem.from_base_problem(
+            base_problem=self.base_problem, chamber_volume=self.chamber_volume
+        )
+        self.fcp_D_44_UO_365K = FixedChargeProblem.from_base_problem(
+            base_problem=self.base_problem, charge_masses=self.charge_masses
+        )
+
+    def testSessions(self):
+        for session in (
+            self.fvp_D_44_UO_365K.get_session(
+                pressure_target=self.pressure_target,
+                charge_mass_ratios=self.charge_masses,
+                reduced_burnrate_ratios=self.reduced_burnrate_ratios,
+            ),
+            self.fcp_D_44_UO_365K.get_session(
+                pressure_target=self.pressure_target, reduced_burnrate_ratios=self.reduced_burnrate_ratios
+            ),
+        ):
+            lower_limit, upper_limit = session.limits
+            lower_design, optimal_design, upper_design = session.designs
+            self.assertLessEqual(lower_limit, optimal_design)
+            self.assertLessEqual(optimal_design, upper_limit)
+            self.assertIs(session.optimal_gun, session.limiting_guns[1])
+
+            v_min, v_max = session.velocity_envelope
+            self.assertEqual(v_max, session.get_velocity(optimal_design))
+            self.assertEqual(session.solve_for_velocity(v_max * 1.01), (None, None))
+
+            for velocity_target in (v_min + 0.5 * (v_max - v_min), v_min + 0.25 * (v_max - v_min)):
+                guns = session.solve_for_velocity(velocity_target)
+                self.assertTrue(any(guns))
+                for gun in filter(None, guns):
+                    self.assertAlmostEqual(
+                        session.problem.to_travel(gun).muzzle_velocity / velocity_target,
+                        1,
+                        delta=session.problem.acc,
+                    )
+
+            # the second target is bracketed by the solution of the first.
+            n_known = len(session.velocities)
+            session.solve_for_velocity(v_min + 0.375 * (v_max - v_min))
+            self.assertLess(len(session.velocities) - n_known, n_known)
+
+            self.result = session.get_gun(0.5 * (lower_design + optimal_design))
+            with self.assertRaises(ValueError):
+                session.get_gun(upper_limit * 1.01)
+
+    def tearDown(self):
+        super().tearDown()
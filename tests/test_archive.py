@@ -0,0 +1,99 @@
+from importlib.util import find_spec
+from os import path
+from tempfile import TemporaryDirectory
+
+from minimalist_interior_ballistics.archive import (
+    TABULATED_UNITS,
+    read_csv,
+    read_json,
+    read_npz,
+    write_csv,
+    write_json,
+    write_npz,
+)
+from tests.problem.test_problems import MultipleChargeProblem, SingleChargeProblem
+
+
+class TestArchiveWithOneCharge(SingleChargeProblem):
+    def setUp(self):
+        super().setUp()
+        self.guns = [
+            self.gun,
+            *(
+                self.base_problem.get_gun(
+                    chamber_volume=self.chamber_volume, charge_mass=self.charge_mass, reduced_burnrate=reduced_burnrate
+                )
+                for reduced_burnrate in (5e-7, 7e-7)
+            ),
+        ]
+
+    def testRoundTrip(self):
+        formats = [(write_csv, read_csv, ".csv"), (write_json, read_json, ".json")]
+        if find_spec("numpy"):
+            formats.append((write_npz, read_npz, ".npz"))
+        trajectories = [gun.to_travel() for gun in self.guns]
+        trajectories.append(self.guns[0].to_burnout())
+
+        for write, read, suffix in formats:
+            with self.subTest(suffix=suffix), TemporaryDirectory() as directory:
+                filename = path.join(directory, f"archive{suffix}")
+                write(filename, iter(trajectories))
+                self.assertEqual(read(filename), trajectories)
+
+                write(filename, trajectories, units=TABULATED_UNITS)
+                results = read(filename)
+                self.assertEqual(len(results), len(trajectories))
+                for result, states in zip(results, trajectories):
+                    self.assertEqual(result.guns, states.guns)
+                    self.assertEqual(result.markers, states.markers)
+                    self.assertEqual(result.burnup_fractions, states.burnup_fractions)
+                    for a, b in zip(result.times + result.average_pressures, states.times + states.average_pressures):
+                        self.assertAlmostEqual(a, b, delta=1e-12 * abs(b))
+
+                write(filename, trajectories[0])
+                self.assertEqual(read(filename), trajectories[:1])
+
+    def tearDown(self):
+        super().tearDown()
+
+
+class TestArchiveWithMultipleCharges(MultipleChargeProblem):
+    def setUp(self):
+        super().setUp()
+        self.guns = [
+            self.base_problem.get_gun(
+                chamber_volume=self.chamber_volume,
+                charge_masses=self.charge_masses,
+                reduced_burnrates=[r * 1.4e-5 for r in self.reduced_burnrate_ratios],
+            ),
+            self.gun,
+        ]
+
+    def testRoundTrip(self):
+        formats = [(write_csv, read_csv, ".csv"), (write_json, read_json, ".json")]
+        if find_spec("numpy"):
+            formats.append((write_npz, read_npz, ".npz"))
+        trajectories = [gun.to_travel() for gun in self.guns]
+        trajectories.append(self.guns[0].to_burnout())
+
+        for write, read, suffix in formats:
+            with self.subTest(suffix=suffix), TemporaryDirectory() as directory:
+                filename = path.join(directory, f"archive{suffix}")
+                write(filename, iter(trajectories))
+                self.assertEqual(read(filename), trajectories)
+
+                write(filename, trajectories, units=TABULATED_UNITS)
+                results = read(filename)
+                self.assertEqual(len(results), len(trajectories))
+                for result, states in zip(results, trajectories):
+                    self.assertEqual(result.guns, states.guns)
+                    self.assertEqual(result.markers, states.markers)
+                    self.assertEqual(result.burnup_fractions, states.burnup_fractions)
+                    for a, b in zip(result.times + result.average_pressures, states.times + states.average_pressures):
+                        self.assertAlmostEqual(a, b, delta=1e-12 * abs(b))
+
+                write(filename, trajectories[0])
+                self.assertEqual(read(filename), trajectories[:1])
+
+    def tearDown(self):
+        super().tearDown()
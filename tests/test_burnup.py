@@ -0,0 +1,73 @@
+from attrs import evolve
+
+from minimalist_interior_ballistics import Integrator, Significance
+from minimalist_interior_ballistics.problem import BaseProblem
+from tests.problem.test_problems import MultipleChargeProblem, SingleChargeProblem
+
+
+class TestBurnupWithOneCharge(SingleChargeProblem):
+    def testToTravel(self):
+        reference = self.gun.to_travel(n_intg=100, acc=1e-6)
+        states = self.gun.to_travel(integrator=Integrator.BURNUP)
+
+        self.assertAlmostEqual(states.muzzle_velocity / reference.muzzle_velocity, 1, delta=1e-3)
+        self.assertAlmostEqual(states.peak_average_pressure / reference.peak_average_pressure, 1, delta=1e-3)
+        self.assertAlmostEqual(states[-1].time / reference[-1].time, 1, delta=1e-3)
+        self.assertEqual(
+            [s.marker for s in states if s.marker != Significance.STEP],
+            [Significance.START, Significance.PEAK_PRESSURE, Significance.BURNOUT, Significance.MUZZLE],
+        )
+
+    def testToBurnoutAborted(self):
+        states = self.gun.to_burnout(abort_travel=0.5, integrator=Integrator.BURNUP)
+        self.assertFalse(states.has_state_with_marker(Significance.BURNOUT))
+        self.assertTrue(all(s.travel <= 0.5 for s in states))
+
+        states = self.gun.to_travel(travel=0.5, integrator=Integrator.BURNUP)
+        self.assertEqual(states[-1].travel, 0.5)
+        self.assertAlmostEqual(states.muzzle_velocity / self.gun.to_travel(travel=0.5).muzzle_velocity, 1, delta=1e-3)
+
+    def testSlowBurn(self):
+        # the charge does not burn out before the muzzle, and the steps are refined or integrated in time.
+        for reduced_burnrate in (1e-7, 1e-8):
+            gun = self.base_problem.get_gun(
+                chamber_volume=self.chamber_volume, charge_mass=self.charge_mass, reduced_burnrate=reduced_burnrate
+            )
+            reference = gun.to_travel(n_intg=100, acc=1e-6)
+            states = gun.to_travel(integrator=Integrator.BURNUP)
+
+            self.assertAlmostEqual(states.muzzle_velocity / reference.muzzle_velocity, 1, delta=1e-3)
+            self.assertAlmostEqual(states[-1].time / reference[-1].time, 1, delta=1e-3)
+            self.assertGreater(len(states), 10)
+            self.assertEqual(list(states.times), sorted(states.times))
+            self.assertEqual(
+                [s.marker for s in states if s.marker != Significance.STEP],
+                [Significance.START, Significance.PEAK_PRESSURE, Significance.MUZZLE],
+            )
+
+    def testFallback(self):
+        base_problem = BaseProblem(
+            **{**self.base_args, "propellant": evolve(self.base_args["propellant"], pressure_exponent=0.9)},
+            travel=self.travel,
+        )
+        gun = base_problem.get_gun(
+            chamber_volume=self.chamber_volume, charge_mass=self.charge_mass, reduced_burnrate=1e-5
+        )
+        self.assertEqual(
+            gun.to_travel(integrator=Integrator.BURNUP).muzzle_velocity,
+            gun.to_travel(integrator=Integrator.RK4).muzzle_velocity,
+        )
+
+    def tearDown(self):
+        super().tearDown()
+
+
+class TestBurnupWithMultipleCharges(MultipleChargeProblem):
+    def testFallback(self):
+        self.assertEqual(
+            self.gun.to_travel(integrator=Integrator.BURNUP).muzzle_velocity,
+            self.gun.to_travel(integrator=Integrator.RK4).muzzle_velocity,
+        )
+
+    def tearDown(self):
+        super().tearDown()
@@ -0,0 +1,84 @@
+from unittest import TestCase
+
+from minimalist_interior_ballistics import Significance
+from minimalist_interior_ballistics.cache import LRUCache
+from minimalist_interior_ballistics.gun import Gun
+from minimalist_interior_ballistics.problem import FixedVolumeProblem
+from tests.problem.test_problems import SingleChargeProblem
+
+
+class TestLRUCache(TestCase):
+    def testEviction(self):
+        cache = LRUCache(maxsize=2)
+        for key in ("a", "b", "a", "c"):
+            cache.get_or_compute(key, lambda: key)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.info().hits, 1)
+        self.assertEqual(cache.info().misses, 3)
+
+    def testDisabled(self):
+        cache = LRUCache(enabled=False)
+        self.assertEqual(cache.get_or_compute("a", lambda: 1), 1)
+        self.assertEqual(cache.get_or_compute("a", lambda: 2), 2)
+        self.assertEqual(len(cache), 0)
+
+
+class TestStartCache(SingleChargeProblem):
+    def testStartCache(self):
+        Gun.start_cache.clear()
+        states = self.gun.to_travel()
+        self.assertEqual(Gun.start_cache.info().misses, 1)
+
+        self.assertEqual(self.gun.to_travel().muzzle_velocity, states.muzzle_velocity)
+        self.assertEqual(Gun.start_cache.info().hits, 1)
+
+        Gun.start_cache.disable()
+        try:
+            start_state = self.gun.get_start_state()
+        finally:
+            Gun.start_cache.enable()
+        self.assertEqual(Gun.start_cache.info().hits, 1)
+        self.assertEqual(start_state.burnup_fractions, states.get_state_by_marker(Significance.START).burnup_fractions)
+
+    def testStartCacheAcrossBurnRates(self):
+        slow_gun = self.base_problem.get_gun(
+            chamber_volume=self.chamber_volume, charge_mass=self.charge_mass, reduced_burnrate=3e-7
+        )
+
+        Gun.start_cache.clear()
+        slow_start, fast_start = slow_gun.get_start_state(), self.gun.get_start_state()
+        self.assertEqual(Gun.start_cache.info().misses, 1)
+        self.assertEqual(Gun.start_cache.info().hits, 1)
+
+        self.assertAlmostEqual(slow_start.time / fast_start.time, 2, delta=1e-12)
+        self.assertEqual(slow_start.burnup_fractions, fast_start.burnup_fractions)
+
+
+class TestProblemCache(SingleChargeProblem):
+    def testProblemCache(self):
+        problem = FixedVolumeProblem.from_base_problem(
+            base_problem=self.base_problem, chamber_volume=self.chamber_volume
+        )
+        gun, limits = problem.solve_charge_mass_at_pressure_for_velocity(
+            velocity_target=self.velocity_target, pressure_target=self.pressure_target
+        )
+        self.assertIs(problem.to_travel(gun), problem.to_travel(gun))
+        info = problem.cache_info()
+        self.assertGreater(info["gun"].hits, 0)
+        self.assertGreater(info["travel"].hits, 0)
+        self.assertLessEqual(info["gun"].currsize, info["gun"].maxsize)
+
+        # the cache belongs to the derived problem only.
+        self.assertEqual(self.base_problem.cache_info()["gun"].misses, 0)
+
+        problem.clear_cache()
+        problem.gun_cache.disable()
+        problem.travel_cache.disable()
+        uncached_gun, uncached_limits = problem.solve_charge_mass_at_pressure_for_velocity(
+            velocity_target=self.velocity_target, pressure_target=self.pressure_target
+        )
+        self.assertEqual(problem.cache_info()["gun"].hits, 0)
+        self.assertEqual(uncached_gun, gun)
+        self.assertEqual(uncached_limits, limits)
@@ -0,0 +1,51 @@
+from importlib.util import find_spec
+from math import isnan
+from unittest import skipUnless
+
+from minimalist_interior_ballistics.form_function import FormFunction, FormFunctionGrid, MultiPerfShape
+from tests import BaseTestCase
+
+
+@skipUnless(find_spec("numpy"), "requires the optional numpy dependency")
+class TestVectorizedFormFunction(BaseTestCase):
+    def testPsi(self):
+        for form_function in (
+            FormFunction.single_perf(arch_width=1.8e-3, height=260e-3),
+            FormFunction.multi_perf(
+                arch_width=1.4e-3, perforation_diameter=0.75e-3, height=17e-3, shape=MultiPerfShape.SEVEN_PERF_CYLINDER
+            ),
+        ):
+            Zs = [form_function.Z_k * i / 100 for i in range(101)]
+            for Z, psi in zip(Zs, form_function.psi(Zs)):
+                self.assertAlmostEqual(psi, form_function(Z), delta=1e-15)
+            for Z in (-0.01, 1.01 * form_function.Z_k):
+                with self.assertRaises(ValueError):
+                    form_function.psi([0.5, Z])
+
+    def testGrid(self):
+        arch_widths, perforation_diameters, heights = (1e-3, 1.5e-3), (0.3e-3, 0.6e-3, 1.2e-3), (2e-3, 10e-3, 20e-3)
+        grid = FormFunctionGrid.multi_perf(arch_widths, perforation_diameters, heights)
+        self.assertEqual(grid.shape, (2, 3, 3, len(MultiPerfShape)))
+
+        n_invalid = 0
+        for i, arch_width in enumerate(arch_widths):
+            for j, perforation_diameter in enumerate(perforation_diameters):
+                for k, height in enumerate(heights):
+                    for l, shape in enumerate(MultiPerfShape):
+                        index = (i, j, k, l)
+                        try:
+                            form_function = FormFunction.multi_perf(arch_width, perforation_diameter, height, shape)
+                        except ValueError:
+                            n_invalid += 1
+                            self.assertTrue(isnan(grid.chi[index]))
+                            self.assertTrue(isnan(grid.psi(0.5)[index]))
+                            continue
+
+                        self.assertEqual(grid.get_form_function(index), form_function)
+                        for name in ("chi", "labda", "mu", "Z_k", "chi_s", "labda_s"):
+                            self.assertAlmostEqual(
+                                getattr(grid, name)[index], getattr(form_function, name), delta=1e-12
+                            )
+                        self.assertAlmostEqual(grid.psi(1.1)[index], form_function(1.1), delta=1e-12)
+
+        self.assertGreater(n_invalid, 0)
@@ -0,0 +1,78 @@
+from importlib.util import find_spec
+from math import isnan
+from unittest import skipUnless
+
+from minimalist_interior_ballistics import Significance
+from tests.problem.test_problems import MultipleChargeProblem, SingleChargeProblem
+
+
+@skipUnless(find_spec("numpy"), "requires the optional numpy dependency")
+class TestGunBatchWithOneCharge(SingleChargeProblem):
+    def testGunBatch(self):
+        from minimalist_interior_ballistics.batch import GunBatch
+
+        guns = [
+            self.base_problem.get_gun(
+                chamber_volume=self.chamber_volume * ratio,
+                charge_mass=self.charge_mass,
+                reduced_burnrate=reduced_burnrate,
+            )
+            for ratio in (0.8, 1.0, 1.2)
+            for reduced_burnrate in (4e-7, 6e-7, 8e-7)
+        ]
+        result = GunBatch(guns=guns).to_travel(keep_states=True)
+        for i, gun in enumerate(guns):
+            states = gun.to_travel()
+            self.assertAlmostEqual(result.muzzle_velocity[i] / states.muzzle_velocity, 1, delta=1e-3)
+            self.assertAlmostEqual(result.peak_average_pressure[i] / states.peak_average_pressure, 1, delta=1e-3)
+            self.assertAlmostEqual(result.peak_shot_pressure[i] / states.peak_shot_pressure, 1, delta=1e-3)
+            self.assertEqual(len(result.states[i]), len(states))
+            self.assertEqual(
+                [s.marker for s in result.states[i] if s.marker != Significance.STEP],
+                [s.marker for s in states if s.marker != Significance.STEP],
+            )
+
+    def testGunBatchWithInvalidGun(self):
+        from minimalist_interior_ballistics.batch import GunBatch
+
+        guns = [
+            self.gun,
+            self.base_problem.get_gun(chamber_volume=self.chamber_volume, charge_mass=1e-3, reduced_burnrate=6e-7),
+        ]
+        result = GunBatch(guns=guns).to_travel(keep_states=True)
+        self.assertAlmostEqual(result.muzzle_velocity[0] / self.gun.to_travel().muzzle_velocity, 1, delta=1e-3)
+        self.assertTrue(isnan(result.muzzle_velocity[1]))
+        self.assertIsNone(result.states[1])
+
+    def tearDown(self):
+        super().tearDown()
+
+
+@skipUnless(find_spec("numpy"), "requires the optional numpy dependency")
+class TestGunBatchWithMultipleCharges(MultipleChargeProblem):
+    def testGunBatch(self):
+        from minimalist_interior_ballistics.batch import GunBatch
+
+        guns = [
+            self.base_problem.get_gun(
+                chamber_volume=self.chamber_volume,
+                charge_masses=[m * ratio for m in self.charge_masses],
+                reduced_burnrates=[r * reduced_burnrate for r in self.reduced_burnrate_ratios],
+            )
+            for ratio in (0.9, 1.0, 1.1)
+            for reduced_burnrate in (1e-5, 1.6e-5, 2.2e-5)
+        ]
+        result = GunBatch(guns=guns).to_travel(keep_states=True)
+        for i, gun in enumerate(guns):
+            states = gun.to_travel()
+            self.assertAlmostEqual(result.muzzle_velocity[i] / states.muzzle_velocity, 1, delta=1e-3)
+            self.assertAlmostEqual(result.peak_average_pressure[i] / states.peak_average_pressure, 1, delta=1e-3)
+            self.assertAlmostEqual(result.peak_shot_pressure[i] / states.peak_shot_pressure, 1, delta=1e-3)
+            self.assertEqual(len(result.states[i]), len(states))
+            self.assertEqual(
+                [s.marker for s in result.states[i] if s.marker != Significance.STEP],
+                [s.marker for s in states if s.marker != Significance.STEP],
+            )
+
+    def tearDown(self):
+        super().tearDown()
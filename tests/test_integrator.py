@@ -0,0 +1,84 @@
+from minimalist_interior_ballistics import Integrator, Significance
+from minimalist_interior_ballistics.gun import Gun
+from tests.problem.test_problems import MultipleChargeProblem, SingleChargeProblem
+
+
+class TestIntegratorWithOneCharge(SingleChargeProblem):
+    def setUp(self):
+        super().setUp()
+        # burns slowly enough that the first run at `minimalist_interior_ballistics.MAX_DT` falls short.
+        self.slow_gun = self.base_problem.get_gun(
+            chamber_volume=self.chamber_volume, charge_mass=self.charge_mass, reduced_burnrate=1.5e-7
+        )
+
+    def testSinglePass(self):
+        f = self.slow_gun.compiled_dt
+        y_0 = [0.0, 0.0, 0.0, *self.slow_gun.get_start_state().burnup_fractions]
+        n_evaluations = {}
+        for integrator in (Integrator.RK4, Integrator.RK4_SINGLE_PASS):
+            counts = [0]
+
+            def counted_f(y: list[float]) -> list[float]:
+                counts[0] += 1
+                return f(y)
+
+            ys, dys = Gun.flat_integrate(
+                f=counted_f, y_0=y_0, stop=lambda y: y[1] > self.travel, integrator=integrator, n_intg=100
+            )
+            n_evaluations[integrator] = counts[0]
+
+            self.assertGreaterEqual(len(ys) - 1, 100)
+            self.assertGreater(ys[-1][1], self.travel)
+            self.assertTrue(all(y[1] <= self.travel for y in ys[:-1]))
+            self.assertTrue(all(y_i[0] < y_j[0] for y_i, y_j in zip(ys, ys[1:])))
+            self.assertEqual(dys, [f(y) for y in ys])
+
+        # the first run is kept, where `minimalist_interior_ballistics.Integrator.RK4` repeats it.
+        self.assertLess(2 * n_evaluations[Integrator.RK4_SINGLE_PASS], n_evaluations[Integrator.RK4])
+
+    def testDormandPrince(self):
+        reference = self.gun.to_travel(n_intg=1000, acc=1e-10)
+        burnout = reference.get_state_by_marker(Significance.BURNOUT)
+        n_steps = []
+        for acc in (1e-3, 1e-5, 1e-7):
+            states = self.gun.to_burnout(acc=acc, integrator=Integrator.DOPRI5)
+            self.assertAlmostEqual(states[-1].time / burnout.time, 1, delta=10 * acc)
+            self.assertAlmostEqual(states.peak_average_pressure / reference.peak_average_pressure, 1, delta=10 * acc)
+            muzzle_velocity = self.gun.to_travel(acc=acc, integrator=Integrator.DOPRI5).muzzle_velocity
+            self.assertAlmostEqual(muzzle_velocity / reference.muzzle_velocity, 1, delta=10 * acc)
+
+            # the step size is controlled by `acc`, and `n_intg` sets no minimum number of steps.
+            for n_intg in (10, 100):
+                self.assertEqual(
+                    len(self.gun.to_burnout(acc=acc, n_intg=n_intg, integrator=Integrator.DOPRI5)), len(states)
+                )
+            n_steps.append(len(states))
+
+        self.assertEqual(n_steps, sorted(set(n_steps)))
+
+    def testSinglePassAgainstRK4(self):
+        for gun in (self.gun, self.slow_gun):
+            for n_intg in (10, 100):
+                reference = gun.to_travel(n_intg=n_intg, integrator=Integrator.RK4)
+                states = gun.to_travel(n_intg=n_intg, integrator=Integrator.RK4_SINGLE_PASS)
+                self.assertGreaterEqual(len(states), len(reference))
+                self.assertAlmostEqual(states.muzzle_velocity / reference.muzzle_velocity, 1, delta=1e-3)
+                self.assertAlmostEqual(states.peak_average_pressure / reference.peak_average_pressure, 1, delta=1e-3)
+                self.assertAlmostEqual(states[-1].time / reference[-1].time, 1, delta=1e-3)
+
+    def tearDown(self):
+        super().tearDown()
+
+
+class TestIntegratorWithMultipleCharges(MultipleChargeProblem):
+    def testSinglePassAgainstRK4(self):
+        for n_intg in (10, 100):
+            reference = self.gun.to_travel(n_intg=n_intg, integrator=Integrator.RK4)
+            states = self.gun.to_travel(n_intg=n_intg, integrator=Integrator.RK4_SINGLE_PASS)
+            self.assertGreaterEqual(len(states), len(reference))
+            self.assertAlmostEqual(states.muzzle_velocity / reference.muzzle_velocity, 1, delta=1e-3)
+            self.assertAlmostEqual(states.peak_average_pressure / reference.peak_average_pressure, 1, delta=1e-3)
+            self.assertAlmostEqual(states[-1].time / reference[-1].time, 1, delta=1e-3)
+
+    def tearDown(self):
+        super().tearDown()
@@ -0,0 +1,66 @@
+import csv
+import pickle
+from os import path
+from tempfile import TemporaryDirectory
+
+from minimalist_interior_ballistics.charge import Propellant
+from minimalist_interior_ballistics.library import PropellantLibrary
+from tests import BaseTestCase
+
+
+class TestPropellantLibrary(BaseTestCase):
+    rows = [
+        ["name", "description", "adiabatic index", "density", "force", "covolume", "exponent", "coefficient"],
+        ["НДТ-3", "nitroglycerin\\tball", 1.2, 1600, 931950, 1e-3, 1.0, "", "double base"],
+        ["Pyroxylin", "", 1.2, 1600, 950000, 1e-3, 0.9, 1e-9, "single base"],
+        ["НДТ-2", "", 1.22, 1600, 940000, 1e-3, 1.0, 1e-9, "double base"],
+        ["Cordite", "", 1.25, 1560, 1000000, 1e-3, 1.0, 2e-9],
+    ]
+
+    def write(self, file_name, rows):
+        with open(file_name, mode="w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(rows)
+
+    def testLookup(self):
+        with TemporaryDirectory() as directory:
+            file_name = path.join(directory, "propellants.csv")
+            self.write(file_name, self.rows)
+            propellants = Propellant.from_csv_file(file_name)
+            self.assertEqual(propellants[0].description, "nitroglycerin\tball")
+            self.assertIsNone(propellants[0].burn_rate_coefficient)
+
+            for library in (
+                PropellantLibrary.from_csv_file(file_name),
+                PropellantLibrary.from_csv_file(file_name),
+                PropellantLibrary.from_csv_file(file_name, use_cache=False),
+                PropellantLibrary.from_propellants(propellants),
+            ):
+                self.assertEqual(len(library), 4)
+                self.assertEqual(list(library), sorted(propellants, key=lambda propellant: propellant.name))
+                for propellant in propellants:
+                    self.assertIn(propellant.name, library)
+                    self.assertEqual(library[propellant.name], propellant)
+                self.assertNotIn("Ballistite", library)
+                self.assertIsNone(library.get("Ballistite"))
+                with self.assertRaises(KeyError):
+                    library["Ballistite"]
+
+                self.assertEqual(library.families, ("", "double base", "single base"))
+                self.assertEqual([p.name for p in library.get_family("double base")], ["НДТ-2", "НДТ-3"])
+                self.assertEqual(library.get_family("triple base"), ())
+                self.assertEqual(list(pickle.loads(pickle.dumps(library))), list(library))
+                library.close()
+
+    def testInvalidation(self):
+        with TemporaryDirectory() as directory:
+            file_name = path.join(directory, "propellants.csv")
+            self.write(file_name, self.rows)
+            library = PropellantLibrary.from_csv_file(file_name)
+            self.assertTrue(path.exists(f"{file_name}.cache"))
+            self.assertEqual(len(library), 4)
+            library.close()
+
+            self.write(file_name, self.rows[:2])
+            library = PropellantLibrary.from_csv_file(file_name)
+            self.assertEqual(library.names, ("НДТ-3",))
+            library.close()
@@ -0,0 +1,64 @@
+from minimalist_interior_ballistics import PeakFinder, Significance
+from tests.problem.test_problems import MultipleChargeProblem, SingleChargeProblem
+
+
+class TestPeakWithOneCharge(SingleChargeProblem):
+    def testPressureRate(self):
+        for y in (self.gun.to_travel().get_flat(i) for i in (0, 2, 5)):
+            dy = self.gun.compiled_dt(y)
+            h = 1e-7 * y[1] / y[2] if y[2] else 1e-9
+            p_plus = self.gun.flat_average_pressure([a + h * b for a, b in zip(y, dy)])
+            p_minus = self.gun.flat_average_pressure([a - h * b for a, b in zip(y, dy)])
+            self.assertAlmostEqual(self.gun.flat_pressure_rate(y, dy) * 2 * h / (p_plus - p_minus), 1, delta=1e-5)
+
+    def testPeakFinders(self):
+        reference = self.gun.to_travel(n_intg=300, acc=1e-9).get_state_by_marker(Significance.PEAK_PRESSURE)
+        states = self.gun.to_travel()
+        del states[states.index_of_marker(Significance.PEAK_PRESSURE)]
+
+        peaks = {
+            peak_finder: self.gun.mark_max_pressure(states.copy(), peak_finder=peak_finder).get_state_by_marker(
+                Significance.PEAK_PRESSURE
+            )
+            for peak_finder in PeakFinder
+        }
+        for peak in peaks.values():
+            self.assertAlmostEqual(peak.average_pressure / reference.average_pressure, 1, delta=1e-3)
+        self.assertLess(
+            abs(peaks[PeakFinder.ANALYTIC].time - reference.time),
+            abs(peaks[PeakFinder.GOLDEN_SECTION].time - reference.time),
+        )
+
+    def tearDown(self):
+        super().tearDown()
+
+
+class TestPeakWithMultipleCharges(MultipleChargeProblem):
+    def testPressureRate(self):
+        for y in (self.gun.to_travel().get_flat(i) for i in (0, 2, 5)):
+            dy = self.gun.compiled_dt(y)
+            h = 1e-7 * y[1] / y[2] if y[2] else 1e-9
+            p_plus = self.gun.flat_average_pressure([a + h * b for a, b in zip(y, dy)])
+            p_minus = self.gun.flat_average_pressure([a - h * b for a, b in zip(y, dy)])
+            self.assertAlmostEqual(self.gun.flat_pressure_rate(y, dy) * 2 * h / (p_plus - p_minus), 1, delta=1e-5)
+
+    def testPeakFinders(self):
+        reference = self.gun.to_travel(n_intg=300, acc=1e-9).get_state_by_marker(Significance.PEAK_PRESSURE)
+        states = self.gun.to_travel()
+        del states[states.index_of_marker(Significance.PEAK_PRESSURE)]
+
+        peaks = {
+            peak_finder: self.gun.mark_max_pressure(states.copy(), peak_finder=peak_finder).get_state_by_marker(
+                Significance.PEAK_PRESSURE
+            )
+            for peak_finder in PeakFinder
+        }
+        for peak in peaks.values():
+            self.assertAlmostEqual(peak.average_pressure / reference.average_pressure, 1, delta=1e-3)
+        self.assertLess(
+            abs(peaks[PeakFinder.ANALYTIC].time - reference.time),
+            abs(peaks[PeakFinder.GOLDEN_SECTION].time - reference.time),
+        )
+
+    def tearDown(self):
+        super().tearDown()
@@ -0,0 +1,71 @@
+from os import path
+from tempfile import TemporaryDirectory
+
+from attrs import evolve
+
+from minimalist_interior_ballistics.charge import Charge
+from minimalist_interior_ballistics.form_function import FormFunction
+from minimalist_interior_ballistics.gun import Gun, converter
+from tests.problem.test_problems import MultipleChargeProblem, SingleChargeProblem
+
+
+class TestSerializationWithOneCharge(SingleChargeProblem):
+    def testRoundTrip(self):
+        self.assertEqual(Gun.from_json(self.gun.to_json()), self.gun)
+        for charge in self.gun.charges:
+            self.assertEqual(converter.structure(converter.unstructure(charge), Charge), charge)
+            self.assertEqual(
+                converter.structure(converter.unstructure(charge.form_function), FormFunction), charge.form_function
+            )
+
+            # the family of the propellant is only written when given, and is not compared.
+            self.assertNotIn("family", converter.unstructure(charge))
+            labelled = evolve(charge, family="test")
+            self.assertEqual(converter.structure(converter.unstructure(labelled), Charge).family, "test")
+            self.assertEqual(labelled, charge)
+
+    def testCatalog(self):
+        guns = [
+            evolve(self.gun, name=f"{self.gun.name} {i}", chamber_volume=self.gun.chamber_volume * (1 + 0.1 * i))
+            for i in range(5)
+        ]
+        with TemporaryDirectory() as directory:
+            Gun.to_file(guns, path.join(directory, "catalog.json"))
+            self.assertEqual(Gun.from_file(path.join(directory, "catalog.json")), tuple(guns))
+
+            Gun.to_jsonl(iter(guns), path.join(directory, "catalog.jsonl"))
+            self.assertEqual(list(Gun.iter_jsonl(path.join(directory, "catalog.jsonl"))), guns)
+
+    def tearDown(self):
+        super().tearDown()
+
+
+class TestSerializationWithMultipleCharges(MultipleChargeProblem):
+    def testRoundTrip(self):
+        self.assertEqual(Gun.from_json(self.gun.to_json()), self.gun)
+        for charge in self.gun.charges:
+            self.assertEqual(converter.structure(converter.unstructure(charge), Charge), charge)
+            self.assertEqual(
+                converter.structure(converter.unstructure(charge.form_function), FormFunction), charge.form_function
+            )
+
+            # the family of the propellant is only written when given, and is not compared.
+            self.assertNotIn("family", converter.unstructure(charge))
+            labelled = evolve(charge, family="test")
+            self.assertEqual(converter.structure(converter.unstructure(labelled), Charge).family, "test")
+            self.assertEqual(labelled, charge)
+
+    def testCatalog(self):
+        guns = [
+            evolve(self.gun, name=f"{self.gun.name} {i}", chamber_volume=self.gun.chamber_volume * (1 + 0.1 * i))
+            for i in range(5)
+        ]
+        with TemporaryDirectory() as directory:
+            Gun.to_file(guns, path.join(directory, "catalog.json"))
+            self.assertEqual(Gun.from_file(path.join(directory, "catalog.json")), tuple(guns))
+
+            Gun.to_jsonl(iter(guns), path.join(directory, "catalog.jsonl"))
+            self.assertEqual(list(Gun.iter_jsonl(path.join(directory, "catalog.jsonl"))), guns)
+
+    def tearDown(self):
+        super().tearDown()
@@ -0,0 +1,33 @@
+from minimalist_interior_ballistics import Significance
+from tests.problem.test_problems import MultipleChargeProblem, SingleChargeProblem
+
+
+class TestStartWithOneCharge(SingleChargeProblem):
+    def testStartByQuadrature(self):
+        ys, y_start = self.gun.flat_to_start_by_quadrature()
+        _, y_ref = self.gun.flat_to_start_by_integration(n_intg=300, acc=1e-9)
+
+        self.assertEqual(len(ys), 1)
+        self.assertAlmostEqual(y_start[0] / y_ref[0], 1, delta=1e-4)
+        self.assertAlmostEqual(y_start[3] / y_ref[3], 1, delta=1e-6)
+        self.assertAlmostEqual(self.gun.flat_average_pressure(y_start) / self.gun.start_pressure, 1, delta=1e-6)
+        self.assertEqual([state.marker for state in self.gun.to_start()], [Significance.IGNITION, Significance.START])
+
+    def tearDown(self):
+        super().tearDown()
+
+
+class TestStartWithMultipleCharges(MultipleChargeProblem):
+    def testStartByQuadrature(self):
+        ys, y_start = self.gun.flat_to_start_by_quadrature()
+        _, y_ref = self.gun.flat_to_start_by_integration(n_intg=300, acc=1e-9)
+
+        self.assertEqual(len(ys), 1)
+        self.assertAlmostEqual(y_start[0] / y_ref[0], 1, delta=1e-4)
+        for Z, Z_ref in zip(y_start[3:], y_ref[3:]):
+            self.assertAlmostEqual(Z / Z_ref, 1, delta=1e-6)
+        self.assertAlmostEqual(self.gun.flat_average_pressure(y_start) / self.gun.start_pressure, 1, delta=1e-6)
+        self.assertEqual([state.marker for state in self.gun.to_start()], [Significance.IGNITION, Significance.START])
+
+    def tearDown(self):
+        super().tearDown()
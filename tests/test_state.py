@@ -0,0 +1,122 @@
+import gc
+import tracemalloc
+from bisect import insort
+
+from minimalist_interior_ballistics import Significance
+from minimalist_interior_ballistics.state import CompactState, CompactStateList, StateList
+from tests import logger
+from tests.problem.test_problems import SingleChargeProblem
+
+
+class TestStateList(SingleChargeProblem):
+    def setUp(self):
+        super().setUp()
+        self.states = self.gun.to_travel()
+
+    def testColumns(self):
+        states = self.states
+        self.assertEqual(states.times, tuple(s.time for s in states))
+        self.assertEqual(states.travels, tuple(s.travel for s in states))
+        self.assertEqual(states.velocities, tuple(s.velocity for s in states))
+        self.assertEqual(states.burnup_fractions, tuple(s.burnup_fractions for s in states))
+        self.assertEqual(states.markers, tuple(s.marker for s in states))
+        for pressures, attribute in (
+            (states.average_pressures, "average_pressure"),
+            (states.shot_pressures, "shot_pressure"),
+            (states.breech_pressures, "breech_pressure"),
+        ):
+            for pressure, state in zip(pressures, states):
+                self.assertAlmostEqual(pressure / getattr(state, attribute), 1, delta=1e-12)
+
+    def testListInterface(self):
+        states = StateList(self.states)
+        self.assertEqual(states, self.states)
+        self.assertEqual(states.index_of_marker(Significance.MUZZLE), len(states) - 1)
+
+        peak_state = states.get_state_by_marker(Significance.PEAK_PRESSURE)
+        del states[states.index(peak_state)]
+        self.assertFalse(states.has_state_with_marker(Significance.PEAK_PRESSURE))
+        insort(states, peak_state)
+        self.assertEqual(states, self.states)
+        self.assertIs(states.get_state_by_marker("max pressure"), peak_state)
+
+        head = states[:3]
+        self.assertIsInstance(head, StateList)
+        self.assertEqual(list(head), list(self.states)[:3])
+        self.assertTrue(head.has_state_with_marker(Significance.START))
+
+        states[0] = states[-1]
+        self.assertEqual(states.index_of_marker(Significance.MUZZLE), 0)
+        self.assertFalse(states.has_state_with_marker(Significance.START))
+        self.assertEqual(self.states.tabulate(), StateList(self.states).tabulate())
+
+    def testUserListInterface(self):
+        states = StateList(self.states)
+        self.assertEqual(states.data, list(self.states))
+        states.data = reversed(self.states.data)
+        self.assertEqual(states.index_of_marker(Significance.START), len(states) - 1)
+        self.assertGreater(states, self.states)
+        self.assertLessEqual(self.states, states)
+
+        states.sort()
+        self.assertEqual(states, self.states)
+        states.sort(key=lambda state: state.time, reverse=True)
+        self.assertEqual(states.times, tuple(sorted(self.states.times, reverse=True)))
+        self.assertEqual(states.index_of_marker(Significance.MUZZLE), 0)
+
+        self.assertEqual((self.states * 2).data, self.states.data * 2)
+        self.assertEqual(2 * self.states, self.states + self.states)
+        self.assertEqual(list(self.states) + self.states, self.states * 2)
+        states *= 0
+        self.assertEqual(len(states), 0)
+
+    def testCompactState(self):
+        compact_states = self.states.compact()
+        self.assertEqual(len(compact_states), len(self.states))
+        for i, (state, compact_state) in enumerate(zip(self.states, compact_states)):
+            self.assertEqual(compact_state.get_flat(), CompactState.from_state(state).get_flat())
+            self.assertEqual(compact_states.get_flat(i), self.states.get_flat(i))
+            self.assertEqual(compact_state.to_state(), state)
+            self.assertEqual(compact_state.burnup_fractions, state.burnup_fractions)
+            self.assertEqual(compact_state.marker, state.marker)
+            self.assertEqual(compact_state.is_started, state.is_started)
+            for a, b in (
+                (compact_state.average_pressure, state.average_pressure),
+                (compact_state.shot_pressure, state.shot_pressure),
+                (compact_state.breech_pressure, state.breech_pressure),
+            ):
+                self.assertAlmostEqual(a / b, 1, delta=1e-12)
+
+        self.assertEqual(compact_states.to_state_list(), self.states)
+        self.assertEqual(list(compact_states[::-2]), list(compact_states)[::-2])
+        self.assertEqual(compact_states[-1], compact_states[len(self.states) - 1])
+
+    def testCompactStateMemory(self):
+        ys = [self.states.get_flat(i) for i in range(len(self.states))] * 100
+        markers = self.states.markers * 100
+
+        def keep_states() -> list:
+            states = [self.gun.get_state(list(y), marker=marker) for y, marker in zip(ys, markers)]
+            for state in states:
+                state.average_pressure, state.shot_pressure, state.breech_pressure
+            return states
+
+        def keep_compact_states() -> CompactStateList:
+            return StateList.from_flat(self.gun, ys, markers).compact()
+
+        def measure(keep) -> float:
+            gc.collect()
+            tracemalloc.start()
+            kept = keep()
+            gc.collect()
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return size / len(kept)
+
+        state_size = measure(keep_states)
+        compact_size = measure(keep_compact_states)
+        logger.info(f"bytes per state: {state_size:.0f} for State, {compact_size:.0f} for CompactStateList")
+        self.assertLess(compact_size, state_size / 6)
+
+    def tearDown(self):
+        super().tearDown()
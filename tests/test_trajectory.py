@@ -0,0 +1,187 @@
+from itertools import islice
+
+from minimalist_interior_ballistics import Integrator, Significance
+from minimalist_interior_ballistics.state import StateList
+from tests.problem.test_problems import MultipleChargeProblem, SingleChargeProblem
+
+
+class TestTrajectoryWithOneCharge(SingleChargeProblem):
+    def testAgainstStateList(self):
+        for integrator in Integrator:
+            self.assertEqual(
+                StateList(self.gun.iter_trajectory(integrator=integrator)), self.gun.to_travel(integrator=integrator)
+            )
+            self.assertEqual(
+                StateList(self.gun.iter_trajectory(until=Significance.BURNOUT, integrator=integrator)),
+                self.gun.to_burnout(integrator=integrator),
+            )
+
+    def testStop(self):
+        for integrator in Integrator:
+            limit = 0.9 * self.gun.to_travel(integrator=integrator).peak_average_pressure
+            states = list(
+                self.gun.iter_trajectory(stop=lambda state: state.average_pressure > limit, integrator=integrator)
+            )
+
+            self.assertEqual(states[0].marker, Significance.START)
+            self.assertTrue(all(state.average_pressure <= limit for state in states))
+            self.assertNotIn(Significance.MUZZLE, [state.marker for state in states])
+            # stopped while the pressure rises, the peak is not reached.
+            self.assertNotIn(Significance.PEAK_PRESSURE, [state.marker for state in states])
+
+            # stopped past the peak but before burnout, no later state exceeds the peak.
+            reference = self.gun.to_burnout(integrator=integrator)
+            peak_time = reference.get_state_by_marker(Significance.PEAK_PRESSURE).time
+            stop_time = 0.5 * (peak_time + reference.get_state_by_marker(Significance.BURNOUT).time)
+            states = StateList(
+                self.gun.iter_trajectory(stop=lambda state: state.time > stop_time, integrator=integrator)
+            )
+            peak_index = states.index_of_marker(Significance.PEAK_PRESSURE)
+            self.assertLess(peak_index, len(states) - 1)
+            self.assertEqual(max(states.average_pressures), states.average_pressures[peak_index])
+
+            # the first state already stops the trajectory.
+            self.assertEqual(list(self.gun.iter_trajectory(stop=lambda state: True, integrator=integrator)), [])
+
+    def testKeep(self):
+        for integrator in Integrator:
+            states = list(
+                self.gun.iter_trajectory(keep=lambda state: state.marker != Significance.STEP, integrator=integrator)
+            )
+            self.assertEqual(
+                [state.marker for state in states],
+                [Significance.START, Significance.PEAK_PRESSURE, Significance.BURNOUT, Significance.MUZZLE],
+            )
+            self.assertEqual(len(list(islice(self.gun.iter_trajectory(integrator=integrator), 3))), 3)
+
+    def testToVelocity(self):
+        for integrator in Integrator:
+            burnout_velocity = self.gun.to_burnout(integrator=integrator).burnout_velocity
+            for velocity in (0.5 * burnout_velocity, 1.2 * burnout_velocity):
+                states = self.gun.to_velocity(velocity, integrator=integrator)
+                self.assertEqual(states[-1].marker, Significance.MUZZLE)
+                self.assertAlmostEqual(states.muzzle_velocity, velocity, delta=1e-9 * velocity)
+                self.assertEqual(states.has_state_with_marker(Significance.BURNOUT), velocity > burnout_velocity)
+                reference = self.gun.to_travel(travel=states.travel, n_intg=100, acc=1e-6)
+                self.assertAlmostEqual(reference.muzzle_velocity / velocity, 1, delta=1e-3)
+
+            with self.assertRaises(ValueError):
+                self.gun.to_velocity(self.gun.asymptotic_velocity, integrator=integrator)
+
+    def testAdiabat(self):
+        for integrator in Integrator:
+            states = self.gun.to_travel(n_adiabat=4, integrator=integrator)
+            self.assertEqual(
+                [state.marker for state in states if state.marker != Significance.STEP][-6:],
+                [Significance.BURNOUT, *(Significance.ADIABAT for _ in range(4)), Significance.MUZZLE],
+            )
+            burnout_travel = states.burnout_point
+            for i, state in enumerate(states[-5:], start=1):
+                self.assertAlmostEqual(
+                    state.travel, burnout_travel + (self.travel - burnout_travel) * i / 5, delta=1e-9
+                )
+                reference = self.gun.to_travel(travel=state.travel, n_intg=100, acc=1e-6)[-1]
+                self.assertAlmostEqual(state.time / reference.time, 1, delta=1e-3)
+                self.assertAlmostEqual(state.velocity / reference.velocity, 1, delta=1e-3)
+                self.assertAlmostEqual(state.average_pressure / reference.average_pressure, 1, delta=1e-3)
+
+            self.assertEqual(
+                self.gun.to_travel(travel=10 * self.travel, n_adiabat=0, integrator=integrator)[-2].marker,
+                Significance.BURNOUT,
+            )
+
+    def testUntil(self):
+        with self.assertRaises(ValueError):
+            next(self.gun.iter_trajectory(until=Significance.PEAK_PRESSURE))
+
+    def tearDown(self):
+        super().tearDown()
+
+
+class TestTrajectoryWithMultipleCharges(MultipleChargeProblem):
+    def testAgainstStateList(self):
+        for integrator in (Integrator.RK4, Integrator.DOPRI5):
+            self.assertEqual(
+                StateList(self.gun.iter_trajectory(integrator=integrator)), self.gun.to_travel(integrator=integrator)
+            )
+            self.assertEqual(
+                StateList(self.gun.iter_trajectory(until=Significance.BURNOUT, integrator=integrator)),
+                self.gun.to_burnout(integrator=integrator),
+            )
+
+    def testStop(self):
+        for integrator in (Integrator.RK4, Integrator.DOPRI5):
+            limit = 0.9 * self.gun.to_travel(integrator=integrator).peak_average_pressure
+            states = list(
+                self.gun.iter_trajectory(stop=lambda state: state.average_pressure > limit, integrator=integrator)
+            )
+
+            self.assertEqual(states[0].marker, Significance.START)
+            self.assertTrue(all(state.average_pressure <= limit for state in states))
+            self.assertNotIn(Significance.MUZZLE, [state.marker for state in states])
+            # stopped while the pressure rises, the peak is not reached.
+            self.assertNotIn(Significance.PEAK_PRESSURE, [state.marker for state in states])
+
+            # stopped past the peak but before burnout, no later state exceeds the peak.
+            reference = self.gun.to_burnout(integrator=integrator)
+            peak_time = reference.get_state_by_marker(Significance.PEAK_PRESSURE).time
+            stop_time = 0.5 * (peak_time + reference.get_state_by_marker(Significance.BURNOUT).time)
+            states = StateList(
+                self.gun.iter_trajectory(stop=lambda state: state.time > stop_time, integrator=integrator)
+            )
+            peak_index = states.index_of_marker(Significance.PEAK_PRESSURE)
+            self.assertLess(peak_index, len(states) - 1)
+            self.assertEqual(max(states.average_pressures), states.average_pressures[peak_index])
+
+            # the first state already stops the trajectory.
+            self.assertEqual(list(self.gun.iter_trajectory(stop=lambda state: True, integrator=integrator)), [])
+
+    def testKeep(self):
+        for integrator in (Integrator.RK4, Integrator.DOPRI5):
+            states = list(
+                self.gun.iter_trajectory(keep=lambda state: state.marker != Significance.STEP, integrator=integrator)
+            )
+            self.assertEqual(
+                [state.marker for state in states],
+                [Significance.START, Significance.PEAK_PRESSURE, Significance.BURNOUT, Significance.MUZZLE],
+            )
+            self.assertEqual(len(list(islice(self.gun.iter_trajectory(integrator=integrator), 3))), 3)
+
+    def testToVelocity(self):
+        for integrator in (Integrator.RK4, Integrator.DOPRI5):
+            burnout_velocity = self.gun.to_burnout(integrator=integrator).burnout_velocity
+            for velocity in (0.5 * burnout_velocity, 1.2 * burnout_velocity):
+                states = self.gun.to_velocity(velocity, integrator=integrator)
+                self.assertEqual(states[-1].marker, Significance.MUZZLE)
+                self.assertAlmostEqual(states.muzzle_velocity, velocity, delta=1e-9 * velocity)
+                self.assertEqual(states.has_state_with_marker(Significance.BURNOUT), velocity > burnout_velocity)
+                reference = self.gun.to_travel(travel=states.travel, n_intg=100, acc=1e-6)
+                self.assertAlmostEqual(reference.muzzle_velocity / velocity, 1, delta=1e-3)
+
+            with self.assertRaises(ValueError):
+                self.gun.to_velocity(self.gun.asymptotic_velocity, integrator=integrator)
+
+    def testAdiabat(self):
+        for integrator in (Integrator.RK4, Integrator.DOPRI5):
+            states = self.gun.to_travel(n_adiabat=4, integrator=integrator)
+            self.assertEqual(
+                [state.marker for state in states if state.marker != Significance.STEP][-6:],
+                [Significance.BURNOUT, *(Significance.ADIABAT for _ in range(4)), Significance.MUZZLE],
+            )
+            burnout_travel = states.burnout_point
+            for i, state in enumerate(states[-5:], start=1):
+                self.assertAlmostEqual(
+                    state.travel, burnout_travel + (self.travel - burnout_travel) * i / 5, delta=1e-9
+                )
+                reference = self.gun.to_travel(travel=state.travel, n_intg=100, acc=1e-6)[-1]
+                self.assertAlmostEqual(state.time / reference.time, 1, delta=1e-3)
+                self.assertAlmostEqual(state.velocity / reference.velocity, 1, delta=1e-3)
+                self.assertAlmostEqual(state.average_pressure / reference.average_pressure, 1, delta=1e-3)
+
+            self.assertEqual(
+                self.gun.to_travel(travel=10 * self.travel, n_adiabat=0, integrator=integrator)[-2].marker,
+                Significance.BURNOUT,
+            )
+
+    def tearDown(self):
+        super().tearDown()